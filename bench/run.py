@@ -0,0 +1,132 @@
+"""
+Pipeline benchmark over real and synthetic grammars.
+
+Every grammar is converted in a fresh interpreter, once to warm up the
+prediction DFA and then --runs times. The median of each stage time is
+reported with the throughput and the peak memory of the process.
+
+Synthetic grammars come from antlr2xsd.synthetic with its default shape.
+
+usage: python bench/run.py [--runs N] [--sizes N ...] [--seed N]
+           [--output JSON] [--compare JSON]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+TEST_DIR = os.path.join(ROOT_DIR, 'test')
+
+STAGES = ['lex', 'parse', 'walk', 'serialize']
+
+LISTENER_OPTS = {'tns': 'urn:bench', 'root_name': 'root', 'root_type': 'r0'}
+
+
+def run_child(g4_path, runs):
+    """
+    Convert g4_path in this process and print the stats as JSON
+    """
+    from antlr2xsd import g4_parser
+    from antlr2xsd.stats import Stats
+
+    g4_parser.serialize(g4_parser.parse(g4_path, LISTENER_OPTS))
+    results = []
+    for _ in range(runs):
+        stats = Stats()
+        g4_parser.serialize(g4_parser.parse(g4_path, LISTENER_OPTS, stats=stats), stats=stats)
+        results.append(stats)
+    print(json.dumps(results))
+
+
+def python(args, **kwargs):
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT_DIR, 'src'))
+    return subprocess.run(
+        [sys.executable] + args, env=env, check=True, universal_newlines=True, **kwargs)
+
+
+def measure(g4_path, runs) -> dict:
+    out = python(
+        [os.path.realpath(__file__), '--child', g4_path, '--runs', str(runs)],
+        stdout=subprocess.PIPE).stdout
+    runs = json.loads(out)
+    result = {
+        stage + '_time': statistics.median(stats[stage + '_time'] for stats in runs)
+        for stage in STAGES}
+    total = sum(result.values())
+    last = runs[-1]
+    result.update(
+        total_time=total,
+        rules=last['rules'],
+        tokens=last['tokens'],
+        rules_per_s=last['rules'] / total,
+        tokens_per_s=last['tokens'] / total,
+        peak_memory=last.get('peak_memory'))
+    return result
+
+
+def grammars(sizes, seed, tmp_dir):
+    yield 'Hello', os.path.join(TEST_DIR, 'g4', 'Hello.g4')
+    yield 'Modelica', os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+    for n_rules in sizes:
+        g4_path = os.path.join(tmp_dir, 'Synthetic{:d}.g4'.format(n_rules))
+        python([
+            '-m', 'antlr2xsd.synthetic', str(n_rules), '--seed', str(seed), '-o', g4_path])
+        yield 'synthetic-{:d}'.format(n_rules), g4_path
+
+
+def report(results, baseline=None):
+    print('{:18s} {:>10s} {:>10s} {:>12s} {:>12s} {:>10s}{:s}'.format(
+        'grammar', 'rules', 'total ms', 'rules/s', 'tokens/s', 'peak MB',
+        '  vs baseline' if baseline else ''))
+    for name, r in results.items():
+        line = '{:18s} {:10d} {:10.1f} {:12.0f} {:12.0f} {:10.1f}'.format(
+            name, r['rules'], 1000 * r['total_time'], r['rules_per_s'],
+            r['tokens_per_s'], (r['peak_memory'] or 0) / 2**20)
+        if baseline and name in baseline:
+            line += '  {:10.2f}x'.format(baseline[name]['total_time'] / r['total_time'])
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument(
+        '--sizes', type=int, nargs='*', default=[1000, 10000, 100000],
+        help='rule counts of the synthetic grammars')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the synthetic grammars')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of a previous run to compare with')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.child, args.runs)
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, g4_path in grammars(args.sizes, args.seed, tmp_dir):
+            results[name] = measure(g4_path, args.runs)
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)['results']
+    report(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'runs': args.runs,
+                'seed': args.seed,
+                'results': results,
+            }, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
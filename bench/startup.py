@@ -0,0 +1,59 @@
+"""
+Startup time benchmark, each statement runs in a fresh interpreter.
+
+usage: python bench/startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+TEST_DIR = os.path.join(ROOT_DIR, 'test')
+
+STATEMENTS = [
+    ('import antlr2xsd', 'import antlr2xsd'),
+    ('import g4_parser', 'import antlr2xsd.g4_parser'),
+    ('cli --help', 'import antlr2xsd.cli, contextlib, io\n'
+                   'with contextlib.redirect_stdout(io.StringIO()):\n'
+                   '    try:\n'
+                   '        antlr2xsd.cli.main(["--help"])\n'
+                   '    except SystemExit:\n'
+                   '        pass'),
+    ('first parse Hello.g4', 'import antlr2xsd.g4_parser, contextlib, io\n'
+                             'with contextlib.redirect_stdout(io.StringIO()):\n'
+                             '    antlr2xsd.g4_parser.parse({!r}, {{\n'
+                             '        "tns": "urn:hello", "root_name": "hello",\n'
+                             '        "root_type": "stored_definition"}})'.format(
+                                 os.path.join(TEST_DIR, 'g4', 'Hello.g4'))),
+]
+
+TIMER = '''import time
+_t = time.perf_counter()
+{:s}
+print(time.perf_counter() - _t)
+'''
+
+
+def measure(stmt, runs):
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT_DIR, 'src'))
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', TIMER.format(stmt)], env=env,
+            stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        times.append(float(out.split()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=11)
+    args = parser.parse_args()
+    for name, stmt in STATEMENTS:
+        print('{:24s} {:8.1f} ms'.format(name, 1000 * measure(stmt, args.runs)))
+
+
+if __name__ == '__main__':
+    main()
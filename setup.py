@@ -34,11 +34,10 @@ ROOT_DIR = os.path.dirname(os.path.realpath(__file__))
 # pylint: disable=no-init, too-few-public-methods
 
 
-PYTHON_VERSION = '.'.join([str(i) for i in sys.version_info[:3]])
-PYTHON_VERSION_REQUIRED = '3.5.0'
-if PYTHON_VERSION < PYTHON_VERSION_REQUIRED:
+PYTHON_VERSION_REQUIRED = (3, 7)
+if sys.version_info[:2] < PYTHON_VERSION_REQUIRED:
     sys.exit("Sorry, only Python >= {:s} is supported".format(
-        PYTHON_VERSION_REQUIRED))
+        '.'.join([str(i) for i in PYTHON_VERSION_REQUIRED])))
 
 
 class AntlrBuildCommand(Command):
@@ -101,10 +100,13 @@ def setup_package():
         install_requires=install_reqs,
         tests_require=['coverage >= 3.7.1', 'nose >= 1.3.1'],
         test_suite='nose.collector',
-        python_requires='>=3.5',
+        python_requires='>=3.7',
         packages=find_packages("src"),
         package_dir={"": "src"},
         include_package_data=True,
+        entry_points={
+            'console_scripts': ['antlr2xsd = antlr2xsd.cli:main'],
+        },
         cmdclass=cmdclass_
     )
 
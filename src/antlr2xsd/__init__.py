@@ -1 +1,18 @@
-from . import g4_parser
\ No newline at end of file
+"""
+Converts ANTLR g4 grammar files into xml XSD schemas.
+
+Submodules are imported on first access, so importing the package does not
+load lxml, the ANTLR runtime or the generated ANTLRv4 parser.
+"""
+import importlib
+
+_submodules = (
+    'aio', 'batch', 'cache', 'cli', 'daemon', 'dfa', 'g4_parser', 'graph', 'passes',
+    'profiling', 'stats', 'streams', 'synthetic', 'walker',
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
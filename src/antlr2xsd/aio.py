@@ -0,0 +1,74 @@
+"""
+Asyncio API, converts grammars without blocking the event loop.
+"""
+import asyncio
+import json
+
+from . import g4_parser
+from .cache import grammar_key
+
+
+def _convert_bytes(data, listener_opts, cache_dir=None) -> bytes:
+    return g4_parser.serialize(g4_parser.Converter(listener_opts, cache_dir).parse_bytes(data))
+
+
+def _read(g4_path) -> bytes:
+    with open(g4_path, 'rb') as f:
+        return f.read()
+
+
+class _Job:
+
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+
+class AsyncConverter:
+    """
+    Converts grammars to serialized XSD in an executor
+
+    executor is a ThreadPoolExecutor or ProcessPoolExecutor, or None for
+    the default executor of the event loop. Concurrent requests for the same
+    grammar and listener_opts share one conversion. A request that times
+    out or is cancelled stops waiting, the conversion itself is only
+    cancelled if no other request waits for it and it has not started yet.
+    """
+
+    def __init__(self, executor=None, timeout=None, cache_dir=None):
+        self.executor = executor
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.inflight = {}
+
+    async def convert_bytes(self, data, listener_opts, timeout=None) -> bytes:
+        """
+        Convert utf-8 grammar source, timeout in seconds overrides the
+        timeout of the converter and raises asyncio.TimeoutError
+        """
+        key = (grammar_key(data), json.dumps(listener_opts, sort_keys=True))
+        job = self.inflight.get(key)
+        if job is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self.executor, _convert_bytes, data, listener_opts, self.cache_dir)
+            job = self.inflight[key] = _Job(future)
+            future.add_done_callback(lambda _: self._done(key, job))
+        job.waiters += 1
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(job.future), self.timeout if timeout is None else timeout)
+        finally:
+            job.waiters -= 1
+            if job.waiters == 0 and not job.future.done():
+                job.future.cancel()
+
+    async def convert_file(self, g4_path, listener_opts, timeout=None) -> bytes:
+        """
+        Convert a g4 file, see convert_bytes
+        """
+        data = await asyncio.get_running_loop().run_in_executor(None, _read, g4_path)
+        return await self.convert_bytes(data, listener_opts, timeout)
+
+    def _done(self, key, job):
+        if self.inflight.get(key) is job:
+            del self.inflight[key]
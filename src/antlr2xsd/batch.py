@@ -0,0 +1,58 @@
+"""
+Converts many g4 grammar files in a pool of worker processes.
+"""
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from . import g4_parser
+from .stats import Stats
+
+#: outcome of one job, xsd is the serialized schema or None if error is set,
+#: stats the Stats of the conversion if they were asked for
+Result = namedtuple('Result', ['g4_path', 'xsd', 'error', 'stats'], defaults=[None])
+
+
+def _init_worker(dfa_path=None):
+    if dfa_path is not None:
+        from . import dfa
+        dfa.load(dfa_path)
+
+
+def _convert_job(g4_path, listener_opts, cache_dir=None, stats=False) -> Result:
+    try:
+        stats = Stats() if stats else None
+        xsd = g4_parser.Converter(listener_opts, cache_dir).parse_file(g4_path, stats=stats)
+        return Result(g4_path, g4_parser.serialize(xsd, stats), None, stats)
+    except Exception:  # keep the other jobs going
+        return Result(g4_path, None, traceback.format_exc())
+
+
+def convert_all(jobs, max_workers=None, cache_dir=None, dfa_path=None, stats=False):
+    """
+    Convert a list of (g4_path, listener_opts) jobs
+
+    Returns a list of Result in the order of the jobs. A failing job sets
+    the error of its result and does not affect the others. With
+    max_workers=1 the jobs run in this process. A DFA snapshot saved with
+    antlr2xsd.dfa is preloaded by every worker if dfa_path is given. With
+    stats=True each result has the Stats of its conversion, except
+    peak_memory which is that of the worker process so far, see stats.
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) < 2:
+        _init_worker(dfa_path)
+        return [_convert_job(g4_path, opts, cache_dir, stats) for g4_path, opts in jobs]
+
+    with ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(dfa_path,)) as pool:
+        futures = [
+            pool.submit(_convert_job, g4_path, opts, cache_dir, stats)
+            for g4_path, opts in jobs]
+        results = []
+        for (g4_path, _), future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception:  # worker died, e.g. BrokenProcessPool
+                results.append(Result(g4_path, None, traceback.format_exc()))
+        return results
@@ -0,0 +1,174 @@
+"""
+Caches of converted grammars, on disk and in memory.
+
+Entries are keyed by a hash of the grammar contents, the tool sources and
+the runtime version and hold the options independent rule types of the grammar and
+its rule graph, {'types': [...], 'graph': {...}}.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+#: bump when the layout of a cache entry changes
+FORMAT_VERSION = 2
+
+
+def _runtime_version():
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return 'unknown'
+    try:
+        return version('antlr4-python3-runtime')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def _tool_version():
+    # a hash of the sources, the git describe of versioneer is too slow
+    # to run in every process
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+    for sub_dir in ('', 'generated'):
+        source_dir = os.path.join(package_dir, sub_dir)
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            if name.endswith('.py'):
+                h.update(os.path.join(sub_dir, name).encode('utf-8') + b'\0')
+                with open(os.path.join(source_dir, name), 'rb') as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+_salt = None
+
+
+def grammar_key(data) -> str:
+    """
+    Hash of the grammar bytes, or text, the tool sources and the runtime version
+    """
+    global _salt
+    if _salt is None:
+        _salt = '{:d}\0{:s}\0{:s}\0'.format(
+            FORMAT_VERSION, _tool_version(), _runtime_version()).encode('utf-8')
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    h = hashlib.sha256(_salt)
+    h.update(data)
+    return h.hexdigest()
+
+
+class GrammarCache:
+    """
+    Content addressed cache directory with size bounded LRU eviction.
+
+    Recency is tracked with the modification time of the entry files,
+    which is refreshed on every hit.
+    """
+
+    suffix = '.json'
+
+    def __init__(self, cache_dir, max_size=64 * 2**20):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, data) -> str:
+        return grammar_key(data)
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def get(self, key):
+        """
+        Return the cached entry for key, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key, entry):
+        """
+        Store entry for key and evict least recently used entries
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits max_size
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+class MemoryCache:
+    """
+    In-memory LRU cache of the most recent entries, optionally in front of
+    a GrammarCache
+    """
+
+    def __init__(self, max_entries=256, backing=None):
+        self.max_entries = max_entries
+        self.backing = backing  # type: GrammarCache
+        self.entries = OrderedDict()
+
+    def key(self, data) -> str:
+        return grammar_key(data)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        if self.backing is not None:
+            entry = self.backing.get(key)
+            if entry is not None:
+                self._add(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        self._add(key, entry)
+        if self.backing is not None:
+            self.backing.put(key, entry)
+
+    def _add(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
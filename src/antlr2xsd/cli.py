@@ -0,0 +1,212 @@
+"""
+Command line interface, converts g4 grammar files to xsd files.
+
+    antlr2xsd [options] G4 [G4 ...]
+    antlr2xsd serve [options]
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def non_negative_int(value) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError('{!r} is negative'.format(value))
+    return n
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='antlr2xsd', description='Converts ANTLR g4 grammars to XSD schemas.')
+    parser.add_argument('grammars', nargs='+', metavar='G4', help='g4 grammar files')
+    parser.add_argument('--tns', required=True, help='target namespace')
+    parser.add_argument('--root-name', required=True, help='name of the root element')
+    parser.add_argument('--root-type', required=True, help='type of the root element')
+    parser.add_argument(
+        '-j', '--jobs', type=non_negative_int, default=1,
+        help='number of worker processes, 0 for one per cpu')
+    parser.add_argument(
+        '--dfa', metavar='SNAPSHOT',
+        help='preload a DFA snapshot saved with python -m antlr2xsd.dfa')
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help='convert with a running antlr2xsd serve daemon, if there is one')
+    parser.add_argument('--socket', help='socket of the daemon')
+    parser.add_argument(
+        '--normalize', action='store_true',
+        help='flatten nested sequences and choices and drop redundant ones')
+    parser.add_argument(
+        '--prune', action='store_true',
+        help='leave out the types that are unreachable from the root type')
+    parser.add_argument(
+        '--list-pruned', action='store_true',
+        help='with --prune, print the types left out of each schema')
+    parser.add_argument(
+        '--dedupe', action='store_true',
+        help='merge structurally identical types into one shared type')
+    parser.add_argument(
+        '--groups', type=int, nargs='?', const=3, metavar='MIN_LENGTH',
+        help='move runs of at least MIN_LENGTH particles, 3 by default, that repeat '
+             'in the content models to shared xs:group definitions')
+    parser.add_argument(
+        '-o', '--output-dir',
+        help='directory to write the xsd files to, next to the grammars by default')
+    parser.add_argument('--cache-dir', help='on-disk cache of converted grammars')
+    parser.add_argument(
+        '--stats', metavar='JSON',
+        help='write the stage timings and counters of each grammar to this file, '
+             'peak_memory is that of the worker process so far')
+    parser.add_argument(
+        '--profile', metavar='PREFIX',
+        help='profile the conversion in this process, writes PREFIX.pstats and the '
+             'collapsed stacks PREFIX.folded')
+    return parser
+
+
+def get_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='antlr2xsd serve', description='Runs the conversion daemon.')
+    parser.add_argument('--socket', help='socket to listen on')
+    parser.add_argument('--cache-dir', help='on-disk grammar cache behind the memory cache')
+    parser.add_argument(
+        '--dfa', metavar='SNAPSHOT',
+        help='preload a DFA snapshot saved with python -m antlr2xsd.dfa')
+    return parser
+
+
+def serve(argv):
+    args = get_serve_parser().parse_args(argv)
+    from . import daemon
+    daemon.serve(args.socket, args.cache_dir, args.dfa)
+    return 0
+
+
+def convert_daemon(jobs, socket_path):
+    """
+    Convert with the daemon, returns None if it is not running
+    """
+    from . import daemon
+    if not daemon.is_running(socket_path):
+        return None
+    client = daemon.Client(socket_path)
+    results = []
+    for g4_path, listener_opts in jobs:
+        try:
+            results.append((g4_path, client.convert(listener_opts, g4_path), None, None))
+        except (RuntimeError, OSError) as e:
+            results.append((g4_path, None, str(e), None))
+    return results
+
+
+def output_path(g4_path, output_dir=None):
+    path = os.path.splitext(g4_path)[0] + '.xsd'
+    if output_dir is None:
+        return path
+    return os.path.join(output_dir, os.path.basename(path))
+
+
+def write_if_changed(path, data) -> bool:
+    """
+    Write data to path unless it already has that content, so that the
+    file keeps its modification time for build tools, returns True if
+    written
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def get_listener_opts(args) -> dict:
+    """
+    listener_opts of the parsed command line arguments
+    """
+    listener_opts = {
+        'tns': args.tns,
+        'root_name': args.root_name,
+        'root_type': args.root_type,
+    }
+    if args.normalize:
+        listener_opts['normalize'] = True
+    if args.prune:
+        listener_opts['prune'] = True
+    if args.dedupe:
+        listener_opts['dedupe'] = True
+    if args.groups is not None:
+        listener_opts['groups'] = True
+        listener_opts['group_min_length'] = args.groups
+    return listener_opts
+
+
+def convert_local(jobs, args, collect_stats) -> list:
+    """
+    Convert the jobs in this process, or its workers, under the profiler
+    if one is requested
+    """
+    # imported here so --help, usage errors and the daemon client do not
+    # load the converter
+    from . import batch
+    convert_opts = dict(cache_dir=args.cache_dir, dfa_path=args.dfa, stats=collect_stats)
+    if args.profile is None:
+        return batch.convert_all(jobs, max_workers=args.jobs or None, **convert_opts)
+    from .profiling import Profiler
+    with Profiler() as profiler:
+        results = batch.convert_all(jobs, max_workers=1, **convert_opts)
+    profiler.save(args.profile)
+    return results
+
+
+def write_results(results, args) -> int:
+    """
+    Write the schemas, report the errors and pruned types and save the
+    stats, returns the exit status
+    """
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+    status = 0
+    for g4_path, xsd, error, stats in results:
+        if error is not None:
+            print('{:s}: {:s}'.format(g4_path, error), file=sys.stderr)
+            status = 1
+            continue
+        write_if_changed(output_path(g4_path, args.output_dir), xsd)
+        if args.prune and args.list_pruned:
+            for name in stats.get('pruned_types', []):
+                print('{:s}: pruned {:s}'.format(g4_path, name))
+    if args.stats is not None:
+        with open(args.stats, 'w') as f:
+            json.dump({
+                g4_path: stats for g4_path, _, _, stats in results
+                if stats is not None}, f, indent=2, sort_keys=True)
+            f.write('\n')
+    return status
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['serve']:
+        return serve(argv[1:])
+    args = get_parser().parse_args(argv)
+
+    listener_opts = get_listener_opts(args)
+    # pruned types are reported in the stats
+    collect_stats = args.stats is not None or (args.prune and args.list_pruned)
+    jobs = [(g4_path, listener_opts) for g4_path in args.grammars]
+    results = None
+    # the daemon reports no stats and runs elsewhere
+    if args.daemon and not collect_stats and args.profile is None:
+        results = convert_daemon(jobs, args.socket)
+    if results is None:
+        results = convert_local(jobs, args, collect_stats)
+    return write_results(results, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Long-lived conversion daemon on a unix domain socket and its client.
+
+The daemon keeps the prediction DFA its parser learned and an in-memory
+grammar cache, so converting a grammar it has seen before only costs the
+schema emission. A connection carries one request and its response, so
+clients take turns request by request. A client that does not send its
+request or read the response within REQUEST_TIMEOUT seconds is dropped.
+Messages are a 4 byte big endian length followed by a JSON object.
+
+request:  {"listener_opts": {...}, "g4_path": "..."} or
+          {"listener_opts": {...}, "grammar": "<g4 source>"}
+response: {"xsd": "<schema>"} or {"error": "<traceback>"}
+
+The client side only needs the standard library, the converter is
+imported when the daemon is not running and the client falls back to
+converting in process.
+
+The socket is $ANTLR2XSD_SOCKET, or antlr2xsd.sock in $XDG_RUNTIME_DIR, or
+in a directory of the temp dir that only the user can access.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import tempfile
+import traceback
+
+_HEADER = struct.Struct('>I')
+
+#: seconds the daemon waits for a request or for the client to read
+REQUEST_TIMEOUT = 30
+
+
+def default_socket_path(create=False):
+    """
+    Socket path of the daemon, with create the private directory it is in
+    is created if needed
+    """
+    if os.environ.get('ANTLR2XSD_SOCKET'):
+        return os.environ['ANTLR2XSD_SOCKET']
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], 'antlr2xsd.sock')
+    # the temp dir is world writable, keep the socket in a directory only
+    # the user can access
+    socket_dir = os.path.join(tempfile.gettempdir(), 'antlr2xsd-{:d}'.format(os.getuid()))
+    if create:
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if os.path.isdir(socket_dir):
+        st = os.lstat(socket_dir)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(
+                '{:s} is not a private directory of the user'.format(socket_dir))
+    return os.path.join(socket_dir, 'antlr2xsd.sock')
+
+
+def _send(f, obj):
+    body = json.dumps(obj).encode('utf-8')
+    f.write(_HEADER.pack(len(body)) + body)
+    f.flush()
+
+
+def _recv(f):
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    size, = _HEADER.unpack(header)
+    body = f.read(size)
+    if len(body) < size:
+        return None
+    return json.loads(body.decode('utf-8'))
+
+
+#------------------------------------------------------------------------
+# Server
+#------------------------------------------------------------------------
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            request = _recv(self.rfile)
+            if request is not None:
+                _send(self.wfile, self.server.convert(request))
+        except OSError:  # timed out or went away, serve the next client
+            pass
+
+
+class Server(socketserver.UnixStreamServer):
+    """
+    Serves conversions one request at a time with warm parser state
+
+    Requests are served in the thread that runs serve_forever, whose
+    prediction DFA the runtime updates without locks, and a preloaded DFA
+    snapshot is that of the main thread.
+    """
+
+    def __init__(self, socket_path=None, cache_dir=None, dfa_path=None):
+        from . import g4_parser
+        from .cache import GrammarCache, MemoryCache
+
+        if dfa_path is not None:
+            from . import dfa
+            dfa.load(dfa_path)
+        self.g4_parser = g4_parser
+        backing = None if cache_dir is None else GrammarCache(cache_dir)
+        self.cache = MemoryCache(backing=backing)
+
+        self.socket_path = socket_path or default_socket_path(create=True)
+        _remove_stale_socket(self.socket_path)
+        super().__init__(self.socket_path, _Handler)
+
+    def convert(self, request) -> dict:
+        try:
+            if 'grammar' in request:
+                data = request['grammar']
+            else:
+                with open(request['g4_path'], 'rb') as f:
+                    data = f.read()
+            converter = self.g4_parser.Converter(request['listener_opts'], cache=self.cache)
+            xsd = converter.parse_bytes(data)
+            return {'xsd': self.g4_parser.serialize(xsd).decode('utf-8')}
+        except Exception:  # report to the client, keep serving
+            return {'error': traceback.format_exc()}
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+
+def is_running(socket_path=None) -> bool:
+    """
+    Whether a daemon is listening on socket_path
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path or default_socket_path())
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def _remove_stale_socket(socket_path):
+    if not os.path.exists(socket_path):
+        return
+    if is_running(socket_path):
+        raise OSError('antlr2xsd daemon already listening on {:s}'.format(socket_path))
+    os.remove(socket_path)
+
+
+def serve(socket_path=None, cache_dir=None, dfa_path=None):
+    """
+    Run the daemon until interrupted or terminated
+    """
+    def terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, terminate)
+    with Server(socket_path, cache_dir, dfa_path) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+#------------------------------------------------------------------------
+# Client
+#------------------------------------------------------------------------
+
+class Client:
+    """
+    Client of a running daemon, every conversion connects anew so that
+    clients take turns, timeout limits the wait for each in seconds
+    """
+
+    def __init__(self, socket_path=None, timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def convert(self, listener_opts, g4_path=None, grammar=None) -> bytes:
+        """
+        Convert a grammar file, or grammar source text, to serialized XSD
+        """
+        request = {'listener_opts': listener_opts}
+        if grammar is not None:
+            request['grammar'] = grammar
+        else:
+            request['g4_path'] = os.path.abspath(g4_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            with sock.makefile('rwb') as f:
+                _send(f, request)
+                response = _recv(f)
+        if response is None:
+            raise ConnectionError('antlr2xsd daemon closed the connection')
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['xsd'].encode('utf-8')
+
+
+def convert(listener_opts, g4_path=None, grammar=None, socket_path=None) -> bytes:
+    """
+    Convert with the daemon if it is running, otherwise in this process
+    """
+    try:
+        return Client(socket_path).convert(listener_opts, g4_path, grammar)
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+
+    from . import g4_parser
+    if grammar is None:
+        with open(g4_path, 'rb') as f:
+            data = f.read()
+    else:
+        data = grammar
+    return g4_parser.serialize(g4_parser.Converter(listener_opts).parse_bytes(data))
@@ -0,0 +1,241 @@
+"""
+Snapshots of the prediction DFA learned by the generated lexer and parser.
+
+The ANTLR runtime builds its DFA lazily while parsing, so the first grammars
+converted in a process are slower. save() stores what was learned so far and
+load() preloads it into the shared DFA of every lexer and parser created
+afterwards.
+
+Snapshots are pickles, only load files you created.
+
+usage: python -m antlr2xsd.dfa SNAPSHOT G4 [G4 ...]
+"""
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+
+from antlr4.PredictionContext import PredictionContext
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState
+
+from . import cache
+from .generated import ANTLRv4Lexer, ANTLRv4Parser
+
+#: bump when the layout of a snapshot changes
+FORMAT_VERSION = 2
+
+RECOGNIZERS = [
+    (ANTLRv4Lexer.ANTLRv4Lexer, ANTLRv4Lexer.serializedATN),
+    (ANTLRv4Parser.ANTLRv4Parser, ANTLRv4Parser.serializedATN),
+]
+
+# edge targets that are runtime singletons
+_PARSER_ERROR = -1
+_LEXER_ERROR = -2
+
+# singletons compared by identity in the runtime
+_SINGLETONS = {
+    'semantic_none': SemanticContext.NONE,
+    'context_empty': PredictionContext.EMPTY,
+}
+
+
+def _atn_hash(serialized_atn):
+    return hashlib.sha256(serialized_atn().encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class _Pickler(pickle.Pickler):
+
+    def __init__(self, file, atns):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.atns = atns
+        self.atn_index = 0
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ATNState):
+            return ('state', self.atn_index, obj.stateNumber)
+        for name, singleton in _SINGLETONS.items():
+            if obj is singleton:
+                return (name,)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, file, atns):
+        super().__init__(file)
+        self.atns = atns
+
+    def persistent_load(self, pid):
+        if pid[0] == 'state':
+            return self.atns[pid[1]].states[pid[2]]
+        return _SINGLETONS[pid[0]]
+
+
+def _dump_state(state, numbers):
+    edges = None
+    if state.edges is not None:
+        edges = [numbers(target) for target in state.edges]
+    return (
+        state.stateNumber, state.configs, edges, state.isAcceptState,
+        state.prediction, state.lexerActionExecutor, state.requiresFullContext,
+        state.predicates)
+
+
+def _load_state(data):
+    number, configs, edges, accept, prediction, executor, full_ctx, predicates = data
+    state = DFAState(number, configs)
+    state.edges = edges
+    state.isAcceptState = accept
+    state.prediction = prediction
+    state.lexerActionExecutor = executor
+    state.requiresFullContext = full_ctx
+    state.predicates = predicates
+    return state
+
+
+def _dump_dfa(dfa):
+    """
+    Flatten a DFA, edges refer to state numbers so pickling does not
+    recurse along DFA paths
+    """
+    def numbers(target):
+        if target is None:
+            return None
+        if target is ATNSimulator.ERROR:
+            return _PARSER_ERROR
+        if target is LexerATNSimulator.ERROR:
+            return _LEXER_ERROR
+        return target.stateNumber
+
+    states = [_dump_state(state, numbers) for state in dfa.states]
+    s0 = None
+    if dfa.s0 is not None:
+        s0 = dfa.s0.stateNumber if dfa.s0 in dfa.states else _dump_state(dfa.s0, numbers)
+    return states, s0
+
+
+def _load_dfa(dfa, data):
+    states_data, s0 = data
+    states = {}
+    for state_data in states_data:
+        state = _load_state(state_data)
+        states[state.stateNumber] = state
+    by_number = dict(states)
+    by_number[_PARSER_ERROR] = ATNSimulator.ERROR
+    by_number[_LEXER_ERROR] = LexerATNSimulator.ERROR
+    resolve = list(states.values())
+    if isinstance(s0, tuple):
+        # precedence DFA, s0 is not one of the states
+        s0 = _load_state(s0)
+        resolve.append(s0)
+    elif s0 is not None:
+        s0 = states[s0]
+    for state in resolve:
+        if state.edges is not None:
+            state.edges = [None if n is None else by_number[n] for n in state.edges]
+    dfa._states = {state: state for state in states.values()}
+    dfa.s0 = s0
+
+
+def _header():
+    # DFA states hold runtime objects, so snapshots only load into the
+    # runtime version that wrote them
+    return (
+        FORMAT_VERSION, cache._runtime_version(),
+        [_atn_hash(atn) for _, atn in RECOGNIZERS])
+
+
+def dumps() -> bytes:
+    """
+    Snapshot of the DFA learned so far by the lexer and the parser
+    """
+    header = _header()
+    f = io.BytesIO()
+    pickler = _Pickler(f, [cls.atn for cls, _ in RECOGNIZERS])
+    pickler.dump(header)
+    for i, (cls, _) in enumerate(RECOGNIZERS):
+        pickler.atn_index = i
+        pickler.dump([_dump_dfa(dfa) for dfa in cls.decisionsToDFA])
+    return f.getvalue()
+
+
+def loads(data: bytes) -> bool:
+    """
+    Preload a snapshot, returns False if it is for another ANTLRv4 grammar,
+    antlr4 runtime version or format version, or is not a snapshot
+    """
+    f = io.BytesIO(data)
+    unpickler = _Unpickler(f, [cls.atn for cls, _ in RECOGNIZERS])
+    # read everything before touching the DFA, so a truncated snapshot
+    # does not leave it half loaded
+    try:
+        if unpickler.load() != _header():
+            return False
+        dfas = [unpickler.load() for _ in RECOGNIZERS]
+    except (pickle.UnpicklingError, EOFError, ValueError, AttributeError, IndexError,
+            KeyError, TypeError):
+        return False
+    for (cls, _), dfa_data in zip(RECOGNIZERS, dfas):
+        for dfa, data in zip(cls.decisionsToDFA, dfa_data):
+            _load_dfa(dfa, data)
+    return True
+
+
+def clear():
+    """
+    Forget the DFA learned so far, lexers and parsers that exist keep
+    sharing it
+    """
+    for cls, _ in RECOGNIZERS:
+        # replaced in place, the simulators hold the list
+        for i in range(len(cls.decisionsToDFA)):
+            cls.decisionsToDFA[i] = DFA(cls.atn.getDecisionState(i), i)
+
+
+def save(path):
+    """
+    Write a snapshot of the learned DFA to path
+    """
+    data = dumps()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load(path) -> bool:
+    """
+    Preload the snapshot at path, returns False if it is missing, stale or
+    corrupt
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return False
+    return loads(data)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print(__doc__.strip().split('\n')[-1], file=sys.stderr)
+        return 2
+    from . import g4_parser
+    listener_opts = {'tns': 'urn:antlr2xsd', 'root_name': 'root', 'root_type': 'root'}
+    for g4_path in argv[1:]:
+        g4_parser.parse(g4_path, listener_opts)
+    save(argv[0])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
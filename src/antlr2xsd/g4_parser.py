@@ -1,16 +1,37 @@
 """
 Converts ANTLR g4 grammar files into xml XSD schemas.
 """
+import hashlib
+import json
+import logging
+import mmap as mmap_
 import os
+import re
 import sys
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
 from math import inf
 
-import antlr4
-
-sys.path.append(os.path.pardir)
-from antlr2xsd.generated.ANTLRv4Lexer import ANTLRv4Lexer  # noqa: E402, I100
-from antlr2xsd.generated.ANTLRv4Parser import ANTLRv4Parser  # noqa: E402
-from antlr2xsd.generated.ANTLRv4ParserListener import ANTLRv4ParserListener  # noqa: E402
+from antlr4.PredictionContext import PredictionContextCache
+from antlr4.Token import Token
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.dfa.DFA import DFA
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.tree.Tree import ParseTreeListener
+
+from antlr2xsd.generated.ANTLRv4Lexer import ANTLRv4Lexer  # noqa: I100
+from antlr2xsd.generated.ANTLRv4Parser import ANTLRv4Parser
+from antlr2xsd.generated.ANTLRv4ParserListener import ANTLRv4ParserListener
+from antlr2xsd import passes
+from antlr2xsd.cache import GrammarCache
+from antlr2xsd.graph import RuleGraph
+from antlr2xsd.streams import ArrayTokenStream, CodePointStream, SlimTokenFactory
+from antlr2xsd.stats import add, count_nodes, count_schema, record_memory, timer
+from antlr2xsd.walker import Walker
 
 
 from lxml import etree
@@ -18,13 +39,62 @@ from math import inf
 
 
 def new_elem(namespace, type_name, *args, **kwargs) -> etree._Element:
-    tag = '{{{:s}}}{:s}'.format(namespace, type_name)
-    return etree.Element('{{{:s}}}{:s}'.format(namespace, type_name), *args, **kwargs)
+    # the prefix is declared on every element instead of registering it
+    # globally with lxml, appending to the schema drops the duplicates
+    return etree.Element(
+        '{{{:s}}}{:s}'.format(namespace, type_name), *args, nsmap=NSMAP, **kwargs)
 
 
 E = etree
 XS = "http://www.w3.org/2001/XMLSchema"
-E.register_namespace('xs', XS)
+NSMAP = {'xs': XS}
+XS_DECLARATION = ' xmlns:xs="{:s}"'.format(XS).encode('utf-8')
+
+# the ANTLRv4Parser recurses about 5 frames per nested block, since python
+# 3.11 python to python calls do not use the C stack so deep grammars can
+# be allowed
+PARSE_RECURSION_LIMIT = 50000 if sys.version_info >= (3, 11) else None
+
+logger = logging.getLogger(__name__)
+
+
+def new_schema(listener_opts) -> etree._Element:
+    """
+    Create the xsd document with its root element
+    """
+    root = new_elem(
+        XS, 'schema', targetNamespace=listener_opts['tns'],
+        xmlns=listener_opts['tns'], elementFormDefault="qualified")
+    root.append(new_elem(
+        XS, 'element', name=listener_opts['root_name'],
+        type=listener_opts['root_type']))
+    return root
+
+
+#------------------------------------------------------------------------
+# Intermediate form, options independent [tag, attrib, children] lists
+#------------------------------------------------------------------------
+
+def to_ir(elem: etree._Element) -> list:
+    return [
+        elem.tag.split('}')[1], dict(elem.attrib),
+        [to_ir(child) for child in elem]]
+
+
+def from_ir(ir: list) -> etree._Element:
+    tag, attrib, children = ir
+    elem = new_elem(XS, tag, attrib)
+    elem.extend(from_ir(child) for child in children)
+    return elem
+
+
+def emit(types: list, listener_opts) -> etree._Element:
+    """
+    Create the xsd document from the intermediate form of its types
+    """
+    root = new_schema(listener_opts)
+    root.extend(from_ir(ctype) for ctype in types)
+    return root
 
 
 class Scope:
@@ -49,8 +119,13 @@ class Listener(ANTLRv4ParserListener):
     with info for XSD
     """
 
-    def __init__(self, listener_opts):
+    def __init__(self, listener_opts, write_type=None, graph=None, rules=None):
         self.root = None  # type: etree._Element
+        self.write_type = write_type
+        self.graph = graph  # type: RuleGraph
+        # collects the types of each parser rule, for incremental runs
+        self.rules = rules  # type: list
+        self.rule_types = []
         self.scope = {
             'type': Scope(),
             'elem_list': Scope()
@@ -58,22 +133,13 @@ class Listener(ANTLRv4ParserListener):
         self.tns = listener_opts['tns']
         self.root_name = listener_opts['root_name']
         self.root_type = listener_opts['root_type']
-        E.register_namespace('tns', self.tns)
-        self.xsd = {}
-        self.depth = 0
 
     #------------------------------------------------------------------------
     # Logging
     #------------------------------------------------------------------------
 
-    def enterEveryRule(self, ctx: antlr4.ParserRuleContext):
-        self.depth += 1
-
-    def exitEveryRule(self, ctx: antlr4.ParserRuleContext):
-        self.depth -= 1
-
-    def log(self, *args, **kwargs):
-        print(self.depth * '-', *args, **kwargs)
+    def log(self, *args):
+        logger.debug(' '.join(str(arg) for arg in args))
 
 
     #------------------------------------------------------------------------
@@ -84,13 +150,9 @@ class Listener(ANTLRv4ParserListener):
         """
         Create xsd document and add root element.
         """
-        print() # new line for logging
-        root = new_elem(
-            XS, 'schema', targetNamespace=self.tns,
-            xmlns=self.tns, elementFormDefault="qualified")
-        root.append(new_elem(
-            XS, 'element', name=self.root_name, type=self.root_type))
-        self.xsd[ctx] = root
+        root = new_schema({
+            'tns': self.tns, 'root_name': self.root_name,
+            'root_type': self.root_type})
         self.root = root
 
     #------------------------------------------------------------------------
@@ -99,13 +161,29 @@ class Listener(ANTLRv4ParserListener):
 
     def enterParserRuleSpec(self, ctx:ANTLRv4Parser.ParserRuleSpecContext):
         ctype = new_elem(XS, 'complexType', name=ctx.RULE_REF().getText())
-        self.root.append(ctype)
+        self.rule_types = [ctype]
         self.scope['type'].push(ctype)
         self.scope['elem_list'].push(new_elem(XS, 'sequence'))
 
     def exitParserRuleSpec(self, ctx:ANTLRv4Parser.ParserRuleSpecContext):
         self.scope['type'].get().append(self.scope['elem_list'].pop())
         self.scope['type'].pop()
+        self.emit_types(self.rule_types)
+
+    def emit_types(self, types):
+        """
+        Add the types of a parser rule to the xsd, or write them out
+        when streaming.
+        """
+        if self.graph is not None:
+            self.graph.add_rule(types)
+        if self.rules is not None:
+            self.rules.append(types)
+        if self.write_type is None:
+            self.root.extend(types)
+        else:
+            for ctype in types:
+                self.write_type(ctype)
 
     #------------------------------------------------------------------------
     # LabeledAlt maps to a new type if a name is given
@@ -123,7 +201,7 @@ class Listener(ANTLRv4ParserListener):
         if ctx.identifier() is None:
             return
         self.scope['type'].get().append(self.scope['elem_list'].pop())
-        self.root.append(self.scope['type'].pop())
+        self.rule_types.append(self.scope['type'].pop())
 
         # add reference to newly created type
         type = ctx.identifier().getText()
@@ -202,17 +280,660 @@ class Listener(ANTLRv4ParserListener):
         pass
 
 
-def parse(g4_path, listener_opts):
+#------------------------------------------------------------------------
+# Incremental regeneration, reuses the types of unchanged parser rules
+#------------------------------------------------------------------------
+
+# top level structure of g4 source: literals, comments, argument blocks and
+# char sets are skipped whole, actions are tracked by their braces
+_STATEMENT_RE = re.compile(r"""
+    '(?:\\.|[^'\\\n])*'
+  | //[^\n]*
+  | /\*.*?\*/
+  | \[(?:\\.|[^\]\\])*\]
+  | [{};]
+""", re.S | re.X)
+
+# grammar level blocks, which are not followed by a semicolon
+_PREQUEL_RE = re.compile(r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (?:options|tokens|channels|@[\w:]+)\s*\{
+""", re.S | re.X)
+
+# start of a parser rule after whitespace and comments
+_RULE_HEAD_RE = re.compile(r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (?P<head>(?:(?:public|private|protected)\s+)*(?P<name>[a-z]\w*)\s*
+        (?:[\[:@]|returns\b|throws\b|locals\b|options\b))
+""", re.S | re.X)
+
+
+def _text_key(text) -> str:
+    return hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def split_rules(text):
+    """
+    Split g4 source into its parser rules without lexing it
+
+    Statements end at the semicolons outside of literals, comments and
+    actions, or at the end of grammar level blocks such as options.
+    Returns the (name, start, end) spans of the statements that
+    are parser rules, from their name or modifiers to their semicolon,
+    and a key of the text of all other statements, such as the grammar
+    header and the lexer rules. Comments between statements are in
+    neither.
+    """
+    spans = []
+    rest = []
+    depth = 0
+    start = 0
+    for match in _STATEMENT_RE.finditer(text):
+        token = match.group()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth = max(depth - 1, 0)
+            if depth == 0 and _PREQUEL_RE.match(text, start):
+                rest.append(text[start:match.end()])
+                start = match.end()
+        elif token == ';' and depth == 0:
+            head = _RULE_HEAD_RE.match(text, start)
+            if head is None:
+                rest.append(text[start:match.end()])
+            else:
+                spans.append((head.group('name'), head.start('head'), match.end()))
+            start = match.end()
+    rest.append(text[start:])
+    return spans, _text_key('\0'.join(rest))
+
+
+class IncrementalState:
+    """
+    Per rule output of the previous run, keyed by the hash of the source
+    text of the rule, and the key of the rest of the grammar, see
+    split_rules
+    """
+
+    def __init__(self, rules=None, rest=None):
+        self.rules = {} if rules is None else rules  # type: dict
+        self.rest = rest
+        self.reused = 0
+        self.emitted = 0
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({
+                'rest': self.rest,
+                'rules': {
+                    key: [to_ir(ctype) for ctype in types]
+                    for key, types in self.rules.items()}}, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return cls({
+            key: [from_ir(ctype) for ctype in types]
+            for key, types in data['rules'].items()}, data['rest'])
+
+
+#------------------------------------------------------------------------
+# Tree-less conversion, walks each rule as soon as it has been parsed
+#------------------------------------------------------------------------
+
+class RuleEmitter(ParseTreeListener):
+    """
+    Parse listener that walks every parser rule as soon as the parser
+    completes it and then drops its subtree, so the parse tree never holds
+    more than the rule being parsed.
+
+    The parser still builds the subtree of the current rule, the Listener
+    handlers read the children of their contexts.
+    """
+
+    def __init__(self, listener, parse_walker, parser, stats=None):
+        self.listener = listener
+        self.parse_walker = parse_walker
+        self.parser = parser
+        self.stats = stats
+        # rules walked so far, the LL pass after a failed SLL pass only
+        # walks the rules after them
+        self.walked = 0
+        self.seen = 0
+        # parse tree size of the current pass, counted with stats only
+        self.rules = 0
+        self.tree_nodes = 0
+
+    def enterGrammarSpec(self, ctx: ANTLRv4Parser.GrammarSpecContext):
+        if self.listener.root is None:
+            self.listener.enterGrammarSpec(ctx)
+        self.seen = 0
+        self.rules = 0
+        self.tree_nodes = 0
+
+    def exitRuleSpec(self, ctx: ANTLRv4Parser.RuleSpecContext):
+        if ctx.exception is not None and isinstance(self.parser._errHandler, BailErrorStrategy):
+            # SLL gave up inside this rule, the LL pass parses it again
+            return
+        rule = ctx.parserRuleSpec()
+        if rule is not None:
+            self.seen += 1
+            if self.seen > self.walked:
+                if self.stats is None:
+                    self.parse_walker.walk(self.listener, rule)
+                else:
+                    with timer(self.stats, 'walk'):
+                        self.parse_walker.walk(self.listener, rule)
+                self.walked += 1
+            self.rules += 1
+        if self.stats is not None:
+            self.tree_nodes += count_nodes(ctx)
+        ctx.parentCtx.removeLastChild()
+
+
+class Converter:
+    """
+    Conversion session for grammars with the same listener_opts
+
+    Owns a lexer and parser that are reset for every grammar, so converting
+    many grammars in a loop only pays for lexing, parsing and walking. The
+    prediction DFA they learn is shared by all converters of the thread.
+
+    cache is a GrammarCache or MemoryCache, or give cache_dir for a
+    GrammarCache in that directory. See parse for tree. The passes
+    enabled in listener_opts, see antlr2xsd.passes, run on every result.
+
+    A converter must only be used by one thread at a time.
+    """
+
+    def __init__(self, listener_opts, cache_dir=None, cache=None, tree=True):
+        self.listener_opts = dict(listener_opts)
+        if cache is None and cache_dir is not None:
+            cache = GrammarCache(cache_dir)
+        self.cache = cache
+        self.tree = tree
+        self.lexer, self.parser = _new_recognizers()
+
+    def parse_file(self, g4_path, mmap=False, incremental=None, stats=None,
+                   graph=None) -> etree._Element:
+        """
+        Convert a g4 file, memory mapping it instead of reading it if mmap
+        is True
+        """
+        with open(g4_path, 'rb') as f:
+            if not mmap or os.fstat(f.fileno()).st_size == 0:
+                return self.parse_bytes(f.read(), incremental, stats, graph)
+            with mmap_.mmap(f.fileno(), 0, access=mmap_.ACCESS_READ) as data:
+                return self.parse_bytes(data, incremental, stats, graph)
+
+    def parse_bytes(self, data, incremental=None, stats=None, graph=None) -> etree._Element:
+        """
+        Convert utf-8 grammar source in bytes, any buffer such as an mmap,
+        or text, looking up and storing the rule types and graph in the
+        cache
+        """
+        xsd = self._convert_cached(data, incremental, stats, graph)
+        if passes.enabled(self.listener_opts):
+            passes.run(xsd, self.listener_opts, stats)
+        return xsd
+
+    def _convert_cached(self, data, incremental, stats, graph):
+        if self.cache is None:
+            return self._convert(data, incremental, stats=stats, tree=self.tree, graph=graph)
+
+        key = self.cache.key(data)
+        entry = self.cache.get(key)
+        if entry is not None:
+            xsd = emit(entry['types'], self.listener_opts)
+            if graph is not None:
+                graph.update(entry['graph'])
+            if stats is not None:
+                add(stats, 'cache_hits', 1)
+                count_schema(stats, [xsd])
+            return xsd
+        rule_graph = RuleGraph()
+        xsd = self._convert(data, incremental, stats=stats, tree=self.tree, graph=rule_graph)
+        if graph is not None:
+            graph.update(rule_graph)
+        ctype_tag = '{{{:s}}}complexType'.format(XS)
+        self.cache.put(key, {
+            'types': [to_ir(e) for e in xsd if e.tag == ctype_tag],
+            'graph': rule_graph.to_dict()})
+        return xsd
+
+    def parse_string(self, text, incremental=None, stats=None, graph=None) -> etree._Element:
+        """
+        Convert grammar source text
+        """
+        return self.parse_bytes(text, incremental, stats, graph)
+
+    def write(self, g4_path, output, stats=None, graph=None):
+        """
+        Convert a g4 file and stream the XSD to output, a path or binary
+        file, see write
+
+        The passes need the whole schema, with passes enabled it is
+        converted first and then written out.
+        """
+        with open(g4_path, 'rb') as f:
+            data = f.read()
+        converted = passes.enabled(self.listener_opts)
+        if converted:
+            schema = self.parse_bytes(data, stats=stats, graph=graph)
+        else:
+            schema = new_schema(self.listener_opts)
+        with _open_output(output) as f:
+            # the same bytes as serialize, the children are written without
+            # redeclaring the xs prefix of the schema element
+            start = etree.tostring(etree.Element(schema.tag, schema.attrib, nsmap=NSMAP))
+            f.write(start[:-2] + b'>\n')
+
+            def write_type(elem):
+                if stats is not None and not converted:
+                    count_schema(stats, [elem])
+                etree.indent(elem, level=1)
+                f.write(b'  ' + etree.tostring(elem).replace(XS_DECLARATION, b'', 1) + b'\n')
+
+            if converted:
+                for elem in schema:
+                    write_type(elem)
+            else:
+                write_type(schema[0])
+                self._convert(
+                    data, write_type=write_type, stats=stats, tree=False, graph=graph)
+            f.write(b'</xs:schema>\n')
+
+    def _convert(self, data, incremental=None, write_type=None, stats=None, tree=True,
+                 graph=None):
+        try:
+            if incremental is not None:
+                return self._run_incremental(data, incremental, write_type, stats, tree, graph)
+            return self._run(data, write_type, stats, tree, graph)
+        finally:
+            # do not keep the last grammar alive
+            self.lexer._input = None
+            self.lexer._tokenFactorySourcePair = (self.lexer, None)
+            self.parser._input = None
+            self.parser._ctx = None
+            self.parser._interp._input = None
+            self.parser._interp._outerContext = None
+
+    def _run(self, data, write_type, stats, tree, graph, rules=None):
+        stream = self._set_input(data)
+        parser = self.parser
+        listener = Listener(self.listener_opts, write_type, graph, rules)
+        parse_walker = Walker(ANTLRv4Parser, Listener, ANTLRv4ParserListener)
+        emitter = None
+        if not tree:
+            emitter = RuleEmitter(listener, parse_walker, parser, stats)
+            parser.addParseListener(emitter)
+        try:
+            if stats is None:
+                parse_tree, mode = _parse_grammar(parser)
+            else:
+                parse_tree, mode = _timed_parse(parser, stream, stats)
+        finally:
+            if emitter is not None:
+                parser.removeParseListener(emitter)
+        if stats is not None:
+            _record_parse(stats, parse_tree, mode, emitter)
+        if emitter is None:
+            _walk(parse_walker, listener, parse_tree, stats)
+        if stats is not None:
+            if write_type is None:
+                count_schema(stats, [listener.root])
+            record_memory(stats)
+        return listener.root
+
+    def _run_incremental(self, data, state, write_type, stats, tree, graph):
+        """
+        Convert only the parser rules whose source text is not in state,
+        each parsed on its own, and splice in the types of the others
+
+        Everything is converted if the rest of the grammar changed, or if
+        a changed rule does not parse on its own.
+        """
+        text = data if isinstance(data, str) else str(data, 'utf-8')
+        spans, rest = split_rules(text)
+        keys = [_text_key(text[start:end]) for _, start, end in spans]
+        converted = None
+        if rest == state.rest:
+            if stats is None:
+                converted = self._convert_rules(text, spans, keys, state)
+            else:
+                with timer(stats, 'parse'):
+                    converted = self._convert_rules(text, spans, keys, state)
+        if converted is None:
+            return self._run_all(data, state, write_type, stats, tree, graph, spans, keys, rest)
+
+        listener = Listener(self.listener_opts, write_type, graph)
+        listener.enterGrammarSpec(None)
+        rules = dict(state.rules, **converted)
+        for key in keys:
+            listener.emit_types([deepcopy(ctype) for ctype in rules[key]])
+        state.rules = {key: rules[key] for key in keys}
+        state.emitted += len(converted)
+        state.reused += len(keys) - len(converted)
+        if stats is not None:
+            add(stats, 'rules', len(keys))
+            if write_type is None:
+                count_schema(stats, [listener.root])
+            record_memory(stats)
+        return listener.root
+
+    def _convert_rules(self, text, spans, keys, state):
+        """
+        Parse and walk the parser rules that are not in state, returns
+        their types by key, or None if one of them is not a single parser
+        rule of its name
+        """
+        parse_walker = Walker(ANTLRv4Parser, Listener, ANTLRv4ParserListener)
+        listener = Listener(self.listener_opts, write_type=lambda ctype: None)
+        converted = {}
+        for (name, start, end), key in zip(spans, keys):
+            if key in state.rules or key in converted:
+                continue
+            self._set_input(text[start:end])
+            ctx = _parse_rule(self.parser)
+            if ctx is None or ctx.RULE_REF().getText() != name:
+                logger.debug('rule %s does not parse on its own', name)
+                return None
+            parse_walker.walk(listener, ctx)
+            converted[key] = listener.rule_types
+        return converted
+
+    def _run_all(self, data, state, write_type, stats, tree, graph, spans, keys, rest):
+        """
+        Convert the whole grammar and store the types of its parser rules
+        in state
+        """
+        rules = []
+        xsd = self._run(data, write_type, stats, tree, graph, rules)
+        state.emitted += len(rules)
+        if [types[0].get('name') for types in rules] != [name for name, _, _ in spans]:
+            # the source could not be split into its rules, the next run
+            # converts everything again
+            state.rules = {}
+            state.rest = None
+            return xsd
+        state.rules = {
+            key: [deepcopy(ctype) for ctype in types] for key, types in zip(keys, rules)}
+        state.rest = rest
+        return xsd
+
+    def _set_input(self, data):
+        """
+        Point the lexer and parser at data, returns the token stream
+        """
+        if isinstance(data, str):
+            input_stream = CodePointStream(data)
+        else:
+            input_stream = CodePointStream(str(data, 'utf-8'), data)
+        self.lexer.inputStream = input_stream
+        self.lexer._factory = SlimTokenFactory.DEFAULT
+        stream = ArrayTokenStream(self.lexer)
+        self.parser.setTokenStream(stream)
+        return stream
+
+
+def parse(g4_path, listener_opts, cache_dir=None, incremental=None, stats=None,
+          tree=True, graph=None):
     """
     Parse a g4 file and return an AST for XSD
+
+    If cache_dir is given, the rule types are cached there keyed by the
+    grammar contents, so converting the same grammar again, e.g. with
+    other listener_opts, skips lexing and parsing.
+
+    If an IncrementalState is given, only the parser rules that changed
+    since the previous run with that state are lexed, parsed and converted
+    again, each on its own, and the types of the others are reused. A
+    change outside the parser rules converts the whole grammar.
+
+    With tree=False, each parser rule is converted as soon as it has been
+    parsed and its part of the parse tree is dropped, so memory does not
+    grow with the parse tree of the whole grammar.
+
+    If a stats dict, e.g. a antlr2xsd.stats.Stats, is given, the stage
+    timings and counters of the conversion are added to it. The prediction
+    mode that parsed the grammar is stored as 'prediction_mode' and
+    'll_fallbacks' counts the parses that had to fall back from SLL to LL.
+
+    If an antlr2xsd.graph.RuleGraph is given, the parser rules of the
+    grammar are added to it.
+
+    To convert many grammars, reuse a Converter.
+    """
+    return Converter(listener_opts, cache_dir, tree=tree).parse_file(
+        g4_path, incremental=incremental, stats=stats, graph=graph)
+
+
+def parse_file(g4_path, listener_opts, mmap=False, cache_dir=None, incremental=None,
+               stats=None, tree=True, graph=None):
+    """
+    Parse a g4 file, like parse, memory mapping it instead of reading it
+    if mmap is True
+    """
+    return Converter(listener_opts, cache_dir, tree=tree).parse_file(
+        g4_path, mmap, incremental, stats, graph)
+
+
+def parse_bytes(data, listener_opts, cache_dir=None, incremental=None, stats=None,
+                tree=True, graph=None):
     """
-    input_stream = antlr4.FileStream(g4_path)
-    lexer = ANTLRv4Lexer(input_stream)
-    stream = antlr4.CommonTokenStream(lexer)
-    parser = ANTLRv4Parser(stream)
-    parse_tree = parser.grammarSpec()
-    listener = Listener(listener_opts)
-    parse_walker = antlr4.ParseTreeWalker()
-    parse_walker.walk(listener, parse_tree)
-    data = listener.xsd[parse_tree]
-    return data
+    Parse utf-8 grammar source in bytes, or any buffer such as an mmap,
+    see parse
+    """
+    return Converter(listener_opts, cache_dir, tree=tree).parse_bytes(
+        data, incremental, stats, graph)
+
+
+def parse_string(text, listener_opts, cache_dir=None, incremental=None, stats=None,
+                 tree=True, graph=None):
+    """
+    Parse grammar source text, see parse
+    """
+    return Converter(listener_opts, cache_dir, tree=tree).parse_string(
+        text, incremental, stats, graph)
+
+
+def write(g4_path, listener_opts, output, stats=None, graph=None):
+    """
+    Parse a g4 file and stream the XSD to output, a path or binary file
+
+    Each complexType is written as soon as its parser rule has been parsed,
+    so only the parse tree and types of one rule are held in memory at a
+    time.
+    """
+    Converter(listener_opts).write(g4_path, output, stats, graph)
+
+
+@contextmanager
+def _open_output(output):
+    """
+    Binary file of output, a path or binary file, only a path is closed
+    """
+    if isinstance(output, (str, bytes, os.PathLike)):
+        with open(output, 'wb') as f:
+            yield f
+    else:
+        yield output
+
+
+def serialize(xsd: etree._Element, stats=None) -> bytes:
+    """
+    Serialize an XSD returned by parse
+    """
+    if stats is None:
+        return etree.tostring(xsd, pretty_print=True)
+    with timer(stats, 'serialize'):
+        return etree.tostring(xsd, pretty_print=True)
+
+
+#------------------------------------------------------------------------
+# Prediction DFA, shared within a thread and never between threads
+#------------------------------------------------------------------------
+
+_local = threading.local()
+
+
+def _thread_dfa():
+    """
+    DFA and context cache for the recognizers of the calling thread, None
+    for the main thread, which uses those of the generated classes that
+    antlr2xsd.dfa snapshots. The runtime updates them without locks.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return None
+    dfa = getattr(_local, 'dfa', None)
+    if dfa is None:
+        dfa = _local.dfa = (
+            [DFA(s, i) for i, s in enumerate(ANTLRv4Lexer.atn.decisionToState)],
+            [DFA(s, i) for i, s in enumerate(ANTLRv4Parser.atn.decisionToState)],
+            PredictionContextCache())
+    return dfa
+
+
+def _new_recognizers():
+    """
+    Create a lexer and parser that use the DFA of the calling thread
+    """
+    lexer = ANTLRv4Lexer(None)
+    parser = ANTLRv4Parser(None)
+    dfa = _thread_dfa()
+    if dfa is not None:
+        lexer_dfa, parser_dfa, context_cache = dfa
+        lexer._interp = LexerATNSimulator(
+            lexer, lexer.atn, lexer_dfa, PredictionContextCache())
+        parser._interp = ParserATNSimulator(parser, parser.atn, parser_dfa, context_cache)
+    return lexer, parser
+
+
+def _timed_parse(parser, stream, stats):
+    """
+    _parse_grammar, with the lexing and parsing times recorded in stats
+    """
+    # lex up front, otherwise the parser pulls tokens as it goes
+    with timer(stats, 'lex'):
+        stream.fill()
+    add(stats, 'tokens', len(stream.tokens))
+    walk_time = stats.get('walk_time', 0)
+    with timer(stats, 'parse'):
+        parse_tree, mode = _parse_grammar(parser)
+    # without a tree the rules are walked while parsing
+    stats['parse_time'] -= stats.get('walk_time', 0) - walk_time
+    return parse_tree, mode
+
+
+def _walk(parse_walker, listener, parse_tree, stats=None):
+    if stats is None:
+        parse_walker.walk(listener, parse_tree)
+    else:
+        with timer(stats, 'walk'):
+            parse_walker.walk(listener, parse_tree)
+
+
+def _record_parse(stats, parse_tree, mode, emitter=None):
+    """
+    Record the size of the parse tree in stats, with the rules the
+    RuleEmitter already dropped if there is one
+    """
+    if emitter is None:
+        add(stats, 'rules', sum(
+            spec.parserRuleSpec() is not None for spec in parse_tree.rules().ruleSpec()))
+        add(stats, 'tree_nodes', count_nodes(parse_tree))
+    else:
+        add(stats, 'rules', emitter.rules)
+        add(stats, 'tree_nodes', emitter.tree_nodes + count_nodes(parse_tree))
+    stats['prediction_mode'] = mode
+    add(stats, 'll_fallbacks', mode == 'LL')
+
+
+# the recursion limit is process wide, it is raised while any thread parses
+_recursion_lock = threading.Lock()
+_recursion_state = {'parses': 0, 'limit': None}
+
+
+@contextmanager
+def _recursion_limit():
+    """
+    Raise the recursion limit to PARSE_RECURSION_LIMIT while parsing,
+    the first of concurrent parses raises it and the last one restores it
+    """
+    with _recursion_lock:
+        if _recursion_state['parses'] == 0:
+            limit = sys.getrecursionlimit()
+            _recursion_state['limit'] = limit
+            if PARSE_RECURSION_LIMIT and limit < PARSE_RECURSION_LIMIT:
+                sys.setrecursionlimit(PARSE_RECURSION_LIMIT)
+        _recursion_state['parses'] += 1
+    try:
+        yield
+    finally:
+        with _recursion_lock:
+            _recursion_state['parses'] -= 1
+            if _recursion_state['parses'] == 0:
+                sys.setrecursionlimit(_recursion_state['limit'])
+
+
+def _parse_grammar(parser):
+    """
+    Parse with SLL prediction, which is enough for almost all grammars,
+    and only fall back to full LL prediction if SLL fails.
+
+    Returns the parse tree and the prediction mode that produced it.
+    """
+    with _recursion_limit():
+        return _parse_with_fallback(parser)
+
+
+def _parse_rule(parser):
+    """
+    Parse a single parser rule, returns None if the input is not exactly
+    one parser rule without syntax errors
+    """
+    error_listeners = parser._listeners
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    try:
+        with _recursion_limit():
+            for mode in (PredictionMode.SLL, PredictionMode.LL):
+                parser._interp.predictionMode = mode
+                try:
+                    ctx = parser.parserRuleSpec()
+                except ParseCancellationException:
+                    _reset(parser)
+                    continue
+                return ctx if parser.getTokenStream().LA(1) == Token.EOF else None
+        return None
+    finally:
+        parser._listeners = error_listeners
+        parser._errHandler = DefaultErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.LL
+
+
+def _reset(parser):
+    # reset() fails with parse listeners attached, it removes its tracer
+    # even if there is none
+    parse_listeners = parser._parseListeners
+    parser._parseListeners = None
+    parser.reset()
+    parser._parseListeners = parse_listeners
+
+
+def _parse_with_fallback(parser):
+    error_listeners = parser._listeners
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return parser.grammarSpec(), 'SLL'
+    except ParseCancellationException:
+        pass
+    finally:
+        parser._listeners = error_listeners
+        parser._errHandler = DefaultErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.LL
+    _reset(parser)
+    return parser.grammarSpec(), 'LL'
@@ -0,0 +1,644 @@
+# Generated from ANTLRv4Lexer.g4 by ANTLR 4.7.1
+from antlr4 import *
+from io import StringIO
+from typing.io import TextIO
+import sys
+
+
+def serializedATN():
+    with StringIO() as buf:
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2?")
+        buf.write("\u03db\b\1\b\1\b\1\b\1\b\1\b\1\b\1\4\2\t\2\4\3\t\3\4\4")
+        buf.write("\t\4\4\5\t\5\4\6\t\6\4\7\t\7\4\b\t\b\4\t\t\t\4\n\t\n\4")
+        buf.write("\13\t\13\4\f\t\f\4\r\t\r\4\16\t\16\4\17\t\17\4\20\t\20")
+        buf.write("\4\21\t\21\4\22\t\22\4\23\t\23\4\24\t\24\4\25\t\25\4\26")
+        buf.write("\t\26\4\27\t\27\4\30\t\30\4\31\t\31\4\32\t\32\4\33\t\33")
+        buf.write("\4\34\t\34\4\35\t\35\4\36\t\36\4\37\t\37\4 \t \4!\t!\4")
+        buf.write("\"\t\"\4#\t#\4$\t$\4%\t%\4&\t&\4\'\t\'\4(\t(\4)\t)\4*")
+        buf.write("\t*\4+\t+\4,\t,\4-\t-\4.\t.\4/\t/\4\60\t\60\4\61\t\61")
+        buf.write("\4\62\t\62\4\63\t\63\4\64\t\64\4\65\t\65\4\66\t\66\4\67")
+        buf.write("\t\67\48\t8\49\t9\4:\t:\4;\t;\4<\t<\4=\t=\4>\t>\4?\t?")
+        buf.write("\4@\t@\4A\tA\4B\tB\4C\tC\4D\tD\4E\tE\4F\tF\4G\tG\4H\t")
+        buf.write("H\4I\tI\4J\tJ\4K\tK\4L\tL\4M\tM\4N\tN\4O\tO\4P\tP\4Q\t")
+        buf.write("Q\4R\tR\4S\tS\4T\tT\4U\tU\4V\tV\4W\tW\4X\tX\4Y\tY\4Z\t")
+        buf.write("Z\4[\t[\4\\\t\\\4]\t]\4^\t^\4_\t_\4`\t`\4a\ta\4b\tb\4")
+        buf.write("c\tc\4d\td\4e\te\4f\tf\4g\tg\4h\th\4i\ti\4j\tj\4k\tk\4")
+        buf.write("l\tl\4m\tm\4n\tn\4o\to\4p\tp\4q\tq\4r\tr\4s\ts\4t\tt\4")
+        buf.write("u\tu\4v\tv\4w\tw\4x\tx\4y\ty\4z\tz\4{\t{\4|\t|\4}\t}\4")
+        buf.write("~\t~\4\177\t\177\4\u0080\t\u0080\4\u0081\t\u0081\4\u0082")
+        buf.write("\t\u0082\4\u0083\t\u0083\4\u0084\t\u0084\4\u0085\t\u0085")
+        buf.write("\4\u0086\t\u0086\4\u0087\t\u0087\4\u0088\t\u0088\4\u0089")
+        buf.write("\t\u0089\4\u008a\t\u008a\4\u008b\t\u008b\4\u008c\t\u008c")
+        buf.write("\4\u008d\t\u008d\4\u008e\t\u008e\4\u008f\t\u008f\4\u0090")
+        buf.write("\t\u0090\4\u0091\t\u0091\4\u0092\t\u0092\4\u0093\t\u0093")
+        buf.write("\4\u0094\t\u0094\4\u0095\t\u0095\4\u0096\t\u0096\4\u0097")
+        buf.write("\t\u0097\4\u0098\t\u0098\4\u0099\t\u0099\4\u009a\t\u009a")
+        buf.write("\4\u009b\t\u009b\4\u009c\t\u009c\4\u009d\t\u009d\3\2\3")
+        buf.write("\2\3\3\3\3\3\3\3\3\3\4\3\4\3\4\3\4\3\5\3\5\3\6\3\6\3\7")
+        buf.write("\3\7\3\b\3\b\3\b\3\t\3\t\3\t\3\t\3\n\3\n\3\n\3\n\3\n\3")
+        buf.write("\n\3\n\3\n\3\n\3\n\3\13\3\13\3\13\3\13\3\13\3\13\3\13")
+        buf.write("\3\13\3\13\3\f\3\f\3\f\3\f\3\f\3\f\3\f\3\f\3\f\3\f\3\f")
+        buf.write("\3\r\3\r\3\r\3\r\3\r\3\r\3\r\3\16\3\16\3\16\3\16\3\16")
+        buf.write("\3\16\3\16\3\16\3\16\3\17\3\17\3\17\3\17\3\17\3\17\3\20")
+        buf.write("\3\20\3\20\3\20\3\20\3\20\3\20\3\21\3\21\3\21\3\21\3\21")
+        buf.write("\3\21\3\21\3\21\3\22\3\22\3\22\3\22\3\22\3\22\3\22\3\22")
+        buf.write("\3\22\3\22\3\23\3\23\3\23\3\23\3\23\3\23\3\23\3\24\3\24")
+        buf.write("\3\24\3\24\3\24\3\24\3\24\3\24\3\25\3\25\3\25\3\25\3\25")
+        buf.write("\3\25\3\25\3\25\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\27")
+        buf.write("\3\27\3\27\3\27\3\27\3\27\3\27\3\30\3\30\3\30\3\30\3\30")
+        buf.write("\3\30\3\31\3\31\3\31\3\31\3\31\3\31\3\31\3\31\3\32\3\32")
+        buf.write("\3\32\3\32\3\32\3\33\3\33\3\34\3\34\3\35\3\35\3\36\3\36")
+        buf.write("\3\37\3\37\3 \3 \3!\3!\3\"\3\"\3#\3#\3$\3$\3%\3%\3&\3")
+        buf.write("&\3\'\3\'\3(\3(\3)\3)\3*\3*\3+\3+\3,\3,\3-\3-\3.\3.\3")
+        buf.write("/\3/\3\60\3\60\3\61\3\61\3\62\3\62\7\62\u020e\n\62\f\62")
+        buf.write("\16\62\u0211\13\62\3\63\3\63\3\64\3\64\3\65\6\65\u0218")
+        buf.write("\n\65\r\65\16\65\u0219\3\65\3\65\3\66\3\66\3\66\3\66\3")
+        buf.write("\67\3\67\5\67\u0224\n\67\38\38\39\39\3:\3:\3:\3:\7:\u022e")
+        buf.write("\n:\f:\16:\u0231\13:\3:\3:\3:\5:\u0236\n:\3;\3;\3;\3;")
+        buf.write("\3;\7;\u023d\n;\f;\16;\u0240\13;\3;\3;\3;\5;\u0245\n;")
+        buf.write("\3<\3<\3<\3<\7<\u024b\n<\f<\16<\u024e\13<\3=\3=\3=\3=")
+        buf.write("\3=\5=\u0255\n=\3>\3>\3>\3?\3?\3?\3?\3?\5?\u025f\n?\5")
+        buf.write("?\u0261\n?\5?\u0263\n?\5?\u0265\n?\3@\3@\3@\7@\u026a\n")
+        buf.write("@\f@\16@\u026d\13@\5@\u026f\n@\3A\3A\3B\3B\3C\3C\3C\3")
+        buf.write("C\3C\3C\3C\3C\3C\5C\u027e\nC\3D\3D\3D\5D\u0283\nD\3D\3")
+        buf.write("D\3E\3E\3E\7E\u028a\nE\fE\16E\u028d\13E\3E\3E\3F\3F\3")
+        buf.write("F\7F\u0294\nF\fF\16F\u0297\13F\3F\3F\3G\3G\3G\7G\u029e")
+        buf.write("\nG\fG\16G\u02a1\13G\3H\3H\3H\3H\5H\u02a7\nH\3I\3I\3J")
+        buf.write("\3J\3K\3K\3L\3L\3L\3L\3M\3M\3N\3N\3O\3O\3O\3P\3P\3Q\3")
+        buf.write("Q\3R\3R\3S\3S\3T\3T\3U\3U\3V\3V\3W\3W\3X\3X\3X\3Y\3Y\3")
+        buf.write("Z\3Z\3[\3[\3\\\3\\\3]\3]\3^\3^\3_\3_\3_\3`\3`\3a\3a\3")
+        buf.write("b\3b\3c\3c\3d\3d\3e\3e\3f\3f\3f\3g\3g\3h\3h\3i\3i\3j\3")
+        buf.write("j\3j\3j\3j\3k\3k\3k\3k\3l\3l\3l\3l\3m\3m\3m\3m\3n\3n\3")
+        buf.write("n\3o\3o\3o\3o\3p\3p\3q\3q\3q\3q\3q\3r\3r\3r\3r\3s\3s\3")
+        buf.write("s\3s\3t\3t\3t\3t\3u\3u\3u\3u\3v\3v\3v\3v\3w\3w\3w\3w\3")
+        buf.write("x\3x\3x\3y\3y\3y\3y\3z\3z\3{\3{\3{\3{\3{\3|\3|\3|\3|\3")
+        buf.write("|\3}\3}\3}\3}\3}\3~\3~\3~\3~\3\177\3\177\3\177\3\177\3")
+        buf.write("\177\3\u0080\3\u0080\3\u0080\3\u0080\3\u0081\3\u0081\3")
+        buf.write("\u0081\3\u0081\3\u0082\3\u0082\3\u0082\3\u0082\3\u0083")
+        buf.write("\3\u0083\3\u0083\3\u0083\3\u0084\3\u0084\3\u0084\3\u0084")
+        buf.write("\3\u0085\3\u0085\3\u0085\3\u0085\3\u0086\3\u0086\3\u0086")
+        buf.write("\3\u0086\3\u0087\6\u0087\u0366\n\u0087\r\u0087\16\u0087")
+        buf.write("\u0367\3\u0087\3\u0087\3\u0087\3\u0088\3\u0088\3\u0088")
+        buf.write("\3\u0088\3\u0088\3\u0089\3\u0089\3\u0089\3\u0089\3\u0089")
+        buf.write("\3\u008a\3\u008a\3\u008a\3\u008a\3\u008a\3\u008b\3\u008b")
+        buf.write("\3\u008b\3\u008b\3\u008c\3\u008c\3\u008c\3\u008c\3\u008c")
+        buf.write("\3\u008d\3\u008d\3\u008d\3\u008d\3\u008e\3\u008e\3\u008e")
+        buf.write("\3\u008e\3\u008f\3\u008f\3\u008f\3\u008f\3\u0090\6\u0090")
+        buf.write("\u0392\n\u0090\r\u0090\16\u0090\u0393\3\u0090\3\u0090")
+        buf.write("\3\u0090\3\u0091\3\u0091\3\u0091\3\u0091\3\u0091\3\u0092")
+        buf.write("\3\u0092\3\u0092\3\u0092\3\u0092\3\u0093\3\u0093\3\u0093")
+        buf.write("\3\u0093\3\u0093\3\u0094\3\u0094\3\u0094\3\u0094\3\u0095")
+        buf.write("\3\u0095\3\u0095\3\u0095\3\u0095\3\u0096\3\u0096\3\u0096")
+        buf.write("\3\u0096\3\u0097\3\u0097\3\u0097\3\u0097\3\u0098\3\u0098")
+        buf.write("\3\u0098\3\u0098\3\u0099\6\u0099\u03be\n\u0099\r\u0099")
+        buf.write("\16\u0099\u03bf\3\u0099\3\u0099\3\u0099\3\u009a\3\u009a")
+        buf.write("\6\u009a\u03c7\n\u009a\r\u009a\16\u009a\u03c8\3\u009a")
+        buf.write("\3\u009a\3\u009b\3\u009b\3\u009b\3\u009b\3\u009c\3\u009c")
+        buf.write("\3\u009c\3\u009c\3\u009d\3\u009d\7\u009d\u03d7\n\u009d")
+        buf.write("\f\u009d\16\u009d\u03da\13\u009d\4\u022f\u023e\2\u009e")
+        buf.write("\t\6\13\7\r\b\17\t\21\n\23\13\25\f\27\r\31\16\33\17\35")
+        buf.write("\20\37\21!\22#\23%\24\'\25)\26+\27-\30/\31\61\32\63\33")
+        buf.write("\65\34\67\359\36;\37= ?!A\"C#E$G%I&K\'M(O)Q*S+U,W-Y.[")
+        buf.write("/]\60_\61a\62c\63e\64g\65i\3k\4m\66o\67q8s\2u\2w\2y\2")
+        buf.write("{\2}\2\177\2\u0081\2\u0083\2\u0085\2\u0087\2\u0089\2\u008b")
+        buf.write("\2\u008d\2\u008f\2\u0091\2\u0093\2\u0095\2\u0097\2\u0099")
+        buf.write("\2\u009b\2\u009d\2\u009f\2\u00a1\2\u00a3\2\u00a5\2\u00a7")
+        buf.write("\2\u00a9\2\u00ab\2\u00ad\2\u00af\2\u00b1\2\u00b3\2\u00b5")
+        buf.write("\2\u00b7\2\u00b9\2\u00bb\2\u00bd\2\u00bf\2\u00c1\2\u00c3")
+        buf.write("\2\u00c5\2\u00c7\2\u00c9\2\u00cb\2\u00cd\2\u00cf\2\u00d1")
+        buf.write("\2\u00d3\2\u00d5\2\u00d7\2\u00d9\2\u00db\2\u00dd\2\u00df")
+        buf.write("\2\u00e19\u00e3:\u00e5;\u00e7\2\u00e9\2\u00eb\2\u00ed")
+        buf.write("\2\u00ef\2\u00f1\2\u00f3\2\u00f5<\u00f7=\u00f9>\u00fb")
+        buf.write("\2\u00fd\2\u00ff\2\u0101\2\u0103\2\u0105\2\u0107\2\u0109")
+        buf.write("\2\u010b\2\u010d\2\u010f\2\u0111\2\u0113\2\u0115\2\u0117")
+        buf.write("\2\u0119\2\u011b\2\u011d\2\u011f\2\u0121\2\u0123\2\u0125")
+        buf.write("\2\u0127\2\u0129\2\u012b\2\u012d\2\u012f\2\u0131\2\u0133")
+        buf.write("\2\u0135\2\u0137\2\u0139\2\u013b\5\u013d?\u013f\2\t\2")
+        buf.write("\3\4\5\6\7\b\17\4\2\13\13\"\"\4\2\f\f\16\17\4\2\f\f\17")
+        buf.write("\17\n\2$$))^^ddhhppttvv\3\2\63;\5\2\62;CHch\3\2\62;\6")
+        buf.write("\2\f\f\17\17))^^\6\2\f\f\17\17$$^^\5\2\u00b9\u00b9\u0302")
+        buf.write("\u0371\u2041\u2042\17\2C\\c|\u00c2\u00d8\u00da\u00f8\u00fa")
+        buf.write("\u0301\u0372\u037f\u0381\u2001\u200e\u200f\u2072\u2191")
+        buf.write("\u2c02\u2ff1\u3003\ud801\uf902\ufdd1\ufdf2\uffff\16\2")
+        buf.write("C\\\u00c2\u00d8\u00da\u00f8\u00fa\u0301\u0372\u037f\u0381")
+        buf.write("\u2001\u200e\u200f\u2072\u2191\u2c02\u2ff1\u3003\ud801")
+        buf.write("\uf902\ufdd1\ufdf2\uffff\3\2^_\2\u03c2\2\t\3\2\2\2\2\13")
+        buf.write("\3\2\2\2\2\r\3\2\2\2\2\17\3\2\2\2\2\21\3\2\2\2\2\23\3")
+        buf.write("\2\2\2\2\25\3\2\2\2\2\27\3\2\2\2\2\31\3\2\2\2\2\33\3\2")
+        buf.write("\2\2\2\35\3\2\2\2\2\37\3\2\2\2\2!\3\2\2\2\2#\3\2\2\2\2")
+        buf.write("%\3\2\2\2\2\'\3\2\2\2\2)\3\2\2\2\2+\3\2\2\2\2-\3\2\2\2")
+        buf.write("\2/\3\2\2\2\2\61\3\2\2\2\2\63\3\2\2\2\2\65\3\2\2\2\2\67")
+        buf.write("\3\2\2\2\29\3\2\2\2\2;\3\2\2\2\2=\3\2\2\2\2?\3\2\2\2\2")
+        buf.write("A\3\2\2\2\2C\3\2\2\2\2E\3\2\2\2\2G\3\2\2\2\2I\3\2\2\2")
+        buf.write("\2K\3\2\2\2\2M\3\2\2\2\2O\3\2\2\2\2Q\3\2\2\2\2S\3\2\2")
+        buf.write("\2\2U\3\2\2\2\2W\3\2\2\2\2Y\3\2\2\2\2[\3\2\2\2\2]\3\2")
+        buf.write("\2\2\2_\3\2\2\2\2a\3\2\2\2\2c\3\2\2\2\2e\3\2\2\2\2g\3")
+        buf.write("\2\2\2\2i\3\2\2\2\2k\3\2\2\2\2m\3\2\2\2\2o\3\2\2\2\2q")
+        buf.write("\3\2\2\2\3\u00d9\3\2\2\2\3\u00db\3\2\2\2\3\u00dd\3\2\2")
+        buf.write("\2\3\u00df\3\2\2\2\3\u00e1\3\2\2\2\3\u00e3\3\2\2\2\3\u00e5")
+        buf.write("\3\2\2\2\4\u00e7\3\2\2\2\4\u00e9\3\2\2\2\4\u00eb\3\2\2")
+        buf.write("\2\4\u00ed\3\2\2\2\4\u00ef\3\2\2\2\4\u00f1\3\2\2\2\4\u00f3")
+        buf.write("\3\2\2\2\4\u00f5\3\2\2\2\4\u00f7\3\2\2\2\4\u00f9\3\2\2")
+        buf.write("\2\5\u00fb\3\2\2\2\5\u00fd\3\2\2\2\5\u00ff\3\2\2\2\5\u0101")
+        buf.write("\3\2\2\2\5\u0103\3\2\2\2\5\u0105\3\2\2\2\5\u0107\3\2\2")
+        buf.write("\2\5\u0109\3\2\2\2\5\u010b\3\2\2\2\5\u010d\3\2\2\2\5\u010f")
+        buf.write("\3\2\2\2\5\u0111\3\2\2\2\5\u0113\3\2\2\2\6\u0115\3\2\2")
+        buf.write("\2\6\u0117\3\2\2\2\6\u0119\3\2\2\2\6\u011b\3\2\2\2\6\u011d")
+        buf.write("\3\2\2\2\6\u011f\3\2\2\2\6\u0121\3\2\2\2\6\u0123\3\2\2")
+        buf.write("\2\6\u0125\3\2\2\2\7\u0127\3\2\2\2\7\u0129\3\2\2\2\7\u012b")
+        buf.write("\3\2\2\2\7\u012d\3\2\2\2\7\u012f\3\2\2\2\7\u0131\3\2\2")
+        buf.write("\2\7\u0133\3\2\2\2\7\u0135\3\2\2\2\7\u0137\3\2\2\2\b\u0139")
+        buf.write("\3\2\2\2\b\u013b\3\2\2\2\b\u013d\3\2\2\2\t\u0141\3\2\2")
+        buf.write("\2\13\u0143\3\2\2\2\r\u0147\3\2\2\2\17\u014b\3\2\2\2\21")
+        buf.write("\u014d\3\2\2\2\23\u014f\3\2\2\2\25\u0151\3\2\2\2\27\u0154")
+        buf.write("\3\2\2\2\31\u0158\3\2\2\2\33\u0162\3\2\2\2\35\u016b\3")
+        buf.write("\2\2\2\37\u0176\3\2\2\2!\u017d\3\2\2\2#\u0186\3\2\2\2")
+        buf.write("%\u018c\3\2\2\2\'\u0193\3\2\2\2)\u019b\3\2\2\2+\u01a5")
+        buf.write("\3\2\2\2-\u01ac\3\2\2\2/\u01b4\3\2\2\2\61\u01bc\3\2\2")
+        buf.write("\2\63\u01c3\3\2\2\2\65\u01ca\3\2\2\2\67\u01d0\3\2\2\2")
+        buf.write("9\u01d8\3\2\2\2;\u01dd\3\2\2\2=\u01df\3\2\2\2?\u01e1\3")
+        buf.write("\2\2\2A\u01e3\3\2\2\2C\u01e5\3\2\2\2E\u01e7\3\2\2\2G\u01e9")
+        buf.write("\3\2\2\2I\u01eb\3\2\2\2K\u01ed\3\2\2\2M\u01ef\3\2\2\2")
+        buf.write("O\u01f1\3\2\2\2Q\u01f3\3\2\2\2S\u01f5\3\2\2\2U\u01f7\3")
+        buf.write("\2\2\2W\u01f9\3\2\2\2Y\u01fb\3\2\2\2[\u01fd\3\2\2\2]\u01ff")
+        buf.write("\3\2\2\2_\u0201\3\2\2\2a\u0203\3\2\2\2c\u0205\3\2\2\2")
+        buf.write("e\u0207\3\2\2\2g\u0209\3\2\2\2i\u020b\3\2\2\2k\u0212\3")
+        buf.write("\2\2\2m\u0214\3\2\2\2o\u0217\3\2\2\2q\u021d\3\2\2\2s\u0223")
+        buf.write("\3\2\2\2u\u0225\3\2\2\2w\u0227\3\2\2\2y\u0229\3\2\2\2")
+        buf.write("{\u0237\3\2\2\2}\u0246\3\2\2\2\177\u024f\3\2\2\2\u0081")
+        buf.write("\u0256\3\2\2\2\u0083\u0259\3\2\2\2\u0085\u026e\3\2\2\2")
+        buf.write("\u0087\u0270\3\2\2\2\u0089\u0272\3\2\2\2\u008b\u027d\3")
+        buf.write("\2\2\2\u008d\u027f\3\2\2\2\u008f\u0286\3\2\2\2\u0091\u0290")
+        buf.write("\3\2\2\2\u0093\u029a\3\2\2\2\u0095\u02a6\3\2\2\2\u0097")
+        buf.write("\u02a8\3\2\2\2\u0099\u02aa\3\2\2\2\u009b\u02ac\3\2\2\2")
+        buf.write("\u009d\u02ae\3\2\2\2\u009f\u02b2\3\2\2\2\u00a1\u02b4\3")
+        buf.write("\2\2\2\u00a3\u02b6\3\2\2\2\u00a5\u02b9\3\2\2\2\u00a7\u02bb")
+        buf.write("\3\2\2\2\u00a9\u02bd\3\2\2\2\u00ab\u02bf\3\2\2\2\u00ad")
+        buf.write("\u02c1\3\2\2\2\u00af\u02c3\3\2\2\2\u00b1\u02c5\3\2\2\2")
+        buf.write("\u00b3\u02c7\3\2\2\2\u00b5\u02c9\3\2\2\2\u00b7\u02cc\3")
+        buf.write("\2\2\2\u00b9\u02ce\3\2\2\2\u00bb\u02d0\3\2\2\2\u00bd\u02d2")
+        buf.write("\3\2\2\2\u00bf\u02d4\3\2\2\2\u00c1\u02d6\3\2\2\2\u00c3")
+        buf.write("\u02d8\3\2\2\2\u00c5\u02db\3\2\2\2\u00c7\u02dd\3\2\2\2")
+        buf.write("\u00c9\u02df\3\2\2\2\u00cb\u02e1\3\2\2\2\u00cd\u02e3\3")
+        buf.write("\2\2\2\u00cf\u02e5\3\2\2\2\u00d1\u02e7\3\2\2\2\u00d3\u02ea")
+        buf.write("\3\2\2\2\u00d5\u02ec\3\2\2\2\u00d7\u02ee\3\2\2\2\u00d9")
+        buf.write("\u02f0\3\2\2\2\u00db\u02f5\3\2\2\2\u00dd\u02f9\3\2\2\2")
+        buf.write("\u00df\u02fd\3\2\2\2\u00e1\u0301\3\2\2\2\u00e3\u0304\3")
+        buf.write("\2\2\2\u00e5\u0308\3\2\2\2\u00e7\u030a\3\2\2\2\u00e9\u030f")
+        buf.write("\3\2\2\2\u00eb\u0313\3\2\2\2\u00ed\u0317\3\2\2\2\u00ef")
+        buf.write("\u031b\3\2\2\2\u00f1\u031f\3\2\2\2\u00f3\u0323\3\2\2\2")
+        buf.write("\u00f5\u0327\3\2\2\2\u00f7\u032a\3\2\2\2\u00f9\u032e\3")
+        buf.write("\2\2\2\u00fb\u0330\3\2\2\2\u00fd\u0335\3\2\2\2\u00ff\u033a")
+        buf.write("\3\2\2\2\u0101\u033f\3\2\2\2\u0103\u0343\3\2\2\2\u0105")
+        buf.write("\u0348\3\2\2\2\u0107\u034c\3\2\2\2\u0109\u0350\3\2\2\2")
+        buf.write("\u010b\u0354\3\2\2\2\u010d\u0358\3\2\2\2\u010f\u035c\3")
+        buf.write("\2\2\2\u0111\u0360\3\2\2\2\u0113\u0365\3\2\2\2\u0115\u036c")
+        buf.write("\3\2\2\2\u0117\u0371\3\2\2\2\u0119\u0376\3\2\2\2\u011b")
+        buf.write("\u037b\3\2\2\2\u011d\u037f\3\2\2\2\u011f\u0384\3\2\2\2")
+        buf.write("\u0121\u0388\3\2\2\2\u0123\u038c\3\2\2\2\u0125\u0391\3")
+        buf.write("\2\2\2\u0127\u0398\3\2\2\2\u0129\u039d\3\2\2\2\u012b\u03a2")
+        buf.write("\3\2\2\2\u012d\u03a7\3\2\2\2\u012f\u03ab\3\2\2\2\u0131")
+        buf.write("\u03b0\3\2\2\2\u0133\u03b4\3\2\2\2\u0135\u03b8\3\2\2\2")
+        buf.write("\u0137\u03bd\3\2\2\2\u0139\u03c6\3\2\2\2\u013b\u03cc\3")
+        buf.write("\2\2\2\u013d\u03d0\3\2\2\2\u013f\u03d4\3\2\2\2\u0141\u0142")
+        buf.write("\5{;\2\u0142\n\3\2\2\2\u0143\u0144\5y:\2\u0144\u0145\3")
+        buf.write("\2\2\2\u0145\u0146\b\3\2\2\u0146\f\3\2\2\2\u0147\u0148")
+        buf.write("\5}<\2\u0148\u0149\3\2\2\2\u0149\u014a\b\4\2\2\u014a\16")
+        buf.write("\3\2\2\2\u014b\u014c\5\u0085@\2\u014c\20\3\2\2\2\u014d")
+        buf.write("\u014e\5\u008fE\2\u014e\22\3\2\2\2\u014f\u0150\5\u0093")
+        buf.write("G\2\u0150\24\3\2\2\2\u0151\u0152\5\u00b1V\2\u0152\u0153")
+        buf.write("\b\b\3\2\u0153\26\3\2\2\2\u0154\u0155\5\u00adT\2\u0155")
+        buf.write("\u0156\3\2\2\2\u0156\u0157\b\t\4\2\u0157\30\3\2\2\2\u0158")
+        buf.write("\u0159\7q\2\2\u0159\u015a\7r\2\2\u015a\u015b\7v\2\2\u015b")
+        buf.write("\u015c\7k\2\2\u015c\u015d\7q\2\2\u015d\u015e\7p\2\2\u015e")
+        buf.write("\u015f\7u\2\2\u015f\u0160\3\2\2\2\u0160\u0161\b\n\5\2")
+        buf.write("\u0161\32\3\2\2\2\u0162\u0163\7v\2\2\u0163\u0164\7q\2")
+        buf.write("\2\u0164\u0165\7m\2\2\u0165\u0166\7g\2\2\u0166\u0167\7")
+        buf.write("p\2\2\u0167\u0168\7u\2\2\u0168\u0169\3\2\2\2\u0169\u016a")
+        buf.write("\b\13\6\2\u016a\34\3\2\2\2\u016b\u016c\7e\2\2\u016c\u016d")
+        buf.write("\7j\2\2\u016d\u016e\7c\2\2\u016e\u016f\7p\2\2\u016f\u0170")
+        buf.write("\7p\2\2\u0170\u0171\7g\2\2\u0171\u0172\7n\2\2\u0172\u0173")
+        buf.write("\7u\2\2\u0173\u0174\3\2\2\2\u0174\u0175\b\f\7\2\u0175")
+        buf.write("\36\3\2\2\2\u0176\u0177\7k\2\2\u0177\u0178\7o\2\2\u0178")
+        buf.write("\u0179\7r\2\2\u0179\u017a\7q\2\2\u017a\u017b\7t\2\2\u017b")
+        buf.write("\u017c\7v\2\2\u017c \3\2\2\2\u017d\u017e\7h\2\2\u017e")
+        buf.write("\u017f\7t\2\2\u017f\u0180\7c\2\2\u0180\u0181\7i\2\2\u0181")
+        buf.write("\u0182\7o\2\2\u0182\u0183\7g\2\2\u0183\u0184\7p\2\2\u0184")
+        buf.write("\u0185\7v\2\2\u0185\"\3\2\2\2\u0186\u0187\7n\2\2\u0187")
+        buf.write("\u0188\7g\2\2\u0188\u0189\7z\2\2\u0189\u018a\7g\2\2\u018a")
+        buf.write("\u018b\7t\2\2\u018b$\3\2\2\2\u018c\u018d\7r\2\2\u018d")
+        buf.write("\u018e\7c\2\2\u018e\u018f\7t\2\2\u018f\u0190\7u\2\2\u0190")
+        buf.write("\u0191\7g\2\2\u0191\u0192\7t\2\2\u0192&\3\2\2\2\u0193")
+        buf.write("\u0194\7i\2\2\u0194\u0195\7t\2\2\u0195\u0196\7c\2\2\u0196")
+        buf.write("\u0197\7o\2\2\u0197\u0198\7o\2\2\u0198\u0199\7c\2\2\u0199")
+        buf.write("\u019a\7t\2\2\u019a(\3\2\2\2\u019b\u019c\7r\2\2\u019c")
+        buf.write("\u019d\7t\2\2\u019d\u019e\7q\2\2\u019e\u019f\7v\2\2\u019f")
+        buf.write("\u01a0\7g\2\2\u01a0\u01a1\7e\2\2\u01a1\u01a2\7v\2\2\u01a2")
+        buf.write("\u01a3\7g\2\2\u01a3\u01a4\7f\2\2\u01a4*\3\2\2\2\u01a5")
+        buf.write("\u01a6\7r\2\2\u01a6\u01a7\7w\2\2\u01a7\u01a8\7d\2\2\u01a8")
+        buf.write("\u01a9\7n\2\2\u01a9\u01aa\7k\2\2\u01aa\u01ab\7e\2\2\u01ab")
+        buf.write(",\3\2\2\2\u01ac\u01ad\7r\2\2\u01ad\u01ae\7t\2\2\u01ae")
+        buf.write("\u01af\7k\2\2\u01af\u01b0\7x\2\2\u01b0\u01b1\7c\2\2\u01b1")
+        buf.write("\u01b2\7v\2\2\u01b2\u01b3\7g\2\2\u01b3.\3\2\2\2\u01b4")
+        buf.write("\u01b5\7t\2\2\u01b5\u01b6\7g\2\2\u01b6\u01b7\7v\2\2\u01b7")
+        buf.write("\u01b8\7w\2\2\u01b8\u01b9\7t\2\2\u01b9\u01ba\7p\2\2\u01ba")
+        buf.write("\u01bb\7u\2\2\u01bb\60\3\2\2\2\u01bc\u01bd\7n\2\2\u01bd")
+        buf.write("\u01be\7q\2\2\u01be\u01bf\7e\2\2\u01bf\u01c0\7c\2\2\u01c0")
+        buf.write("\u01c1\7n\2\2\u01c1\u01c2\7u\2\2\u01c2\62\3\2\2\2\u01c3")
+        buf.write("\u01c4\7v\2\2\u01c4\u01c5\7j\2\2\u01c5\u01c6\7t\2\2\u01c6")
+        buf.write("\u01c7\7q\2\2\u01c7\u01c8\7y\2\2\u01c8\u01c9\7u\2\2\u01c9")
+        buf.write("\64\3\2\2\2\u01ca\u01cb\7e\2\2\u01cb\u01cc\7c\2\2\u01cc")
+        buf.write("\u01cd\7v\2\2\u01cd\u01ce\7e\2\2\u01ce\u01cf\7j\2\2\u01cf")
+        buf.write("\66\3\2\2\2\u01d0\u01d1\7h\2\2\u01d1\u01d2\7k\2\2\u01d2")
+        buf.write("\u01d3\7p\2\2\u01d3\u01d4\7c\2\2\u01d4\u01d5\7n\2\2\u01d5")
+        buf.write("\u01d6\7n\2\2\u01d6\u01d7\7{\2\2\u01d78\3\2\2\2\u01d8")
+        buf.write("\u01d9\7o\2\2\u01d9\u01da\7q\2\2\u01da\u01db\7f\2\2\u01db")
+        buf.write("\u01dc\7g\2\2\u01dc:\3\2\2\2\u01dd\u01de\5\u00a1N\2\u01de")
+        buf.write("<\3\2\2\2\u01df\u01e0\5\u00a3O\2\u01e0>\3\2\2\2\u01e1")
+        buf.write("\u01e2\5\u00cbc\2\u01e2@\3\2\2\2\u01e3\u01e4\5\u00cdd")
+        buf.write("\2\u01e4B\3\2\2\2\u01e5\u01e6\5\u00a9R\2\u01e6D\3\2\2")
+        buf.write("\2\u01e7\u01e8\5\u00abS\2\u01e8F\3\2\2\2\u01e9\u01ea\5")
+        buf.write("\u00adT\2\u01eaH\3\2\2\2\u01eb\u01ec\5\u00afU\2\u01ec")
+        buf.write("J\3\2\2\2\u01ed\u01ee\5\u00b5X\2\u01eeL\3\2\2\2\u01ef")
+        buf.write("\u01f0\5\u00b7Y\2\u01f0N\3\2\2\2\u01f1\u01f2\5\u00b9Z")
+        buf.write("\2\u01f2P\3\2\2\2\u01f3\u01f4\5\u00bb[\2\u01f4R\3\2\2")
+        buf.write("\2\u01f5\u01f6\5\u00bd\\\2\u01f6T\3\2\2\2\u01f7\u01f8")
+        buf.write("\5\u00bf]\2\u01f8V\3\2\2\2\u01f9\u01fa\5\u00c3_\2\u01fa")
+        buf.write("X\3\2\2\2\u01fb\u01fc\5\u00c1^\2\u01fcZ\3\2\2\2\u01fd")
+        buf.write("\u01fe\5\u00c7a\2\u01fe\\\3\2\2\2\u01ff\u0200\5\u00c9")
+        buf.write("b\2\u0200^\3\2\2\2\u0201\u0202\5\u00d1f\2\u0202`\3\2\2")
+        buf.write("\2\u0203\u0204\5\u00cfe\2\u0204b\3\2\2\2\u0205\u0206\5")
+        buf.write("\u00d3g\2\u0206d\3\2\2\2\u0207\u0208\5\u00d5h\2\u0208")
+        buf.write("f\3\2\2\2\u0209\u020a\5\u00d7i\2\u020ah\3\2\2\2\u020b")
+        buf.write("\u020f\5\u0099J\2\u020c\u020e\5\u0095H\2\u020d\u020c\3")
+        buf.write("\2\2\2\u020e\u0211\3\2\2\2\u020f\u020d\3\2\2\2\u020f\u0210")
+        buf.write("\3\2\2\2\u0210j\3\2\2\2\u0211\u020f\3\2\2\2\u0212\u0213")
+        buf.write("\5m\64\2\u0213l\3\2\2\2\u0214\u0215\5\u013f\u009d\2\u0215")
+        buf.write("n\3\2\2\2\u0216\u0218\5s\67\2\u0217\u0216\3\2\2\2\u0218")
+        buf.write("\u0219\3\2\2\2\u0219\u0217\3\2\2\2\u0219\u021a\3\2\2\2")
+        buf.write("\u021a\u021b\3\2\2\2\u021b\u021c\b\65\2\2\u021cp\3\2\2")
+        buf.write("\2\u021d\u021e\13\2\2\2\u021e\u021f\3\2\2\2\u021f\u0220")
+        buf.write("\b\66\b\2\u0220r\3\2\2\2\u0221\u0224\5u8\2\u0222\u0224")
+        buf.write("\5w9\2\u0223\u0221\3\2\2\2\u0223\u0222\3\2\2\2\u0224t")
+        buf.write("\3\2\2\2\u0225\u0226\t\2\2\2\u0226v\3\2\2\2\u0227\u0228")
+        buf.write("\t\3\2\2\u0228x\3\2\2\2\u0229\u022a\7\61\2\2\u022a\u022b")
+        buf.write("\7,\2\2\u022b\u022f\3\2\2\2\u022c\u022e\13\2\2\2\u022d")
+        buf.write("\u022c\3\2\2\2\u022e\u0231\3\2\2\2\u022f\u0230\3\2\2\2")
+        buf.write("\u022f\u022d\3\2\2\2\u0230\u0235\3\2\2\2\u0231\u022f\3")
+        buf.write("\2\2\2\u0232\u0233\7,\2\2\u0233\u0236\7\61\2\2\u0234\u0236")
+        buf.write("\7\2\2\3\u0235\u0232\3\2\2\2\u0235\u0234\3\2\2\2\u0236")
+        buf.write("z\3\2\2\2\u0237\u0238\7\61\2\2\u0238\u0239\7,\2\2\u0239")
+        buf.write("\u023a\7,\2\2\u023a\u023e\3\2\2\2\u023b\u023d\13\2\2\2")
+        buf.write("\u023c\u023b\3\2\2\2\u023d\u0240\3\2\2\2\u023e\u023f\3")
+        buf.write("\2\2\2\u023e\u023c\3\2\2\2\u023f\u0244\3\2\2\2\u0240\u023e")
+        buf.write("\3\2\2\2\u0241\u0242\7,\2\2\u0242\u0245\7\61\2\2\u0243")
+        buf.write("\u0245\7\2\2\3\u0244\u0241\3\2\2\2\u0244\u0243\3\2\2\2")
+        buf.write("\u0245|\3\2\2\2\u0246\u0247\7\61\2\2\u0247\u0248\7\61")
+        buf.write("\2\2\u0248\u024c\3\2\2\2\u0249\u024b\n\4\2\2\u024a\u0249")
+        buf.write("\3\2\2\2\u024b\u024e\3\2\2\2\u024c\u024a\3\2\2\2\u024c")
+        buf.write("\u024d\3\2\2\2\u024d~\3\2\2\2\u024e\u024c\3\2\2\2\u024f")
+        buf.write("\u0254\5\u009fM\2\u0250\u0255\t\5\2\2\u0251\u0255\5\u0083")
+        buf.write("?\2\u0252\u0255\13\2\2\2\u0253\u0255\7\2\2\3\u0254\u0250")
+        buf.write("\3\2\2\2\u0254\u0251\3\2\2\2\u0254\u0252\3\2\2\2\u0254")
+        buf.write("\u0253\3\2\2\2\u0255\u0080\3\2\2\2\u0256\u0257\5\u009f")
+        buf.write("M\2\u0257\u0258\13\2\2\2\u0258\u0082\3\2\2\2\u0259\u0264")
+        buf.write("\7w\2\2\u025a\u0262\5\u0087A\2\u025b\u0260\5\u0087A\2")
+        buf.write("\u025c\u025e\5\u0087A\2\u025d\u025f\5\u0087A\2\u025e\u025d")
+        buf.write("\3\2\2\2\u025e\u025f\3\2\2\2\u025f\u0261\3\2\2\2\u0260")
+        buf.write("\u025c\3\2\2\2\u0260\u0261\3\2\2\2\u0261\u0263\3\2\2\2")
+        buf.write("\u0262\u025b\3\2\2\2\u0262\u0263\3\2\2\2\u0263\u0265\3")
+        buf.write("\2\2\2\u0264\u025a\3\2\2\2\u0264\u0265\3\2\2\2\u0265\u0084")
+        buf.write("\3\2\2\2\u0266\u026f\7\62\2\2\u0267\u026b\t\6\2\2\u0268")
+        buf.write("\u026a\5\u0089B\2\u0269\u0268\3\2\2\2\u026a\u026d\3\2")
+        buf.write("\2\2\u026b\u0269\3\2\2\2\u026b\u026c\3\2\2\2\u026c\u026f")
+        buf.write("\3\2\2\2\u026d\u026b\3\2\2\2\u026e\u0266\3\2\2\2\u026e")
+        buf.write("\u0267\3\2\2\2\u026f\u0086\3\2\2\2\u0270\u0271\t\7\2\2")
+        buf.write("\u0271\u0088\3\2\2\2\u0272\u0273\t\b\2\2\u0273\u008a\3")
+        buf.write("\2\2\2\u0274\u0275\7v\2\2\u0275\u0276\7t\2\2\u0276\u0277")
+        buf.write("\7w\2\2\u0277\u027e\7g\2\2\u0278\u0279\7h\2\2\u0279\u027a")
+        buf.write("\7c\2\2\u027a\u027b\7n\2\2\u027b\u027c\7u\2\2\u027c\u027e")
+        buf.write("\7g\2\2\u027d\u0274\3\2\2\2\u027d\u0278\3\2\2\2\u027e")
+        buf.write("\u008c\3\2\2\2\u027f\u0282\5\u00a5P\2\u0280\u0283\5\177")
+        buf.write("=\2\u0281\u0283\n\t\2\2\u0282\u0280\3\2\2\2\u0282\u0281")
+        buf.write("\3\2\2\2\u0283\u0284\3\2\2\2\u0284\u0285\5\u00a5P\2\u0285")
+        buf.write("\u008e\3\2\2\2\u0286\u028b\5\u00a5P\2\u0287\u028a\5\177")
+        buf.write("=\2\u0288\u028a\n\t\2\2\u0289\u0287\3\2\2\2\u0289\u0288")
+        buf.write("\3\2\2\2\u028a\u028d\3\2\2\2\u028b\u0289\3\2\2\2\u028b")
+        buf.write("\u028c\3\2\2\2\u028c\u028e\3\2\2\2\u028d\u028b\3\2\2\2")
+        buf.write("\u028e\u028f\5\u00a5P\2\u028f\u0090\3\2\2\2\u0290\u0295")
+        buf.write("\5\u00a7Q\2\u0291\u0294\5\177=\2\u0292\u0294\n\n\2\2\u0293")
+        buf.write("\u0291\3\2\2\2\u0293\u0292\3\2\2\2\u0294\u0297\3\2\2\2")
+        buf.write("\u0295\u0293\3\2\2\2\u0295\u0296\3\2\2\2\u0296\u0298\3")
+        buf.write("\2\2\2\u0297\u0295\3\2\2\2\u0298\u0299\5\u00a7Q\2\u0299")
+        buf.write("\u0092\3\2\2\2\u029a\u029f\5\u00a5P\2\u029b\u029e\5\177")
+        buf.write("=\2\u029c\u029e\n\t\2\2\u029d\u029b\3\2\2\2\u029d\u029c")
+        buf.write("\3\2\2\2\u029e\u02a1\3\2\2\2\u029f\u029d\3\2\2\2\u029f")
+        buf.write("\u02a0\3\2\2\2\u02a0\u0094\3\2\2\2\u02a1\u029f\3\2\2\2")
+        buf.write("\u02a2\u02a7\5\u0097I\2\u02a3\u02a7\4\62;\2\u02a4\u02a7")
+        buf.write("\5\u00c5`\2\u02a5\u02a7\t\13\2\2\u02a6\u02a2\3\2\2\2\u02a6")
+        buf.write("\u02a3\3\2\2\2\u02a6\u02a4\3\2\2\2\u02a6\u02a5\3\2\2\2")
+        buf.write("\u02a7\u0096\3\2\2\2\u02a8\u02a9\t\f\2\2\u02a9\u0098\3")
+        buf.write("\2\2\2\u02aa\u02ab\t\r\2\2\u02ab\u009a\3\2\2\2\u02ac\u02ad")
+        buf.write("\t\r\2\2\u02ad\u009c\3\2\2\2\u02ae\u02af\7k\2\2\u02af")
+        buf.write("\u02b0\7p\2\2\u02b0\u02b1\7v\2\2\u02b1\u009e\3\2\2\2\u02b2")
+        buf.write("\u02b3\7^\2\2\u02b3\u00a0\3\2\2\2\u02b4\u02b5\7<\2\2\u02b5")
+        buf.write("\u00a2\3\2\2\2\u02b6\u02b7\7<\2\2\u02b7\u02b8\7<\2\2\u02b8")
+        buf.write("\u00a4\3\2\2\2\u02b9\u02ba\7)\2\2\u02ba\u00a6\3\2\2\2")
+        buf.write("\u02bb\u02bc\7$\2\2\u02bc\u00a8\3\2\2\2\u02bd\u02be\7")
+        buf.write("*\2\2\u02be\u00aa\3\2\2\2\u02bf\u02c0\7+\2\2\u02c0\u00ac")
+        buf.write("\3\2\2\2\u02c1\u02c2\7}\2\2\u02c2\u00ae\3\2\2\2\u02c3")
+        buf.write("\u02c4\7\177\2\2\u02c4\u00b0\3\2\2\2\u02c5\u02c6\7]\2")
+        buf.write("\2\u02c6\u00b2\3\2\2\2\u02c7\u02c8\7_\2\2\u02c8\u00b4")
+        buf.write("\3\2\2\2\u02c9\u02ca\7/\2\2\u02ca\u02cb\7@\2\2\u02cb\u00b6")
+        buf.write("\3\2\2\2\u02cc\u02cd\7>\2\2\u02cd\u00b8\3\2\2\2\u02ce")
+        buf.write("\u02cf\7@\2\2\u02cf\u00ba\3\2\2\2\u02d0\u02d1\7?\2\2\u02d1")
+        buf.write("\u00bc\3\2\2\2\u02d2\u02d3\7A\2\2\u02d3\u00be\3\2\2\2")
+        buf.write("\u02d4\u02d5\7,\2\2\u02d5\u00c0\3\2\2\2\u02d6\u02d7\7")
+        buf.write("-\2\2\u02d7\u00c2\3\2\2\2\u02d8\u02d9\7-\2\2\u02d9\u02da")
+        buf.write("\7?\2\2\u02da\u00c4\3\2\2\2\u02db\u02dc\7a\2\2\u02dc\u00c6")
+        buf.write("\3\2\2\2\u02dd\u02de\7~\2\2\u02de\u00c8\3\2\2\2\u02df")
+        buf.write("\u02e0\7&\2\2\u02e0\u00ca\3\2\2\2\u02e1\u02e2\7.\2\2\u02e2")
+        buf.write("\u00cc\3\2\2\2\u02e3\u02e4\7=\2\2\u02e4\u00ce\3\2\2\2")
+        buf.write("\u02e5\u02e6\7\60\2\2\u02e6\u00d0\3\2\2\2\u02e7\u02e8")
+        buf.write("\7\60\2\2\u02e8\u02e9\7\60\2\2\u02e9\u00d2\3\2\2\2\u02ea")
+        buf.write("\u02eb\7B\2\2\u02eb\u00d4\3\2\2\2\u02ec\u02ed\7%\2\2\u02ed")
+        buf.write("\u00d6\3\2\2\2\u02ee\u02ef\7\u0080\2\2\u02ef\u00d8\3\2")
+        buf.write("\2\2\u02f0\u02f1\5\u00b1V\2\u02f1\u02f2\3\2\2\2\u02f2")
+        buf.write("\u02f3\bj\t\2\u02f3\u02f4\bj\n\2\u02f4\u00da\3\2\2\2\u02f5")
+        buf.write("\u02f6\5\u0081>\2\u02f6\u02f7\3\2\2\2\u02f7\u02f8\bk\t")
+        buf.write("\2\u02f8\u00dc\3\2\2\2\u02f9\u02fa\5\u0091F\2\u02fa\u02fb")
+        buf.write("\3\2\2\2\u02fb\u02fc\bl\t\2\u02fc\u00de\3\2\2\2\u02fd")
+        buf.write("\u02fe\5\u008fE\2\u02fe\u02ff\3\2\2\2\u02ff\u0300\bm\t")
+        buf.write("\2\u0300\u00e0\3\2\2\2\u0301\u0302\5\u00b3W\2\u0302\u0303")
+        buf.write("\bn\13\2\u0303\u00e2\3\2\2\2\u0304\u0305\7\2\2\3\u0305")
+        buf.write("\u0306\3\2\2\2\u0306\u0307\bo\f\2\u0307\u00e4\3\2\2\2")
+        buf.write("\u0308\u0309\13\2\2\2\u0309\u00e6\3\2\2\2\u030a\u030b")
+        buf.write("\5\u00adT\2\u030b\u030c\3\2\2\2\u030c\u030d\bq\r\2\u030d")
+        buf.write("\u030e\bq\4\2\u030e\u00e8\3\2\2\2\u030f\u0310\5\u0081")
+        buf.write(">\2\u0310\u0311\3\2\2\2\u0311\u0312\br\r\2\u0312\u00ea")
+        buf.write("\3\2\2\2\u0313\u0314\5\u0091F\2\u0314\u0315\3\2\2\2\u0315")
+        buf.write("\u0316\bs\r\2\u0316\u00ec\3\2\2\2\u0317\u0318\5\u008f")
+        buf.write("E\2\u0318\u0319\3\2\2\2\u0319\u031a\bt\r\2\u031a\u00ee")
+        buf.write("\3\2\2\2\u031b\u031c\5{;\2\u031c\u031d\3\2\2\2\u031d\u031e")
+        buf.write("\bu\r\2\u031e\u00f0\3\2\2\2\u031f\u0320\5y:\2\u0320\u0321")
+        buf.write("\3\2\2\2\u0321\u0322\bv\r\2\u0322\u00f2\3\2\2\2\u0323")
+        buf.write("\u0324\5}<\2\u0324\u0325\3\2\2\2\u0325\u0326\bw\r\2\u0326")
+        buf.write("\u00f4\3\2\2\2\u0327\u0328\5\u00afU\2\u0328\u0329\bx\16")
+        buf.write("\2\u0329\u00f6\3\2\2\2\u032a\u032b\7\2\2\3\u032b\u032c")
+        buf.write("\3\2\2\2\u032c\u032d\by\f\2\u032d\u00f8\3\2\2\2\u032e")
+        buf.write("\u032f\13\2\2\2\u032f\u00fa\3\2\2\2\u0330\u0331\5{;\2")
+        buf.write("\u0331\u0332\3\2\2\2\u0332\u0333\b{\17\2\u0333\u0334\b")
+        buf.write("{\2\2\u0334\u00fc\3\2\2\2\u0335\u0336\5y:\2\u0336\u0337")
+        buf.write("\3\2\2\2\u0337\u0338\b|\20\2\u0338\u0339\b|\2\2\u0339")
+        buf.write("\u00fe\3\2\2\2\u033a\u033b\5}<\2\u033b\u033c\3\2\2\2\u033c")
+        buf.write("\u033d\b}\21\2\u033d\u033e\b}\2\2\u033e\u0100\3\2\2\2")
+        buf.write("\u033f\u0340\5\u00adT\2\u0340\u0341\3\2\2\2\u0341\u0342")
+        buf.write("\b~\22\2\u0342\u0102\3\2\2\2\u0343\u0344\5\u00afU\2\u0344")
+        buf.write("\u0345\3\2\2\2\u0345\u0346\b\177\23\2\u0346\u0347\b\177")
+        buf.write("\f\2\u0347\u0104\3\2\2\2\u0348\u0349\5\u013f\u009d\2\u0349")
+        buf.write("\u034a\3\2\2\2\u034a\u034b\b\u0080\24\2\u034b\u0106\3")
+        buf.write("\2\2\2\u034c\u034d\5\u00cfe\2\u034d\u034e\3\2\2\2\u034e")
+        buf.write("\u034f\b\u0081\25\2\u034f\u0108\3\2\2\2\u0350\u0351\5")
+        buf.write("\u00bb[\2\u0351\u0352\3\2\2\2\u0352\u0353\b\u0082\26\2")
+        buf.write("\u0353\u010a\3\2\2\2\u0354\u0355\5\u008fE\2\u0355\u0356")
+        buf.write("\3\2\2\2\u0356\u0357\b\u0083\27\2\u0357\u010c\3\2\2\2")
+        buf.write("\u0358\u0359\5\u009dL\2\u0359\u035a\3\2\2\2\u035a\u035b")
+        buf.write("\b\u0084\30\2\u035b\u010e\3\2\2\2\u035c\u035d\5\u00bf")
+        buf.write("]\2\u035d\u035e\3\2\2\2\u035e\u035f\b\u0085\31\2\u035f")
+        buf.write("\u0110\3\2\2\2\u0360\u0361\5\u00cdd\2\u0361\u0362\3\2")
+        buf.write("\2\2\u0362\u0363\b\u0086\32\2\u0363\u0112\3\2\2\2\u0364")
+        buf.write("\u0366\5s\67\2\u0365\u0364\3\2\2\2\u0366\u0367\3\2\2\2")
+        buf.write("\u0367\u0365\3\2\2\2\u0367\u0368\3\2\2\2\u0368\u0369\3")
+        buf.write("\2\2\2\u0369\u036a\b\u0087\33\2\u036a\u036b\b\u0087\2")
+        buf.write("\2\u036b\u0114\3\2\2\2\u036c\u036d\5{;\2\u036d\u036e\3")
+        buf.write("\2\2\2\u036e\u036f\b\u0088\17\2\u036f\u0370\b\u0088\2")
+        buf.write("\2\u0370\u0116\3\2\2\2\u0371\u0372\5y:\2\u0372\u0373\3")
+        buf.write("\2\2\2\u0373\u0374\b\u0089\20\2\u0374\u0375\b\u0089\2")
+        buf.write("\2\u0375\u0118\3\2\2\2\u0376\u0377\5}<\2\u0377\u0378\3")
+        buf.write("\2\2\2\u0378\u0379\b\u008a\21\2\u0379\u037a\b\u008a\2")
+        buf.write("\2\u037a\u011a\3\2\2\2\u037b\u037c\5\u00adT\2\u037c\u037d")
+        buf.write("\3\2\2\2\u037d\u037e\b\u008b\22\2\u037e\u011c\3\2\2\2")
+        buf.write("\u037f\u0380\5\u00afU\2\u0380\u0381\3\2\2\2\u0381\u0382")
+        buf.write("\b\u008c\23\2\u0382\u0383\b\u008c\f\2\u0383\u011e\3\2")
+        buf.write("\2\2\u0384\u0385\5\u013f\u009d\2\u0385\u0386\3\2\2\2\u0386")
+        buf.write("\u0387\b\u008d\24\2\u0387\u0120\3\2\2\2\u0388\u0389\5")
+        buf.write("\u00cfe\2\u0389\u038a\3\2\2\2\u038a\u038b\b\u008e\25\2")
+        buf.write("\u038b\u0122\3\2\2\2\u038c\u038d\5\u00cbc\2\u038d\u038e")
+        buf.write("\3\2\2\2\u038e\u038f\b\u008f\34\2\u038f\u0124\3\2\2\2")
+        buf.write("\u0390\u0392\5s\67\2\u0391\u0390\3\2\2\2\u0392\u0393\3")
+        buf.write("\2\2\2\u0393\u0391\3\2\2\2\u0393\u0394\3\2\2\2\u0394\u0395")
+        buf.write("\3\2\2\2\u0395\u0396\b\u0090\33\2\u0396\u0397\b\u0090")
+        buf.write("\2\2\u0397\u0126\3\2\2\2\u0398\u0399\5{;\2\u0399\u039a")
+        buf.write("\3\2\2\2\u039a\u039b\b\u0091\17\2\u039b\u039c\b\u0091")
+        buf.write("\2\2\u039c\u0128\3\2\2\2\u039d\u039e\5y:\2\u039e\u039f")
+        buf.write("\3\2\2\2\u039f\u03a0\b\u0092\20\2\u03a0\u03a1\b\u0092")
+        buf.write("\2\2\u03a1\u012a\3\2\2\2\u03a2\u03a3\5}<\2\u03a3\u03a4")
+        buf.write("\3\2\2\2\u03a4\u03a5\b\u0093\21\2\u03a5\u03a6\b\u0093")
+        buf.write("\2\2\u03a6\u012c\3\2\2\2\u03a7\u03a8\5\u00adT\2\u03a8")
+        buf.write("\u03a9\3\2\2\2\u03a9\u03aa\b\u0094\22\2\u03aa\u012e\3")
+        buf.write("\2\2\2\u03ab\u03ac\5\u00afU\2\u03ac\u03ad\3\2\2\2\u03ad")
+        buf.write("\u03ae\b\u0095\23\2\u03ae\u03af\b\u0095\f\2\u03af\u0130")
+        buf.write("\3\2\2\2\u03b0\u03b1\5\u013f\u009d\2\u03b1\u03b2\3\2\2")
+        buf.write("\2\u03b2\u03b3\b\u0096\24\2\u03b3\u0132\3\2\2\2\u03b4")
+        buf.write("\u03b5\5\u00cfe\2\u03b5\u03b6\3\2\2\2\u03b6\u03b7\b\u0097")
+        buf.write("\25\2\u03b7\u0134\3\2\2\2\u03b8\u03b9\5\u00cbc\2\u03b9")
+        buf.write("\u03ba\3\2\2\2\u03ba\u03bb\b\u0098\34\2\u03bb\u0136\3")
+        buf.write("\2\2\2\u03bc\u03be\5s\67\2\u03bd\u03bc\3\2\2\2\u03be\u03bf")
+        buf.write("\3\2\2\2\u03bf\u03bd\3\2\2\2\u03bf\u03c0\3\2\2\2\u03c0")
+        buf.write("\u03c1\3\2\2\2\u03c1\u03c2\b\u0099\33\2\u03c2\u03c3\b")
+        buf.write("\u0099\2\2\u03c3\u0138\3\2\2\2\u03c4\u03c7\n\16\2\2\u03c5")
+        buf.write("\u03c7\5\u0081>\2\u03c6\u03c4\3\2\2\2\u03c6\u03c5\3\2")
+        buf.write("\2\2\u03c7\u03c8\3\2\2\2\u03c8\u03c6\3\2\2\2\u03c8\u03c9")
+        buf.write("\3\2\2\2\u03c9\u03ca\3\2\2\2\u03ca\u03cb\b\u009a\35\2")
+        buf.write("\u03cb\u013a\3\2\2\2\u03cc\u03cd\5\u00b3W\2\u03cd\u03ce")
+        buf.write("\3\2\2\2\u03ce\u03cf\b\u009b\f\2\u03cf\u013c\3\2\2\2\u03d0")
+        buf.write("\u03d1\7\2\2\3\u03d1\u03d2\3\2\2\2\u03d2\u03d3\b\u009c")
+        buf.write("\f\2\u03d3\u013e\3\2\2\2\u03d4\u03d8\5\u0097I\2\u03d5")
+        buf.write("\u03d7\5\u0095H\2\u03d6\u03d5\3\2\2\2\u03d7\u03da\3\2")
+        buf.write("\2\2\u03d8\u03d6\3\2\2\2\u03d8\u03d9\3\2\2\2\u03d9\u0140")
+        buf.write("\3\2\2\2\u03da\u03d8\3\2\2\2\'\2\3\4\5\6\7\b\u020f\u0219")
+        buf.write("\u0223\u022f\u0235\u023e\u0244\u024c\u0254\u025e\u0260")
+        buf.write("\u0262\u0264\u026b\u026e\u027d\u0282\u0289\u028b\u0293")
+        buf.write("\u0295\u029d\u029f\u02a6\u0367\u0393\u03bf\u03c6\u03c8")
+        buf.write("\u03d8\36\2\4\2\3\b\2\7\4\2\7\5\2\7\6\2\7\7\2\2\3\2\t")
+        buf.write(";\2\7\3\2\3n\3\6\2\2\t>\2\3x\4\t\6\2\t\7\2\t\b\2\t%\2")
+        buf.write("\t&\2\t\66\2\t\62\2\t*\2\t\n\2\t\t\2\t,\2\t\"\2\t\67\2")
+        buf.write("\t!\2\5\2\2")
+        return buf.getvalue()
+
+
+class ANTLRv4Lexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    OFF_CHANNEL = 2
+
+    Argument = 1
+    Action = 2
+    Options = 3
+    Tokens = 4
+    Channels = 5
+    LexerCharSet = 6
+
+    TOKEN_REF = 1
+    RULE_REF = 2
+    LEXER_CHAR_SET = 3
+    DOC_COMMENT = 4
+    BLOCK_COMMENT = 5
+    LINE_COMMENT = 6
+    INT = 7
+    STRING_LITERAL = 8
+    UNTERMINATED_STRING_LITERAL = 9
+    BEGIN_ARGUMENT = 10
+    BEGIN_ACTION = 11
+    OPTIONS = 12
+    TOKENS = 13
+    CHANNELS = 14
+    IMPORT = 15
+    FRAGMENT = 16
+    LEXER = 17
+    PARSER = 18
+    GRAMMAR = 19
+    PROTECTED = 20
+    PUBLIC = 21
+    PRIVATE = 22
+    RETURNS = 23
+    LOCALS = 24
+    THROWS = 25
+    CATCH = 26
+    FINALLY = 27
+    MODE = 28
+    COLON = 29
+    COLONCOLON = 30
+    COMMA = 31
+    SEMI = 32
+    LPAREN = 33
+    RPAREN = 34
+    LBRACE = 35
+    RBRACE = 36
+    RARROW = 37
+    LT = 38
+    GT = 39
+    ASSIGN = 40
+    QUESTION = 41
+    STAR = 42
+    PLUS_ASSIGN = 43
+    PLUS = 44
+    OR = 45
+    DOLLAR = 46
+    RANGE = 47
+    DOT = 48
+    AT = 49
+    POUND = 50
+    NOT = 51
+    ID = 52
+    WS = 53
+    ERRCHAR = 54
+    END_ARGUMENT = 55
+    UNTERMINATED_ARGUMENT = 56
+    ARGUMENT_CONTENT = 57
+    END_ACTION = 58
+    UNTERMINATED_ACTION = 59
+    ACTION_CONTENT = 60
+    UNTERMINATED_CHAR_SET = 61
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN", u"OFF_CHANNEL" ]
+
+    modeNames = [ "DEFAULT_MODE", "Argument", "Action", "Options", "Tokens", 
+                  "Channels", "LexerCharSet" ]
+
+    literalNames = [ "<INVALID>",
+            "'options'", "'tokens'", "'channels'", "'import'", "'fragment'", 
+            "'lexer'", "'parser'", "'grammar'", "'protected'", "'public'", 
+            "'private'", "'returns'", "'locals'", "'throws'", "'catch'", 
+            "'finally'", "'mode'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "TOKEN_REF", "RULE_REF", "LEXER_CHAR_SET", "DOC_COMMENT", "BLOCK_COMMENT", 
+            "LINE_COMMENT", "INT", "STRING_LITERAL", "UNTERMINATED_STRING_LITERAL", 
+            "BEGIN_ARGUMENT", "BEGIN_ACTION", "OPTIONS", "TOKENS", "CHANNELS", 
+            "IMPORT", "FRAGMENT", "LEXER", "PARSER", "GRAMMAR", "PROTECTED", 
+            "PUBLIC", "PRIVATE", "RETURNS", "LOCALS", "THROWS", "CATCH", 
+            "FINALLY", "MODE", "COLON", "COLONCOLON", "COMMA", "SEMI", "LPAREN", 
+            "RPAREN", "LBRACE", "RBRACE", "RARROW", "LT", "GT", "ASSIGN", 
+            "QUESTION", "STAR", "PLUS_ASSIGN", "PLUS", "OR", "DOLLAR", "RANGE", 
+            "DOT", "AT", "POUND", "NOT", "ID", "WS", "ERRCHAR", "END_ARGUMENT", 
+            "UNTERMINATED_ARGUMENT", "ARGUMENT_CONTENT", "END_ACTION", "UNTERMINATED_ACTION", 
+            "ACTION_CONTENT", "UNTERMINATED_CHAR_SET" ]
+
+    ruleNames = [ "DOC_COMMENT", "BLOCK_COMMENT", "LINE_COMMENT", "INT", 
+                  "STRING_LITERAL", "UNTERMINATED_STRING_LITERAL", "BEGIN_ARGUMENT", 
+                  "BEGIN_ACTION", "OPTIONS", "TOKENS", "CHANNELS", "IMPORT", 
+                  "FRAGMENT", "LEXER", "PARSER", "GRAMMAR", "PROTECTED", 
+                  "PUBLIC", "PRIVATE", "RETURNS", "LOCALS", "THROWS", "CATCH", 
+                  "FINALLY", "MODE", "COLON", "COLONCOLON", "COMMA", "SEMI", 
+                  "LPAREN", "RPAREN", "LBRACE", "RBRACE", "RARROW", "LT", 
+                  "GT", "ASSIGN", "QUESTION", "STAR", "PLUS_ASSIGN", "PLUS", 
+                  "OR", "DOLLAR", "RANGE", "DOT", "AT", "POUND", "NOT", 
+                  "TOKEN_REF", "RULE_REF", "ID", "WS", "ERRCHAR", "Ws", 
+                  "Hws", "Vws", "BlockComment", "DocComment", "LineComment", 
+                  "EscSeq", "EscAny", "UnicodeEsc", "DecimalNumeral", "HexDigit", 
+                  "DecDigit", "BoolLiteral", "CharLiteral", "SQuoteLiteral", 
+                  "DQuoteLiteral", "USQuoteLiteral", "NameChar", "NameStartChar", 
+                  "NameUpperStartChar", "NameLowerStartChar", "Int", "Esc", 
+                  "Colon", "DColon", "SQuote", "DQuote", "LParen", "RParen", 
+                  "LBrace", "RBrace", "LBrack", "RBrack", "RArrow", "Lt", 
+                  "Gt", "Equal", "Question", "Star", "Plus", "PlusAssign", 
+                  "Underscore", "Pipe", "Dollar", "Comma", "Semi", "Dot", 
+                  "Range", "At", "Pound", "Tilde", "NESTED_ARGUMENT", "ARGUMENT_ESCAPE", 
+                  "ARGUMENT_STRING_LITERAL", "ARGUMENT_CHAR_LITERAL", "END_ARGUMENT", 
+                  "UNTERMINATED_ARGUMENT", "ARGUMENT_CONTENT", "NESTED_ACTION", 
+                  "ACTION_ESCAPE", "ACTION_STRING_LITERAL", "ACTION_CHAR_LITERAL", 
+                  "ACTION_DOC_COMMENT", "ACTION_BLOCK_COMMENT", "ACTION_LINE_COMMENT", 
+                  "END_ACTION", "UNTERMINATED_ACTION", "ACTION_CONTENT", 
+                  "OPT_DOC_COMMENT", "OPT_BLOCK_COMMENT", "OPT_LINE_COMMENT", 
+                  "OPT_LBRACE", "OPT_RBRACE", "OPT_ID", "OPT_DOT", "OPT_ASSIGN", 
+                  "OPT_STRING_LITERAL", "OPT_INT", "OPT_STAR", "OPT_SEMI", 
+                  "OPT_WS", "TOK_DOC_COMMENT", "TOK_BLOCK_COMMENT", "TOK_LINE_COMMENT", 
+                  "TOK_LBRACE", "TOK_RBRACE", "TOK_ID", "TOK_DOT", "TOK_COMMA", 
+                  "TOK_WS", "CHN_DOC_COMMENT", "CHN_BLOCK_COMMENT", "CHN_LINE_COMMENT", 
+                  "CHN_LBRACE", "CHN_RBRACE", "CHN_ID", "CHN_DOT", "CHN_COMMA", 
+                  "CHN_WS", "LEXER_CHAR_SET_BODY", "LEXER_CHAR_SET", "UNTERMINATED_CHAR_SET", 
+                  "Id" ]
+
+    grammarFileName = "ANTLRv4Lexer.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.7.1")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[6] = self.BEGIN_ARGUMENT_action 
+            actions[108] = self.END_ARGUMENT_action 
+            actions[118] = self.END_ACTION_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+    def BEGIN_ARGUMENT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+             self.handleBeginArgument() 
+     
+
+    def END_ARGUMENT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+             self.handleEndArgument() 
+     
+
+    def END_ACTION_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+             self.handleEndAction() 
+     
+
+
@@ -0,0 +1,5187 @@
+# Generated from ANTLRv4Parser.g4 by ANTLR 4.7.1
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+from typing.io import TextIO
+import sys
+
+def serializedATN():
+    with StringIO() as buf:
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\3?")
+        buf.write("\u0282\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t\7")
+        buf.write("\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r\4\16")
+        buf.write("\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23\t\23")
+        buf.write("\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30\4\31")
+        buf.write("\t\31\4\32\t\32\4\33\t\33\4\34\t\34\4\35\t\35\4\36\t\36")
+        buf.write("\4\37\t\37\4 \t \4!\t!\4\"\t\"\4#\t#\4$\t$\4%\t%\4&\t")
+        buf.write("&\4\'\t\'\4(\t(\4)\t)\4*\t*\4+\t+\4,\t,\4-\t-\4.\t.\4")
+        buf.write("/\t/\4\60\t\60\4\61\t\61\4\62\t\62\4\63\t\63\4\64\t\64")
+        buf.write("\4\65\t\65\4\66\t\66\4\67\t\67\48\t8\49\t9\4:\t:\4;\t")
+        buf.write(";\4<\t<\4=\t=\4>\t>\4?\t?\4@\t@\3\2\7\2\u0082\n\2\f\2")
+        buf.write("\16\2\u0085\13\2\3\2\3\2\3\2\3\2\7\2\u008b\n\2\f\2\16")
+        buf.write("\2\u008e\13\2\3\2\3\2\7\2\u0092\n\2\f\2\16\2\u0095\13")
+        buf.write("\2\3\2\3\2\3\3\3\3\3\3\3\3\3\3\5\3\u009e\n\3\3\4\3\4\3")
+        buf.write("\4\3\4\3\4\5\4\u00a5\n\4\3\5\3\5\3\5\3\5\3\5\7\5\u00ac")
+        buf.write("\n\5\f\5\16\5\u00af\13\5\3\5\3\5\3\6\3\6\3\6\3\6\3\7\3")
+        buf.write("\7\3\7\7\7\u00ba\n\7\f\7\16\7\u00bd\13\7\3\7\3\7\3\7\5")
+        buf.write("\7\u00c2\n\7\3\b\3\b\3\b\3\b\7\b\u00c8\n\b\f\b\16\b\u00cb")
+        buf.write("\13\b\3\b\3\b\3\t\3\t\3\t\3\t\3\t\5\t\u00d4\n\t\3\n\3")
+        buf.write("\n\3\n\5\n\u00d9\n\n\3\n\3\n\3\13\3\13\3\13\5\13\u00e0")
+        buf.write("\n\13\3\13\3\13\3\f\3\f\3\f\7\f\u00e7\n\f\f\f\16\f\u00ea")
+        buf.write("\13\f\3\f\5\f\u00ed\n\f\3\r\3\r\3\r\3\r\5\r\u00f3\n\r")
+        buf.write("\3\r\3\r\3\r\3\16\3\16\3\16\5\16\u00fb\n\16\3\17\3\17")
+        buf.write("\7\17\u00ff\n\17\f\17\16\17\u0102\13\17\3\17\3\17\3\20")
+        buf.write("\3\20\7\20\u0108\n\20\f\20\16\20\u010b\13\20\3\20\3\20")
+        buf.write("\3\21\3\21\3\21\3\21\7\21\u0113\n\21\f\21\16\21\u0116")
+        buf.write("\13\21\3\22\7\22\u0119\n\22\f\22\16\22\u011c\13\22\3\23")
+        buf.write("\3\23\5\23\u0120\n\23\3\24\7\24\u0123\n\24\f\24\16\24")
+        buf.write("\u0126\13\24\3\24\5\24\u0129\n\24\3\24\3\24\5\24\u012d")
+        buf.write("\n\24\3\24\5\24\u0130\n\24\3\24\5\24\u0133\n\24\3\24\5")
+        buf.write("\24\u0136\n\24\3\24\7\24\u0139\n\24\f\24\16\24\u013c\13")
+        buf.write("\24\3\24\3\24\3\24\3\24\3\24\3\25\7\25\u0144\n\25\f\25")
+        buf.write("\16\25\u0147\13\25\3\25\5\25\u014a\n\25\3\26\3\26\3\26")
+        buf.write("\3\26\3\27\3\27\3\27\3\30\3\30\5\30\u0155\n\30\3\31\3")
+        buf.write("\31\3\31\3\32\3\32\3\32\3\32\7\32\u015e\n\32\f\32\16\32")
+        buf.write("\u0161\13\32\3\33\3\33\3\33\3\34\3\34\3\34\3\34\3\35\6")
+        buf.write("\35\u016b\n\35\r\35\16\35\u016c\3\36\3\36\3\37\3\37\3")
+        buf.write(" \3 \3 \7 \u0176\n \f \16 \u0179\13 \3!\3!\3!\5!\u017e")
+        buf.write("\n!\3\"\7\"\u0181\n\"\f\"\16\"\u0184\13\"\3\"\5\"\u0187")
+        buf.write("\n\"\3\"\3\"\3\"\3\"\3\"\3#\3#\3$\3$\3$\7$\u0193\n$\f")
+        buf.write("$\16$\u0196\13$\3%\3%\5%\u019a\n%\3%\5%\u019d\n%\3&\6")
+        buf.write("&\u01a0\n&\r&\16&\u01a1\3\'\3\'\5\'\u01a6\n\'\3\'\3\'")
+        buf.write("\5\'\u01aa\n\'\3\'\3\'\5\'\u01ae\n\'\3\'\3\'\5\'\u01b2")
+        buf.write("\n\'\5\'\u01b4\n\'\3(\3(\3(\3(\5(\u01ba\n(\3)\3)\3)\3")
+        buf.write(")\3*\3*\3*\3*\7*\u01c4\n*\f*\16*\u01c7\13*\3+\3+\3+\3")
+        buf.write("+\3+\3+\5+\u01cf\n+\3,\3,\5,\u01d3\n,\3-\3-\5-\u01d7\n")
+        buf.write("-\3.\3.\3.\7.\u01dc\n.\f.\16.\u01df\13.\3/\5/\u01e2\n")
+        buf.write("/\3/\6/\u01e5\n/\r/\16/\u01e6\3/\5/\u01ea\n/\3\60\3\60")
+        buf.write("\3\60\5\60\u01ef\n\60\3\60\3\60\3\60\5\60\u01f4\n\60\3")
+        buf.write("\60\3\60\3\60\5\60\u01f9\n\60\5\60\u01fb\n\60\3\61\3\61")
+        buf.write("\3\61\3\61\5\61\u0201\n\61\3\62\3\62\5\62\u0205\n\62\3")
+        buf.write("\63\3\63\3\64\3\64\5\64\u020b\n\64\3\64\3\64\5\64\u020f")
+        buf.write("\n\64\3\64\3\64\5\64\u0213\n\64\5\64\u0215\n\64\3\65\3")
+        buf.write("\65\3\65\3\65\3\65\3\65\5\65\u021d\n\65\5\65\u021f\n\65")
+        buf.write("\3\66\3\66\3\66\3\66\3\66\5\66\u0226\n\66\5\66\u0228\n")
+        buf.write("\66\3\67\3\67\3\67\3\67\5\67\u022e\n\67\38\38\38\38\7")
+        buf.write("8\u0234\n8\f8\168\u0237\138\38\38\39\39\59\u023d\n9\3")
+        buf.write("9\39\59\u0241\n9\39\39\59\u0245\n9\3:\3:\5:\u0249\n:\3")
+        buf.write(":\7:\u024c\n:\f:\16:\u024f\13:\3:\5:\u0252\n:\3:\3:\3")
+        buf.write(":\3;\3;\5;\u0259\n;\3;\5;\u025c\n;\3<\3<\3<\3<\3=\3=\5")
+        buf.write("=\u0264\n=\3=\3=\5=\u0268\n=\5=\u026a\n=\3>\3>\3>\3>\7")
+        buf.write(">\u0270\n>\f>\16>\u0273\13>\3>\3>\3?\3?\3?\3?\3?\5?\u027c")
+        buf.write("\n?\5?\u027e\n?\3@\3@\3@\2\2A\2\4\6\b\n\f\16\20\22\24")
+        buf.write("\26\30\32\34\36 \"$&(*,.\60\62\64\668:<>@BDFHJLNPRTVX")
+        buf.write("Z\\^`bdfhjlnprtvxz|~\2\5\4\2\22\22\26\30\4\2**--\3\2\3")
+        buf.write("\4\2\u02aa\2\u0083\3\2\2\2\4\u009d\3\2\2\2\6\u00a4\3\2")
+        buf.write("\2\2\b\u00a6\3\2\2\2\n\u00b2\3\2\2\2\f\u00c1\3\2\2\2\16")
+        buf.write("\u00c3\3\2\2\2\20\u00d3\3\2\2\2\22\u00d5\3\2\2\2\24\u00dc")
+        buf.write("\3\2\2\2\26\u00e3\3\2\2\2\30\u00ee\3\2\2\2\32\u00fa\3")
+        buf.write("\2\2\2\34\u00fc\3\2\2\2\36\u0105\3\2\2\2 \u010e\3\2\2")
+        buf.write("\2\"\u011a\3\2\2\2$\u011f\3\2\2\2&\u0124\3\2\2\2(\u0145")
+        buf.write("\3\2\2\2*\u014b\3\2\2\2,\u014f\3\2\2\2.\u0154\3\2\2\2")
+        buf.write("\60\u0156\3\2\2\2\62\u0159\3\2\2\2\64\u0162\3\2\2\2\66")
+        buf.write("\u0165\3\2\2\28\u016a\3\2\2\2:\u016e\3\2\2\2<\u0170\3")
+        buf.write("\2\2\2>\u0172\3\2\2\2@\u017a\3\2\2\2B\u0182\3\2\2\2D\u018d")
+        buf.write("\3\2\2\2F\u018f\3\2\2\2H\u019c\3\2\2\2J\u019f\3\2\2\2")
+        buf.write("L\u01b3\3\2\2\2N\u01b5\3\2\2\2P\u01bb\3\2\2\2R\u01bf\3")
+        buf.write("\2\2\2T\u01ce\3\2\2\2V\u01d2\3\2\2\2X\u01d6\3\2\2\2Z\u01d8")
+        buf.write("\3\2\2\2\\\u01e9\3\2\2\2^\u01fa\3\2\2\2`\u01fc\3\2\2\2")
+        buf.write("b\u0202\3\2\2\2d\u0206\3\2\2\2f\u0214\3\2\2\2h\u021e\3")
+        buf.write("\2\2\2j\u0227\3\2\2\2l\u022d\3\2\2\2n\u022f\3\2\2\2p\u0244")
+        buf.write("\3\2\2\2r\u0246\3\2\2\2t\u0256\3\2\2\2v\u025d\3\2\2\2")
+        buf.write("x\u0269\3\2\2\2z\u026b\3\2\2\2|\u027d\3\2\2\2~\u027f\3")
+        buf.write("\2\2\2\u0080\u0082\7\6\2\2\u0081\u0080\3\2\2\2\u0082\u0085")
+        buf.write("\3\2\2\2\u0083\u0081\3\2\2\2\u0083\u0084\3\2\2\2\u0084")
+        buf.write("\u0086\3\2\2\2\u0085\u0083\3\2\2\2\u0086\u0087\5\4\3\2")
+        buf.write("\u0087\u0088\5~@\2\u0088\u008c\7\"\2\2\u0089\u008b\5\6")
+        buf.write("\4\2\u008a\u0089\3\2\2\2\u008b\u008e\3\2\2\2\u008c\u008a")
+        buf.write("\3\2\2\2\u008c\u008d\3\2\2\2\u008d\u008f\3\2\2\2\u008e")
+        buf.write("\u008c\3\2\2\2\u008f\u0093\5\"\22\2\u0090\u0092\5 \21")
+        buf.write("\2\u0091\u0090\3\2\2\2\u0092\u0095\3\2\2\2\u0093\u0091")
+        buf.write("\3\2\2\2\u0093\u0094\3\2\2\2\u0094\u0096\3\2\2\2\u0095")
+        buf.write("\u0093\3\2\2\2\u0096\u0097\7\2\2\3\u0097\3\3\2\2\2\u0098")
+        buf.write("\u0099\7\23\2\2\u0099\u009e\7\25\2\2\u009a\u009b\7\24")
+        buf.write("\2\2\u009b\u009e\7\25\2\2\u009c\u009e\7\25\2\2\u009d\u0098")
+        buf.write("\3\2\2\2\u009d\u009a\3\2\2\2\u009d\u009c\3\2\2\2\u009e")
+        buf.write("\5\3\2\2\2\u009f\u00a5\5\b\5\2\u00a0\u00a5\5\16\b\2\u00a1")
+        buf.write("\u00a5\5\22\n\2\u00a2\u00a5\5\24\13\2\u00a3\u00a5\5\30")
+        buf.write("\r\2\u00a4\u009f\3\2\2\2\u00a4\u00a0\3\2\2\2\u00a4\u00a1")
+        buf.write("\3\2\2\2\u00a4\u00a2\3\2\2\2\u00a4\u00a3\3\2\2\2\u00a5")
+        buf.write("\7\3\2\2\2\u00a6\u00a7\7\16\2\2\u00a7\u00ad\7%\2\2\u00a8")
+        buf.write("\u00a9\5\n\6\2\u00a9\u00aa\7\"\2\2\u00aa\u00ac\3\2\2\2")
+        buf.write("\u00ab\u00a8\3\2\2\2\u00ac\u00af\3\2\2\2\u00ad\u00ab\3")
+        buf.write("\2\2\2\u00ad\u00ae\3\2\2\2\u00ae\u00b0\3\2\2\2\u00af\u00ad")
+        buf.write("\3\2\2\2\u00b0\u00b1\7&\2\2\u00b1\t\3\2\2\2\u00b2\u00b3")
+        buf.write("\5~@\2\u00b3\u00b4\7*\2\2\u00b4\u00b5\5\f\7\2\u00b5\13")
+        buf.write("\3\2\2\2\u00b6\u00bb\5~@\2\u00b7\u00b8\7\62\2\2\u00b8")
+        buf.write("\u00ba\5~@\2\u00b9\u00b7\3\2\2\2\u00ba\u00bd\3\2\2\2\u00bb")
+        buf.write("\u00b9\3\2\2\2\u00bb\u00bc\3\2\2\2\u00bc\u00c2\3\2\2\2")
+        buf.write("\u00bd\u00bb\3\2\2\2\u00be\u00c2\7\n\2\2\u00bf\u00c2\5")
+        buf.write("\34\17\2\u00c0\u00c2\7\t\2\2\u00c1\u00b6\3\2\2\2\u00c1")
+        buf.write("\u00be\3\2\2\2\u00c1\u00bf\3\2\2\2\u00c1\u00c0\3\2\2\2")
+        buf.write("\u00c2\r\3\2\2\2\u00c3\u00c4\7\21\2\2\u00c4\u00c9\5\20")
+        buf.write("\t\2\u00c5\u00c6\7!\2\2\u00c6\u00c8\5\20\t\2\u00c7\u00c5")
+        buf.write("\3\2\2\2\u00c8\u00cb\3\2\2\2\u00c9\u00c7\3\2\2\2\u00c9")
+        buf.write("\u00ca\3\2\2\2\u00ca\u00cc\3\2\2\2\u00cb\u00c9\3\2\2\2")
+        buf.write("\u00cc\u00cd\7\"\2\2\u00cd\17\3\2\2\2\u00ce\u00cf\5~@")
+        buf.write("\2\u00cf\u00d0\7*\2\2\u00d0\u00d1\5~@\2\u00d1\u00d4\3")
+        buf.write("\2\2\2\u00d2\u00d4\5~@\2\u00d3\u00ce\3\2\2\2\u00d3\u00d2")
+        buf.write("\3\2\2\2\u00d4\21\3\2\2\2\u00d5\u00d6\7\17\2\2\u00d6\u00d8")
+        buf.write("\7%\2\2\u00d7\u00d9\5\26\f\2\u00d8\u00d7\3\2\2\2\u00d8")
+        buf.write("\u00d9\3\2\2\2\u00d9\u00da\3\2\2\2\u00da\u00db\7&\2\2")
+        buf.write("\u00db\23\3\2\2\2\u00dc\u00dd\7\20\2\2\u00dd\u00df\7%")
+        buf.write("\2\2\u00de\u00e0\5\26\f\2\u00df\u00de\3\2\2\2\u00df\u00e0")
+        buf.write("\3\2\2\2\u00e0\u00e1\3\2\2\2\u00e1\u00e2\7&\2\2\u00e2")
+        buf.write("\25\3\2\2\2\u00e3\u00e8\5~@\2\u00e4\u00e5\7!\2\2\u00e5")
+        buf.write("\u00e7\5~@\2\u00e6\u00e4\3\2\2\2\u00e7\u00ea\3\2\2\2\u00e8")
+        buf.write("\u00e6\3\2\2\2\u00e8\u00e9\3\2\2\2\u00e9\u00ec\3\2\2\2")
+        buf.write("\u00ea\u00e8\3\2\2\2\u00eb\u00ed\7!\2\2\u00ec\u00eb\3")
+        buf.write("\2\2\2\u00ec\u00ed\3\2\2\2\u00ed\27\3\2\2\2\u00ee\u00f2")
+        buf.write("\7\63\2\2\u00ef\u00f0\5\32\16\2\u00f0\u00f1\7 \2\2\u00f1")
+        buf.write("\u00f3\3\2\2\2\u00f2\u00ef\3\2\2\2\u00f2\u00f3\3\2\2\2")
+        buf.write("\u00f3\u00f4\3\2\2\2\u00f4\u00f5\5~@\2\u00f5\u00f6\5\34")
+        buf.write("\17\2\u00f6\31\3\2\2\2\u00f7\u00fb\5~@\2\u00f8\u00fb\7")
+        buf.write("\23\2\2\u00f9\u00fb\7\24\2\2\u00fa\u00f7\3\2\2\2\u00fa")
+        buf.write("\u00f8\3\2\2\2\u00fa\u00f9\3\2\2\2\u00fb\33\3\2\2\2\u00fc")
+        buf.write("\u0100\7\r\2\2\u00fd\u00ff\7>\2\2\u00fe\u00fd\3\2\2\2")
+        buf.write("\u00ff\u0102\3\2\2\2\u0100\u00fe\3\2\2\2\u0100\u0101\3")
+        buf.write("\2\2\2\u0101\u0103\3\2\2\2\u0102\u0100\3\2\2\2\u0103\u0104")
+        buf.write("\7<\2\2\u0104\35\3\2\2\2\u0105\u0109\7\f\2\2\u0106\u0108")
+        buf.write("\7;\2\2\u0107\u0106\3\2\2\2\u0108\u010b\3\2\2\2\u0109")
+        buf.write("\u0107\3\2\2\2\u0109\u010a\3\2\2\2\u010a\u010c\3\2\2\2")
+        buf.write("\u010b\u0109\3\2\2\2\u010c\u010d\79\2\2\u010d\37\3\2\2")
+        buf.write("\2\u010e\u010f\7\36\2\2\u010f\u0110\5~@\2\u0110\u0114")
+        buf.write("\7\"\2\2\u0111\u0113\5B\"\2\u0112\u0111\3\2\2\2\u0113")
+        buf.write("\u0116\3\2\2\2\u0114\u0112\3\2\2\2\u0114\u0115\3\2\2\2")
+        buf.write("\u0115!\3\2\2\2\u0116\u0114\3\2\2\2\u0117\u0119\5$\23")
+        buf.write("\2\u0118\u0117\3\2\2\2\u0119\u011c\3\2\2\2\u011a\u0118")
+        buf.write("\3\2\2\2\u011a\u011b\3\2\2\2\u011b#\3\2\2\2\u011c\u011a")
+        buf.write("\3\2\2\2\u011d\u0120\5&\24\2\u011e\u0120\5B\"\2\u011f")
+        buf.write("\u011d\3\2\2\2\u011f\u011e\3\2\2\2\u0120%\3\2\2\2\u0121")
+        buf.write("\u0123\7\6\2\2\u0122\u0121\3\2\2\2\u0123\u0126\3\2\2\2")
+        buf.write("\u0124\u0122\3\2\2\2\u0124\u0125\3\2\2\2\u0125\u0128\3")
+        buf.write("\2\2\2\u0126\u0124\3\2\2\2\u0127\u0129\58\35\2\u0128\u0127")
+        buf.write("\3\2\2\2\u0128\u0129\3\2\2\2\u0129\u012a\3\2\2\2\u012a")
+        buf.write("\u012c\7\4\2\2\u012b\u012d\5\36\20\2\u012c\u012b\3\2\2")
+        buf.write("\2\u012c\u012d\3\2\2\2\u012d\u012f\3\2\2\2\u012e\u0130")
+        buf.write("\5\60\31\2\u012f\u012e\3\2\2\2\u012f\u0130\3\2\2\2\u0130")
+        buf.write("\u0132\3\2\2\2\u0131\u0133\5\62\32\2\u0132\u0131\3\2\2")
+        buf.write("\2\u0132\u0133\3\2\2\2\u0133\u0135\3\2\2\2\u0134\u0136")
+        buf.write("\5\64\33\2\u0135\u0134\3\2\2\2\u0135\u0136\3\2\2\2\u0136")
+        buf.write("\u013a\3\2\2\2\u0137\u0139\5.\30\2\u0138\u0137\3\2\2\2")
+        buf.write("\u0139\u013c\3\2\2\2\u013a\u0138\3\2\2\2\u013a\u013b\3")
+        buf.write("\2\2\2\u013b\u013d\3\2\2\2\u013c\u013a\3\2\2\2\u013d\u013e")
+        buf.write("\7\37\2\2\u013e\u013f\5<\37\2\u013f\u0140\7\"\2\2\u0140")
+        buf.write("\u0141\5(\25\2\u0141\'\3\2\2\2\u0142\u0144\5*\26\2\u0143")
+        buf.write("\u0142\3\2\2\2\u0144\u0147\3\2\2\2\u0145\u0143\3\2\2\2")
+        buf.write("\u0145\u0146\3\2\2\2\u0146\u0149\3\2\2\2\u0147\u0145\3")
+        buf.write("\2\2\2\u0148\u014a\5,\27\2\u0149\u0148\3\2\2\2\u0149\u014a")
+        buf.write("\3\2\2\2\u014a)\3\2\2\2\u014b\u014c\7\34\2\2\u014c\u014d")
+        buf.write("\5\36\20\2\u014d\u014e\5\34\17\2\u014e+\3\2\2\2\u014f")
+        buf.write("\u0150\7\35\2\2\u0150\u0151\5\34\17\2\u0151-\3\2\2\2\u0152")
+        buf.write("\u0155\5\b\5\2\u0153\u0155\5\66\34\2\u0154\u0152\3\2\2")
+        buf.write("\2\u0154\u0153\3\2\2\2\u0155/\3\2\2\2\u0156\u0157\7\31")
+        buf.write("\2\2\u0157\u0158\5\36\20\2\u0158\61\3\2\2\2\u0159\u015a")
+        buf.write("\7\33\2\2\u015a\u015f\5~@\2\u015b\u015c\7!\2\2\u015c\u015e")
+        buf.write("\5~@\2\u015d\u015b\3\2\2\2\u015e\u0161\3\2\2\2\u015f\u015d")
+        buf.write("\3\2\2\2\u015f\u0160\3\2\2\2\u0160\63\3\2\2\2\u0161\u015f")
+        buf.write("\3\2\2\2\u0162\u0163\7\32\2\2\u0163\u0164\5\36\20\2\u0164")
+        buf.write("\65\3\2\2\2\u0165\u0166\7\63\2\2\u0166\u0167\5~@\2\u0167")
+        buf.write("\u0168\5\34\17\2\u0168\67\3\2\2\2\u0169\u016b\5:\36\2")
+        buf.write("\u016a\u0169\3\2\2\2\u016b\u016c\3\2\2\2\u016c\u016a\3")
+        buf.write("\2\2\2\u016c\u016d\3\2\2\2\u016d9\3\2\2\2\u016e\u016f")
+        buf.write("\t\2\2\2\u016f;\3\2\2\2\u0170\u0171\5> \2\u0171=\3\2\2")
+        buf.write("\2\u0172\u0177\5@!\2\u0173\u0174\7/\2\2\u0174\u0176\5")
+        buf.write("@!\2\u0175\u0173\3\2\2\2\u0176\u0179\3\2\2\2\u0177\u0175")
+        buf.write("\3\2\2\2\u0177\u0178\3\2\2\2\u0178?\3\2\2\2\u0179\u0177")
+        buf.write("\3\2\2\2\u017a\u017d\5\\/\2\u017b\u017c\7\64\2\2\u017c")
+        buf.write("\u017e\5~@\2\u017d\u017b\3\2\2\2\u017d\u017e\3\2\2\2\u017e")
+        buf.write("A\3\2\2\2\u017f\u0181\7\6\2\2\u0180\u017f\3\2\2\2\u0181")
+        buf.write("\u0184\3\2\2\2\u0182\u0180\3\2\2\2\u0182\u0183\3\2\2\2")
+        buf.write("\u0183\u0186\3\2\2\2\u0184\u0182\3\2\2\2\u0185\u0187\7")
+        buf.write("\22\2\2\u0186\u0185\3\2\2\2\u0186\u0187\3\2\2\2\u0187")
+        buf.write("\u0188\3\2\2\2\u0188\u0189\7\3\2\2\u0189\u018a\7\37\2")
+        buf.write("\2\u018a\u018b\5D#\2\u018b\u018c\7\"\2\2\u018cC\3\2\2")
+        buf.write("\2\u018d\u018e\5F$\2\u018eE\3\2\2\2\u018f\u0194\5H%\2")
+        buf.write("\u0190\u0191\7/\2\2\u0191\u0193\5H%\2\u0192\u0190\3\2")
+        buf.write("\2\2\u0193\u0196\3\2\2\2\u0194\u0192\3\2\2\2\u0194\u0195")
+        buf.write("\3\2\2\2\u0195G\3\2\2\2\u0196\u0194\3\2\2\2\u0197\u0199")
+        buf.write("\5J&\2\u0198\u019a\5R*\2\u0199\u0198\3\2\2\2\u0199\u019a")
+        buf.write("\3\2\2\2\u019a\u019d\3\2\2\2\u019b\u019d\3\2\2\2\u019c")
+        buf.write("\u0197\3\2\2\2\u019c\u019b\3\2\2\2\u019dI\3\2\2\2\u019e")
+        buf.write("\u01a0\5L\'\2\u019f\u019e\3\2\2\2\u01a0\u01a1\3\2\2\2")
+        buf.write("\u01a1\u019f\3\2\2\2\u01a1\u01a2\3\2\2\2\u01a2K\3\2\2")
+        buf.write("\2\u01a3\u01a5\5N(\2\u01a4\u01a6\5f\64\2\u01a5\u01a4\3")
+        buf.write("\2\2\2\u01a5\u01a6\3\2\2\2\u01a6\u01b4\3\2\2\2\u01a7\u01a9")
+        buf.write("\5h\65\2\u01a8\u01aa\5f\64\2\u01a9\u01a8\3\2\2\2\u01a9")
+        buf.write("\u01aa\3\2\2\2\u01aa\u01b4\3\2\2\2\u01ab\u01ad\5P)\2\u01ac")
+        buf.write("\u01ae\5f\64\2\u01ad\u01ac\3\2\2\2\u01ad\u01ae\3\2\2\2")
+        buf.write("\u01ae\u01b4\3\2\2\2\u01af\u01b1\5\34\17\2\u01b0\u01b2")
+        buf.write("\7+\2\2\u01b1\u01b0\3\2\2\2\u01b1\u01b2\3\2\2\2\u01b2")
+        buf.write("\u01b4\3\2\2\2\u01b3\u01a3\3\2\2\2\u01b3\u01a7\3\2\2\2")
+        buf.write("\u01b3\u01ab\3\2\2\2\u01b3\u01af\3\2\2\2\u01b4M\3\2\2")
+        buf.write("\2\u01b5\u01b6\5~@\2\u01b6\u01b9\t\3\2\2\u01b7\u01ba\5")
+        buf.write("h\65\2\u01b8\u01ba\5P)\2\u01b9\u01b7\3\2\2\2\u01b9\u01b8")
+        buf.write("\3\2\2\2\u01baO\3\2\2\2\u01bb\u01bc\7#\2\2\u01bc\u01bd")
+        buf.write("\5F$\2\u01bd\u01be\7$\2\2\u01beQ\3\2\2\2\u01bf\u01c0\7")
+        buf.write("\'\2\2\u01c0\u01c5\5T+\2\u01c1\u01c2\7!\2\2\u01c2\u01c4")
+        buf.write("\5T+\2\u01c3\u01c1\3\2\2\2\u01c4\u01c7\3\2\2\2\u01c5\u01c3")
+        buf.write("\3\2\2\2\u01c5\u01c6\3\2\2\2\u01c6S\3\2\2\2\u01c7\u01c5")
+        buf.write("\3\2\2\2\u01c8\u01c9\5V,\2\u01c9\u01ca\7#\2\2\u01ca\u01cb")
+        buf.write("\5X-\2\u01cb\u01cc\7$\2\2\u01cc\u01cf\3\2\2\2\u01cd\u01cf")
+        buf.write("\5V,\2\u01ce\u01c8\3\2\2\2\u01ce\u01cd\3\2\2\2\u01cfU")
+        buf.write("\3\2\2\2\u01d0\u01d3\5~@\2\u01d1\u01d3\7\36\2\2\u01d2")
+        buf.write("\u01d0\3\2\2\2\u01d2\u01d1\3\2\2\2\u01d3W\3\2\2\2\u01d4")
+        buf.write("\u01d7\5~@\2\u01d5\u01d7\7\t\2\2\u01d6\u01d4\3\2\2\2\u01d6")
+        buf.write("\u01d5\3\2\2\2\u01d7Y\3\2\2\2\u01d8\u01dd\5\\/\2\u01d9")
+        buf.write("\u01da\7/\2\2\u01da\u01dc\5\\/\2\u01db\u01d9\3\2\2\2\u01dc")
+        buf.write("\u01df\3\2\2\2\u01dd\u01db\3\2\2\2\u01dd\u01de\3\2\2\2")
+        buf.write("\u01de[\3\2\2\2\u01df\u01dd\3\2\2\2\u01e0\u01e2\5z>\2")
+        buf.write("\u01e1\u01e0\3\2\2\2\u01e1\u01e2\3\2\2\2\u01e2\u01e4\3")
+        buf.write("\2\2\2\u01e3\u01e5\5^\60\2\u01e4\u01e3\3\2\2\2\u01e5\u01e6")
+        buf.write("\3\2\2\2\u01e6\u01e4\3\2\2\2\u01e6\u01e7\3\2\2\2\u01e7")
+        buf.write("\u01ea\3\2\2\2\u01e8\u01ea\3\2\2\2\u01e9\u01e1\3\2\2\2")
+        buf.write("\u01e9\u01e8\3\2\2\2\u01ea]\3\2\2\2\u01eb\u01ee\5`\61")
+        buf.write("\2\u01ec\u01ef\5f\64\2\u01ed\u01ef\3\2\2\2\u01ee\u01ec")
+        buf.write("\3\2\2\2\u01ee\u01ed\3\2\2\2\u01ef\u01fb\3\2\2\2\u01f0")
+        buf.write("\u01f3\5j\66\2\u01f1\u01f4\5f\64\2\u01f2\u01f4\3\2\2\2")
+        buf.write("\u01f3\u01f1\3\2\2\2\u01f3\u01f2\3\2\2\2\u01f4\u01fb\3")
+        buf.write("\2\2\2\u01f5\u01fb\5b\62\2\u01f6\u01f8\5\34\17\2\u01f7")
+        buf.write("\u01f9\7+\2\2\u01f8\u01f7\3\2\2\2\u01f8\u01f9\3\2\2\2")
+        buf.write("\u01f9\u01fb\3\2\2\2\u01fa\u01eb\3\2\2\2\u01fa\u01f0\3")
+        buf.write("\2\2\2\u01fa\u01f5\3\2\2\2\u01fa\u01f6\3\2\2\2\u01fb_")
+        buf.write("\3\2\2\2\u01fc\u01fd\5~@\2\u01fd\u0200\t\3\2\2\u01fe\u0201")
+        buf.write("\5j\66\2\u01ff\u0201\5r:\2\u0200\u01fe\3\2\2\2\u0200\u01ff")
+        buf.write("\3\2\2\2\u0201a\3\2\2\2\u0202\u0204\5r:\2\u0203\u0205")
+        buf.write("\5d\63\2\u0204\u0203\3\2\2\2\u0204\u0205\3\2\2\2\u0205")
+        buf.write("c\3\2\2\2\u0206\u0207\5f\64\2\u0207e\3\2\2\2\u0208\u020a")
+        buf.write("\7+\2\2\u0209\u020b\7+\2\2\u020a\u0209\3\2\2\2\u020a\u020b")
+        buf.write("\3\2\2\2\u020b\u0215\3\2\2\2\u020c\u020e\7,\2\2\u020d")
+        buf.write("\u020f\7+\2\2\u020e\u020d\3\2\2\2\u020e\u020f\3\2\2\2")
+        buf.write("\u020f\u0215\3\2\2\2\u0210\u0212\7.\2\2\u0211\u0213\7")
+        buf.write("+\2\2\u0212\u0211\3\2\2\2\u0212\u0213\3\2\2\2\u0213\u0215")
+        buf.write("\3\2\2\2\u0214\u0208\3\2\2\2\u0214\u020c\3\2\2\2\u0214")
+        buf.write("\u0210\3\2\2\2\u0215g\3\2\2\2\u0216\u021f\5v<\2\u0217")
+        buf.write("\u021f\5x=\2\u0218\u021f\5l\67\2\u0219\u021f\7\5\2\2\u021a")
+        buf.write("\u021c\7\62\2\2\u021b\u021d\5z>\2\u021c\u021b\3\2\2\2")
+        buf.write("\u021c\u021d\3\2\2\2\u021d\u021f\3\2\2\2\u021e\u0216\3")
+        buf.write("\2\2\2\u021e\u0217\3\2\2\2\u021e\u0218\3\2\2\2\u021e\u0219")
+        buf.write("\3\2\2\2\u021e\u021a\3\2\2\2\u021fi\3\2\2\2\u0220\u0228")
+        buf.write("\5x=\2\u0221\u0228\5t;\2\u0222\u0228\5l\67\2\u0223\u0225")
+        buf.write("\7\62\2\2\u0224\u0226\5z>\2\u0225\u0224\3\2\2\2\u0225")
+        buf.write("\u0226\3\2\2\2\u0226\u0228\3\2\2\2\u0227\u0220\3\2\2\2")
+        buf.write("\u0227\u0221\3\2\2\2\u0227\u0222\3\2\2\2\u0227\u0223\3")
+        buf.write("\2\2\2\u0228k\3\2\2\2\u0229\u022a\7\65\2\2\u022a\u022e")
+        buf.write("\5p9\2\u022b\u022c\7\65\2\2\u022c\u022e\5n8\2\u022d\u0229")
+        buf.write("\3\2\2\2\u022d\u022b\3\2\2\2\u022em\3\2\2\2\u022f\u0230")
+        buf.write("\7#\2\2\u0230\u0235\5p9\2\u0231\u0232\7/\2\2\u0232\u0234")
+        buf.write("\5p9\2\u0233\u0231\3\2\2\2\u0234\u0237\3\2\2\2\u0235\u0233")
+        buf.write("\3\2\2\2\u0235\u0236\3\2\2\2\u0236\u0238\3\2\2\2\u0237")
+        buf.write("\u0235\3\2\2\2\u0238\u0239\7$\2\2\u0239o\3\2\2\2\u023a")
+        buf.write("\u023c\7\3\2\2\u023b\u023d\5z>\2\u023c\u023b\3\2\2\2\u023c")
+        buf.write("\u023d\3\2\2\2\u023d\u0245\3\2\2\2\u023e\u0240\7\n\2\2")
+        buf.write("\u023f\u0241\5z>\2\u0240\u023f\3\2\2\2\u0240\u0241\3\2")
+        buf.write("\2\2\u0241\u0245\3\2\2\2\u0242\u0245\5v<\2\u0243\u0245")
+        buf.write("\7\5\2\2\u0244\u023a\3\2\2\2\u0244\u023e\3\2\2\2\u0244")
+        buf.write("\u0242\3\2\2\2\u0244\u0243\3\2\2\2\u0245q\3\2\2\2\u0246")
+        buf.write("\u0251\7#\2\2\u0247\u0249\5\b\5\2\u0248\u0247\3\2\2\2")
+        buf.write("\u0248\u0249\3\2\2\2\u0249\u024d\3\2\2\2\u024a\u024c\5")
+        buf.write("\66\34\2\u024b\u024a\3\2\2\2\u024c\u024f\3\2\2\2\u024d")
+        buf.write("\u024b\3\2\2\2\u024d\u024e\3\2\2\2\u024e\u0250\3\2\2\2")
+        buf.write("\u024f\u024d\3\2\2\2\u0250\u0252\7\37\2\2\u0251\u0248")
+        buf.write("\3\2\2\2\u0251\u0252\3\2\2\2\u0252\u0253\3\2\2\2\u0253")
+        buf.write("\u0254\5Z.\2\u0254\u0255\7$\2\2\u0255s\3\2\2\2\u0256\u0258")
+        buf.write("\7\4\2\2\u0257\u0259\5\36\20\2\u0258\u0257\3\2\2\2\u0258")
+        buf.write("\u0259\3\2\2\2\u0259\u025b\3\2\2\2\u025a\u025c\5z>\2\u025b")
+        buf.write("\u025a\3\2\2\2\u025b\u025c\3\2\2\2\u025cu\3\2\2\2\u025d")
+        buf.write("\u025e\7\n\2\2\u025e\u025f\7\61\2\2\u025f\u0260\7\n\2")
+        buf.write("\2\u0260w\3\2\2\2\u0261\u0263\7\3\2\2\u0262\u0264\5z>")
+        buf.write("\2\u0263\u0262\3\2\2\2\u0263\u0264\3\2\2\2\u0264\u026a")
+        buf.write("\3\2\2\2\u0265\u0267\7\n\2\2\u0266\u0268\5z>\2\u0267\u0266")
+        buf.write("\3\2\2\2\u0267\u0268\3\2\2\2\u0268\u026a\3\2\2\2\u0269")
+        buf.write("\u0261\3\2\2\2\u0269\u0265\3\2\2\2\u026ay\3\2\2\2\u026b")
+        buf.write("\u026c\7(\2\2\u026c\u0271\5|?\2\u026d\u026e\7!\2\2\u026e")
+        buf.write("\u0270\5|?\2\u026f\u026d\3\2\2\2\u0270\u0273\3\2\2\2\u0271")
+        buf.write("\u026f\3\2\2\2\u0271\u0272\3\2\2\2\u0272\u0274\3\2\2\2")
+        buf.write("\u0273\u0271\3\2\2\2\u0274\u0275\7)\2\2\u0275{\3\2\2\2")
+        buf.write("\u0276\u027e\5~@\2\u0277\u0278\5~@\2\u0278\u027b\7*\2")
+        buf.write("\2\u0279\u027c\5~@\2\u027a\u027c\7\n\2\2\u027b\u0279\3")
+        buf.write("\2\2\2\u027b\u027a\3\2\2\2\u027c\u027e\3\2\2\2\u027d\u0276")
+        buf.write("\3\2\2\2\u027d\u0277\3\2\2\2\u027e}\3\2\2\2\u027f\u0280")
+        buf.write("\t\4\2\2\u0280\177\3\2\2\2W\u0083\u008c\u0093\u009d\u00a4")
+        buf.write("\u00ad\u00bb\u00c1\u00c9\u00d3\u00d8\u00df\u00e8\u00ec")
+        buf.write("\u00f2\u00fa\u0100\u0109\u0114\u011a\u011f\u0124\u0128")
+        buf.write("\u012c\u012f\u0132\u0135\u013a\u0145\u0149\u0154\u015f")
+        buf.write("\u016c\u0177\u017d\u0182\u0186\u0194\u0199\u019c\u01a1")
+        buf.write("\u01a5\u01a9\u01ad\u01b1\u01b3\u01b9\u01c5\u01ce\u01d2")
+        buf.write("\u01d6\u01dd\u01e1\u01e6\u01e9\u01ee\u01f3\u01f8\u01fa")
+        buf.write("\u0200\u0204\u020a\u020e\u0212\u0214\u021c\u021e\u0225")
+        buf.write("\u0227\u022d\u0235\u023c\u0240\u0244\u0248\u024d\u0251")
+        buf.write("\u0258\u025b\u0263\u0267\u0269\u0271\u027b\u027d")
+        return buf.getvalue()
+
+
+class ANTLRv4Parser ( Parser ):
+
+    grammarFileName = "ANTLRv4Parser.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "'options'", "'tokens'", "'channels'", "'import'", 
+                     "'fragment'", "'lexer'", "'parser'", "'grammar'", "'protected'", 
+                     "'public'", "'private'", "'returns'", "'locals'", "'throws'", 
+                     "'catch'", "'finally'", "'mode'" ]
+
+    symbolicNames = [ "<INVALID>", "TOKEN_REF", "RULE_REF", "LEXER_CHAR_SET", 
+                      "DOC_COMMENT", "BLOCK_COMMENT", "LINE_COMMENT", "INT", 
+                      "STRING_LITERAL", "UNTERMINATED_STRING_LITERAL", "BEGIN_ARGUMENT", 
+                      "BEGIN_ACTION", "OPTIONS", "TOKENS", "CHANNELS", "IMPORT", 
+                      "FRAGMENT", "LEXER", "PARSER", "GRAMMAR", "PROTECTED", 
+                      "PUBLIC", "PRIVATE", "RETURNS", "LOCALS", "THROWS", 
+                      "CATCH", "FINALLY", "MODE", "COLON", "COLONCOLON", 
+                      "COMMA", "SEMI", "LPAREN", "RPAREN", "LBRACE", "RBRACE", 
+                      "RARROW", "LT", "GT", "ASSIGN", "QUESTION", "STAR", 
+                      "PLUS_ASSIGN", "PLUS", "OR", "DOLLAR", "RANGE", "DOT", 
+                      "AT", "POUND", "NOT", "ID", "WS", "ERRCHAR", "END_ARGUMENT", 
+                      "UNTERMINATED_ARGUMENT", "ARGUMENT_CONTENT", "END_ACTION", 
+                      "UNTERMINATED_ACTION", "ACTION_CONTENT", "UNTERMINATED_CHAR_SET" ]
+
+    RULE_grammarSpec = 0
+    RULE_grammarType = 1
+    RULE_prequelConstruct = 2
+    RULE_optionsSpec = 3
+    RULE_option = 4
+    RULE_optionValue = 5
+    RULE_delegateGrammars = 6
+    RULE_delegateGrammar = 7
+    RULE_tokensSpec = 8
+    RULE_channelsSpec = 9
+    RULE_idList = 10
+    RULE_action = 11
+    RULE_actionScopeName = 12
+    RULE_actionBlock = 13
+    RULE_argActionBlock = 14
+    RULE_modeSpec = 15
+    RULE_rules = 16
+    RULE_ruleSpec = 17
+    RULE_parserRuleSpec = 18
+    RULE_exceptionGroup = 19
+    RULE_exceptionHandler = 20
+    RULE_finallyClause = 21
+    RULE_rulePrequel = 22
+    RULE_ruleReturns = 23
+    RULE_throwsSpec = 24
+    RULE_localsSpec = 25
+    RULE_ruleAction = 26
+    RULE_ruleModifiers = 27
+    RULE_ruleModifier = 28
+    RULE_ruleBlock = 29
+    RULE_ruleAltList = 30
+    RULE_labeledAlt = 31
+    RULE_lexerRuleSpec = 32
+    RULE_lexerRuleBlock = 33
+    RULE_lexerAltList = 34
+    RULE_lexerAlt = 35
+    RULE_lexerElements = 36
+    RULE_lexerElement = 37
+    RULE_labeledLexerElement = 38
+    RULE_lexerBlock = 39
+    RULE_lexerCommands = 40
+    RULE_lexerCommand = 41
+    RULE_lexerCommandName = 42
+    RULE_lexerCommandExpr = 43
+    RULE_altList = 44
+    RULE_alternative = 45
+    RULE_element = 46
+    RULE_labeledElement = 47
+    RULE_ebnf = 48
+    RULE_blockSuffix = 49
+    RULE_ebnfSuffix = 50
+    RULE_lexerAtom = 51
+    RULE_atom = 52
+    RULE_notSet = 53
+    RULE_blockSet = 54
+    RULE_setElement = 55
+    RULE_block = 56
+    RULE_ruleref = 57
+    RULE_characterRange = 58
+    RULE_terminal = 59
+    RULE_elementOptions = 60
+    RULE_elementOption = 61
+    RULE_identifier = 62
+
+    ruleNames =  [ "grammarSpec", "grammarType", "prequelConstruct", "optionsSpec", 
+                   "option", "optionValue", "delegateGrammars", "delegateGrammar", 
+                   "tokensSpec", "channelsSpec", "idList", "action", "actionScopeName", 
+                   "actionBlock", "argActionBlock", "modeSpec", "rules", 
+                   "ruleSpec", "parserRuleSpec", "exceptionGroup", "exceptionHandler", 
+                   "finallyClause", "rulePrequel", "ruleReturns", "throwsSpec", 
+                   "localsSpec", "ruleAction", "ruleModifiers", "ruleModifier", 
+                   "ruleBlock", "ruleAltList", "labeledAlt", "lexerRuleSpec", 
+                   "lexerRuleBlock", "lexerAltList", "lexerAlt", "lexerElements", 
+                   "lexerElement", "labeledLexerElement", "lexerBlock", 
+                   "lexerCommands", "lexerCommand", "lexerCommandName", 
+                   "lexerCommandExpr", "altList", "alternative", "element", 
+                   "labeledElement", "ebnf", "blockSuffix", "ebnfSuffix", 
+                   "lexerAtom", "atom", "notSet", "blockSet", "setElement", 
+                   "block", "ruleref", "characterRange", "terminal", "elementOptions", 
+                   "elementOption", "identifier" ]
+
+    EOF = Token.EOF
+    TOKEN_REF=1
+    RULE_REF=2
+    LEXER_CHAR_SET=3
+    DOC_COMMENT=4
+    BLOCK_COMMENT=5
+    LINE_COMMENT=6
+    INT=7
+    STRING_LITERAL=8
+    UNTERMINATED_STRING_LITERAL=9
+    BEGIN_ARGUMENT=10
+    BEGIN_ACTION=11
+    OPTIONS=12
+    TOKENS=13
+    CHANNELS=14
+    IMPORT=15
+    FRAGMENT=16
+    LEXER=17
+    PARSER=18
+    GRAMMAR=19
+    PROTECTED=20
+    PUBLIC=21
+    PRIVATE=22
+    RETURNS=23
+    LOCALS=24
+    THROWS=25
+    CATCH=26
+    FINALLY=27
+    MODE=28
+    COLON=29
+    COLONCOLON=30
+    COMMA=31
+    SEMI=32
+    LPAREN=33
+    RPAREN=34
+    LBRACE=35
+    RBRACE=36
+    RARROW=37
+    LT=38
+    GT=39
+    ASSIGN=40
+    QUESTION=41
+    STAR=42
+    PLUS_ASSIGN=43
+    PLUS=44
+    OR=45
+    DOLLAR=46
+    RANGE=47
+    DOT=48
+    AT=49
+    POUND=50
+    NOT=51
+    ID=52
+    WS=53
+    ERRCHAR=54
+    END_ARGUMENT=55
+    UNTERMINATED_ARGUMENT=56
+    ARGUMENT_CONTENT=57
+    END_ACTION=58
+    UNTERMINATED_ACTION=59
+    ACTION_CONTENT=60
+    UNTERMINATED_CHAR_SET=61
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.7.1")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+    class GrammarSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def grammarType(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.GrammarTypeContext,0)
+
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(ANTLRv4Parser.SEMI, 0)
+
+        def rules(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RulesContext,0)
+
+
+        def EOF(self):
+            return self.getToken(ANTLRv4Parser.EOF, 0)
+
+        def DOC_COMMENT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.DOC_COMMENT)
+            else:
+                return self.getToken(ANTLRv4Parser.DOC_COMMENT, i)
+
+        def prequelConstruct(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.PrequelConstructContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.PrequelConstructContext,i)
+
+
+        def modeSpec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.ModeSpecContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.ModeSpecContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_grammarSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterGrammarSpec" ):
+                listener.enterGrammarSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitGrammarSpec" ):
+                listener.exitGrammarSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGrammarSpec" ):
+                return visitor.visitGrammarSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def grammarSpec(self):
+
+        localctx = ANTLRv4Parser.GrammarSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_grammarSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 129
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.DOC_COMMENT:
+                self.state = 126
+                self.match(ANTLRv4Parser.DOC_COMMENT)
+                self.state = 131
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 132
+            self.grammarType()
+            self.state = 133
+            self.identifier()
+            self.state = 134
+            self.match(ANTLRv4Parser.SEMI)
+            self.state = 138
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.OPTIONS) | (1 << ANTLRv4Parser.TOKENS) | (1 << ANTLRv4Parser.CHANNELS) | (1 << ANTLRv4Parser.IMPORT) | (1 << ANTLRv4Parser.AT))) != 0):
+                self.state = 135
+                self.prequelConstruct()
+                self.state = 140
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 141
+            self.rules()
+            self.state = 145
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.MODE:
+                self.state = 142
+                self.modeSpec()
+                self.state = 147
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 148
+            self.match(ANTLRv4Parser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class GrammarTypeContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LEXER(self):
+            return self.getToken(ANTLRv4Parser.LEXER, 0)
+
+        def GRAMMAR(self):
+            return self.getToken(ANTLRv4Parser.GRAMMAR, 0)
+
+        def PARSER(self):
+            return self.getToken(ANTLRv4Parser.PARSER, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_grammarType
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterGrammarType" ):
+                listener.enterGrammarType(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitGrammarType" ):
+                listener.exitGrammarType(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGrammarType" ):
+                return visitor.visitGrammarType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def grammarType(self):
+
+        localctx = ANTLRv4Parser.GrammarTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_grammarType)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 155
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.LEXER]:
+                self.state = 150
+                self.match(ANTLRv4Parser.LEXER)
+                self.state = 151
+                self.match(ANTLRv4Parser.GRAMMAR)
+                pass
+            elif token in [ANTLRv4Parser.PARSER]:
+                self.state = 152
+                self.match(ANTLRv4Parser.PARSER)
+                self.state = 153
+                self.match(ANTLRv4Parser.GRAMMAR)
+                pass
+            elif token in [ANTLRv4Parser.GRAMMAR]:
+                self.state = 154
+                self.match(ANTLRv4Parser.GRAMMAR)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class PrequelConstructContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def optionsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.OptionsSpecContext,0)
+
+
+        def delegateGrammars(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.DelegateGrammarsContext,0)
+
+
+        def tokensSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.TokensSpecContext,0)
+
+
+        def channelsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ChannelsSpecContext,0)
+
+
+        def action(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_prequelConstruct
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPrequelConstruct" ):
+                listener.enterPrequelConstruct(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPrequelConstruct" ):
+                listener.exitPrequelConstruct(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrequelConstruct" ):
+                return visitor.visitPrequelConstruct(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def prequelConstruct(self):
+
+        localctx = ANTLRv4Parser.PrequelConstructContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_prequelConstruct)
+        try:
+            self.state = 162
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.OPTIONS]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 157
+                self.optionsSpec()
+                pass
+            elif token in [ANTLRv4Parser.IMPORT]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 158
+                self.delegateGrammars()
+                pass
+            elif token in [ANTLRv4Parser.TOKENS]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 159
+                self.tokensSpec()
+                pass
+            elif token in [ANTLRv4Parser.CHANNELS]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 160
+                self.channelsSpec()
+                pass
+            elif token in [ANTLRv4Parser.AT]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 161
+                self.action()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class OptionsSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def OPTIONS(self):
+            return self.getToken(ANTLRv4Parser.OPTIONS, 0)
+
+        def LBRACE(self):
+            return self.getToken(ANTLRv4Parser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(ANTLRv4Parser.RBRACE, 0)
+
+        def option(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.OptionContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.OptionContext,i)
+
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.SEMI)
+            else:
+                return self.getToken(ANTLRv4Parser.SEMI, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_optionsSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOptionsSpec" ):
+                listener.enterOptionsSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOptionsSpec" ):
+                listener.exitOptionsSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOptionsSpec" ):
+                return visitor.visitOptionsSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def optionsSpec(self):
+
+        localctx = ANTLRv4Parser.OptionsSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_optionsSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 164
+            self.match(ANTLRv4Parser.OPTIONS)
+            self.state = 165
+            self.match(ANTLRv4Parser.LBRACE)
+            self.state = 171
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.TOKEN_REF or _la==ANTLRv4Parser.RULE_REF:
+                self.state = 166
+                self.option()
+                self.state = 167
+                self.match(ANTLRv4Parser.SEMI)
+                self.state = 173
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 174
+            self.match(ANTLRv4Parser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class OptionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.ASSIGN, 0)
+
+        def optionValue(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.OptionValueContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_option
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOption" ):
+                listener.enterOption(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOption" ):
+                listener.exitOption(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOption" ):
+                return visitor.visitOption(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def option(self):
+
+        localctx = ANTLRv4Parser.OptionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_option)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 176
+            self.identifier()
+            self.state = 177
+            self.match(ANTLRv4Parser.ASSIGN)
+            self.state = 178
+            self.optionValue()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class OptionValueContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,i)
+
+
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.DOT)
+            else:
+                return self.getToken(ANTLRv4Parser.DOT, i)
+
+        def STRING_LITERAL(self):
+            return self.getToken(ANTLRv4Parser.STRING_LITERAL, 0)
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def INT(self):
+            return self.getToken(ANTLRv4Parser.INT, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_optionValue
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOptionValue" ):
+                listener.enterOptionValue(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOptionValue" ):
+                listener.exitOptionValue(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOptionValue" ):
+                return visitor.visitOptionValue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def optionValue(self):
+
+        localctx = ANTLRv4Parser.OptionValueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_optionValue)
+        self._la = 0 # Token type
+        try:
+            self.state = 191
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 180
+                self.identifier()
+                self.state = 185
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==ANTLRv4Parser.DOT:
+                    self.state = 181
+                    self.match(ANTLRv4Parser.DOT)
+                    self.state = 182
+                    self.identifier()
+                    self.state = 187
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            elif token in [ANTLRv4Parser.STRING_LITERAL]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 188
+                self.match(ANTLRv4Parser.STRING_LITERAL)
+                pass
+            elif token in [ANTLRv4Parser.BEGIN_ACTION]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 189
+                self.actionBlock()
+                pass
+            elif token in [ANTLRv4Parser.INT]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 190
+                self.match(ANTLRv4Parser.INT)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class DelegateGrammarsContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IMPORT(self):
+            return self.getToken(ANTLRv4Parser.IMPORT, 0)
+
+        def delegateGrammar(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.DelegateGrammarContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.DelegateGrammarContext,i)
+
+
+        def SEMI(self):
+            return self.getToken(ANTLRv4Parser.SEMI, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.COMMA)
+            else:
+                return self.getToken(ANTLRv4Parser.COMMA, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_delegateGrammars
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDelegateGrammars" ):
+                listener.enterDelegateGrammars(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDelegateGrammars" ):
+                listener.exitDelegateGrammars(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDelegateGrammars" ):
+                return visitor.visitDelegateGrammars(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def delegateGrammars(self):
+
+        localctx = ANTLRv4Parser.DelegateGrammarsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_delegateGrammars)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 193
+            self.match(ANTLRv4Parser.IMPORT)
+            self.state = 194
+            self.delegateGrammar()
+            self.state = 199
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.COMMA:
+                self.state = 195
+                self.match(ANTLRv4Parser.COMMA)
+                self.state = 196
+                self.delegateGrammar()
+                self.state = 201
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 202
+            self.match(ANTLRv4Parser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class DelegateGrammarContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,i)
+
+
+        def ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.ASSIGN, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_delegateGrammar
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDelegateGrammar" ):
+                listener.enterDelegateGrammar(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDelegateGrammar" ):
+                listener.exitDelegateGrammar(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDelegateGrammar" ):
+                return visitor.visitDelegateGrammar(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def delegateGrammar(self):
+
+        localctx = ANTLRv4Parser.DelegateGrammarContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_delegateGrammar)
+        try:
+            self.state = 209
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 204
+                self.identifier()
+                self.state = 205
+                self.match(ANTLRv4Parser.ASSIGN)
+                self.state = 206
+                self.identifier()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 208
+                self.identifier()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class TokensSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TOKENS(self):
+            return self.getToken(ANTLRv4Parser.TOKENS, 0)
+
+        def LBRACE(self):
+            return self.getToken(ANTLRv4Parser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(ANTLRv4Parser.RBRACE, 0)
+
+        def idList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdListContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_tokensSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTokensSpec" ):
+                listener.enterTokensSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTokensSpec" ):
+                listener.exitTokensSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTokensSpec" ):
+                return visitor.visitTokensSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def tokensSpec(self):
+
+        localctx = ANTLRv4Parser.TokensSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_tokensSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 211
+            self.match(ANTLRv4Parser.TOKENS)
+            self.state = 212
+            self.match(ANTLRv4Parser.LBRACE)
+            self.state = 214
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.TOKEN_REF or _la==ANTLRv4Parser.RULE_REF:
+                self.state = 213
+                self.idList()
+
+
+            self.state = 216
+            self.match(ANTLRv4Parser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ChannelsSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CHANNELS(self):
+            return self.getToken(ANTLRv4Parser.CHANNELS, 0)
+
+        def LBRACE(self):
+            return self.getToken(ANTLRv4Parser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(ANTLRv4Parser.RBRACE, 0)
+
+        def idList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdListContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_channelsSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterChannelsSpec" ):
+                listener.enterChannelsSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitChannelsSpec" ):
+                listener.exitChannelsSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitChannelsSpec" ):
+                return visitor.visitChannelsSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def channelsSpec(self):
+
+        localctx = ANTLRv4Parser.ChannelsSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_channelsSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 218
+            self.match(ANTLRv4Parser.CHANNELS)
+            self.state = 219
+            self.match(ANTLRv4Parser.LBRACE)
+            self.state = 221
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.TOKEN_REF or _la==ANTLRv4Parser.RULE_REF:
+                self.state = 220
+                self.idList()
+
+
+            self.state = 223
+            self.match(ANTLRv4Parser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class IdListContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.COMMA)
+            else:
+                return self.getToken(ANTLRv4Parser.COMMA, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_idList
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdList" ):
+                listener.enterIdList(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdList" ):
+                listener.exitIdList(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdList" ):
+                return visitor.visitIdList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def idList(self):
+
+        localctx = ANTLRv4Parser.IdListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_idList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 225
+            self.identifier()
+            self.state = 230
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,12,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 226
+                    self.match(ANTLRv4Parser.COMMA)
+                    self.state = 227
+                    self.identifier() 
+                self.state = 232
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,12,self._ctx)
+
+            self.state = 234
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.COMMA:
+                self.state = 233
+                self.match(ANTLRv4Parser.COMMA)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ActionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def AT(self):
+            return self.getToken(ANTLRv4Parser.AT, 0)
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def actionScopeName(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionScopeNameContext,0)
+
+
+        def COLONCOLON(self):
+            return self.getToken(ANTLRv4Parser.COLONCOLON, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_action
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAction" ):
+                listener.enterAction(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAction" ):
+                listener.exitAction(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAction" ):
+                return visitor.visitAction(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def action(self):
+
+        localctx = ANTLRv4Parser.ActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_action)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 236
+            self.match(ANTLRv4Parser.AT)
+            self.state = 240
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.state = 237
+                self.actionScopeName()
+                self.state = 238
+                self.match(ANTLRv4Parser.COLONCOLON)
+
+
+            self.state = 242
+            self.identifier()
+            self.state = 243
+            self.actionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ActionScopeNameContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def LEXER(self):
+            return self.getToken(ANTLRv4Parser.LEXER, 0)
+
+        def PARSER(self):
+            return self.getToken(ANTLRv4Parser.PARSER, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_actionScopeName
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterActionScopeName" ):
+                listener.enterActionScopeName(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitActionScopeName" ):
+                listener.exitActionScopeName(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitActionScopeName" ):
+                return visitor.visitActionScopeName(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def actionScopeName(self):
+
+        localctx = ANTLRv4Parser.ActionScopeNameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_actionScopeName)
+        try:
+            self.state = 248
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 245
+                self.identifier()
+                pass
+            elif token in [ANTLRv4Parser.LEXER]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 246
+                self.match(ANTLRv4Parser.LEXER)
+                pass
+            elif token in [ANTLRv4Parser.PARSER]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 247
+                self.match(ANTLRv4Parser.PARSER)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ActionBlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BEGIN_ACTION(self):
+            return self.getToken(ANTLRv4Parser.BEGIN_ACTION, 0)
+
+        def END_ACTION(self):
+            return self.getToken(ANTLRv4Parser.END_ACTION, 0)
+
+        def ACTION_CONTENT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.ACTION_CONTENT)
+            else:
+                return self.getToken(ANTLRv4Parser.ACTION_CONTENT, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_actionBlock
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterActionBlock" ):
+                listener.enterActionBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitActionBlock" ):
+                listener.exitActionBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitActionBlock" ):
+                return visitor.visitActionBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def actionBlock(self):
+
+        localctx = ANTLRv4Parser.ActionBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_actionBlock)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 250
+            self.match(ANTLRv4Parser.BEGIN_ACTION)
+            self.state = 254
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.ACTION_CONTENT:
+                self.state = 251
+                self.match(ANTLRv4Parser.ACTION_CONTENT)
+                self.state = 256
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 257
+            self.match(ANTLRv4Parser.END_ACTION)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ArgActionBlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BEGIN_ARGUMENT(self):
+            return self.getToken(ANTLRv4Parser.BEGIN_ARGUMENT, 0)
+
+        def END_ARGUMENT(self):
+            return self.getToken(ANTLRv4Parser.END_ARGUMENT, 0)
+
+        def ARGUMENT_CONTENT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.ARGUMENT_CONTENT)
+            else:
+                return self.getToken(ANTLRv4Parser.ARGUMENT_CONTENT, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_argActionBlock
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterArgActionBlock" ):
+                listener.enterArgActionBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitArgActionBlock" ):
+                listener.exitArgActionBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgActionBlock" ):
+                return visitor.visitArgActionBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def argActionBlock(self):
+
+        localctx = ANTLRv4Parser.ArgActionBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_argActionBlock)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 259
+            self.match(ANTLRv4Parser.BEGIN_ARGUMENT)
+            self.state = 263
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.ARGUMENT_CONTENT:
+                self.state = 260
+                self.match(ANTLRv4Parser.ARGUMENT_CONTENT)
+                self.state = 265
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 266
+            self.match(ANTLRv4Parser.END_ARGUMENT)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ModeSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MODE(self):
+            return self.getToken(ANTLRv4Parser.MODE, 0)
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(ANTLRv4Parser.SEMI, 0)
+
+        def lexerRuleSpec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.LexerRuleSpecContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.LexerRuleSpecContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_modeSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterModeSpec" ):
+                listener.enterModeSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitModeSpec" ):
+                listener.exitModeSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitModeSpec" ):
+                return visitor.visitModeSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def modeSpec(self):
+
+        localctx = ANTLRv4Parser.ModeSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_modeSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 268
+            self.match(ANTLRv4Parser.MODE)
+            self.state = 269
+            self.identifier()
+            self.state = 270
+            self.match(ANTLRv4Parser.SEMI)
+            self.state = 274
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.TOKEN_REF) | (1 << ANTLRv4Parser.DOC_COMMENT) | (1 << ANTLRv4Parser.FRAGMENT))) != 0):
+                self.state = 271
+                self.lexerRuleSpec()
+                self.state = 276
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RulesContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ruleSpec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.RuleSpecContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.RuleSpecContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_rules
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRules" ):
+                listener.enterRules(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRules" ):
+                listener.exitRules(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRules" ):
+                return visitor.visitRules(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def rules(self):
+
+        localctx = ANTLRv4Parser.RulesContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_rules)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 280
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.TOKEN_REF) | (1 << ANTLRv4Parser.RULE_REF) | (1 << ANTLRv4Parser.DOC_COMMENT) | (1 << ANTLRv4Parser.FRAGMENT) | (1 << ANTLRv4Parser.PROTECTED) | (1 << ANTLRv4Parser.PUBLIC) | (1 << ANTLRv4Parser.PRIVATE))) != 0):
+                self.state = 277
+                self.ruleSpec()
+                self.state = 282
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def parserRuleSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ParserRuleSpecContext,0)
+
+
+        def lexerRuleSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerRuleSpecContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleSpec" ):
+                listener.enterRuleSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleSpec" ):
+                listener.exitRuleSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleSpec" ):
+                return visitor.visitRuleSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleSpec(self):
+
+        localctx = ANTLRv4Parser.RuleSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_ruleSpec)
+        try:
+            self.state = 285
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 283
+                self.parserRuleSpec()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 284
+                self.lexerRuleSpec()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ParserRuleSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RULE_REF(self):
+            return self.getToken(ANTLRv4Parser.RULE_REF, 0)
+
+        def COLON(self):
+            return self.getToken(ANTLRv4Parser.COLON, 0)
+
+        def ruleBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RuleBlockContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(ANTLRv4Parser.SEMI, 0)
+
+        def exceptionGroup(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ExceptionGroupContext,0)
+
+
+        def DOC_COMMENT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.DOC_COMMENT)
+            else:
+                return self.getToken(ANTLRv4Parser.DOC_COMMENT, i)
+
+        def ruleModifiers(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RuleModifiersContext,0)
+
+
+        def argActionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ArgActionBlockContext,0)
+
+
+        def ruleReturns(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RuleReturnsContext,0)
+
+
+        def throwsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ThrowsSpecContext,0)
+
+
+        def localsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LocalsSpecContext,0)
+
+
+        def rulePrequel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.RulePrequelContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.RulePrequelContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_parserRuleSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterParserRuleSpec" ):
+                listener.enterParserRuleSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitParserRuleSpec" ):
+                listener.exitParserRuleSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParserRuleSpec" ):
+                return visitor.visitParserRuleSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parserRuleSpec(self):
+
+        localctx = ANTLRv4Parser.ParserRuleSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_parserRuleSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 290
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.DOC_COMMENT:
+                self.state = 287
+                self.match(ANTLRv4Parser.DOC_COMMENT)
+                self.state = 292
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 294
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.FRAGMENT) | (1 << ANTLRv4Parser.PROTECTED) | (1 << ANTLRv4Parser.PUBLIC) | (1 << ANTLRv4Parser.PRIVATE))) != 0):
+                self.state = 293
+                self.ruleModifiers()
+
+
+            self.state = 296
+            self.match(ANTLRv4Parser.RULE_REF)
+            self.state = 298
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.BEGIN_ARGUMENT:
+                self.state = 297
+                self.argActionBlock()
+
+
+            self.state = 301
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.RETURNS:
+                self.state = 300
+                self.ruleReturns()
+
+
+            self.state = 304
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.THROWS:
+                self.state = 303
+                self.throwsSpec()
+
+
+            self.state = 307
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.LOCALS:
+                self.state = 306
+                self.localsSpec()
+
+
+            self.state = 312
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.OPTIONS or _la==ANTLRv4Parser.AT:
+                self.state = 309
+                self.rulePrequel()
+                self.state = 314
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 315
+            self.match(ANTLRv4Parser.COLON)
+            self.state = 316
+            self.ruleBlock()
+            self.state = 317
+            self.match(ANTLRv4Parser.SEMI)
+            self.state = 318
+            self.exceptionGroup()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ExceptionGroupContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def exceptionHandler(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.ExceptionHandlerContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.ExceptionHandlerContext,i)
+
+
+        def finallyClause(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.FinallyClauseContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_exceptionGroup
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExceptionGroup" ):
+                listener.enterExceptionGroup(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExceptionGroup" ):
+                listener.exitExceptionGroup(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExceptionGroup" ):
+                return visitor.visitExceptionGroup(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exceptionGroup(self):
+
+        localctx = ANTLRv4Parser.ExceptionGroupContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_exceptionGroup)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 323
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.CATCH:
+                self.state = 320
+                self.exceptionHandler()
+                self.state = 325
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 327
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.FINALLY:
+                self.state = 326
+                self.finallyClause()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ExceptionHandlerContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CATCH(self):
+            return self.getToken(ANTLRv4Parser.CATCH, 0)
+
+        def argActionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ArgActionBlockContext,0)
+
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_exceptionHandler
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExceptionHandler" ):
+                listener.enterExceptionHandler(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExceptionHandler" ):
+                listener.exitExceptionHandler(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExceptionHandler" ):
+                return visitor.visitExceptionHandler(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exceptionHandler(self):
+
+        localctx = ANTLRv4Parser.ExceptionHandlerContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_exceptionHandler)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 329
+            self.match(ANTLRv4Parser.CATCH)
+            self.state = 330
+            self.argActionBlock()
+            self.state = 331
+            self.actionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class FinallyClauseContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FINALLY(self):
+            return self.getToken(ANTLRv4Parser.FINALLY, 0)
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_finallyClause
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFinallyClause" ):
+                listener.enterFinallyClause(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFinallyClause" ):
+                listener.exitFinallyClause(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFinallyClause" ):
+                return visitor.visitFinallyClause(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def finallyClause(self):
+
+        localctx = ANTLRv4Parser.FinallyClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_finallyClause)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 333
+            self.match(ANTLRv4Parser.FINALLY)
+            self.state = 334
+            self.actionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RulePrequelContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def optionsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.OptionsSpecContext,0)
+
+
+        def ruleAction(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RuleActionContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_rulePrequel
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRulePrequel" ):
+                listener.enterRulePrequel(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRulePrequel" ):
+                listener.exitRulePrequel(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRulePrequel" ):
+                return visitor.visitRulePrequel(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def rulePrequel(self):
+
+        localctx = ANTLRv4Parser.RulePrequelContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_rulePrequel)
+        try:
+            self.state = 338
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.OPTIONS]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 336
+                self.optionsSpec()
+                pass
+            elif token in [ANTLRv4Parser.AT]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 337
+                self.ruleAction()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleReturnsContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURNS(self):
+            return self.getToken(ANTLRv4Parser.RETURNS, 0)
+
+        def argActionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ArgActionBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleReturns
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleReturns" ):
+                listener.enterRuleReturns(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleReturns" ):
+                listener.exitRuleReturns(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleReturns" ):
+                return visitor.visitRuleReturns(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleReturns(self):
+
+        localctx = ANTLRv4Parser.RuleReturnsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_ruleReturns)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 340
+            self.match(ANTLRv4Parser.RETURNS)
+            self.state = 341
+            self.argActionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ThrowsSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def THROWS(self):
+            return self.getToken(ANTLRv4Parser.THROWS, 0)
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.COMMA)
+            else:
+                return self.getToken(ANTLRv4Parser.COMMA, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_throwsSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterThrowsSpec" ):
+                listener.enterThrowsSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitThrowsSpec" ):
+                listener.exitThrowsSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitThrowsSpec" ):
+                return visitor.visitThrowsSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def throwsSpec(self):
+
+        localctx = ANTLRv4Parser.ThrowsSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_throwsSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 343
+            self.match(ANTLRv4Parser.THROWS)
+            self.state = 344
+            self.identifier()
+            self.state = 349
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.COMMA:
+                self.state = 345
+                self.match(ANTLRv4Parser.COMMA)
+                self.state = 346
+                self.identifier()
+                self.state = 351
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LocalsSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LOCALS(self):
+            return self.getToken(ANTLRv4Parser.LOCALS, 0)
+
+        def argActionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ArgActionBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_localsSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLocalsSpec" ):
+                listener.enterLocalsSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLocalsSpec" ):
+                listener.exitLocalsSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLocalsSpec" ):
+                return visitor.visitLocalsSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def localsSpec(self):
+
+        localctx = ANTLRv4Parser.LocalsSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_localsSpec)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 352
+            self.match(ANTLRv4Parser.LOCALS)
+            self.state = 353
+            self.argActionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleActionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def AT(self):
+            return self.getToken(ANTLRv4Parser.AT, 0)
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleAction
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleAction" ):
+                listener.enterRuleAction(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleAction" ):
+                listener.exitRuleAction(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleAction" ):
+                return visitor.visitRuleAction(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleAction(self):
+
+        localctx = ANTLRv4Parser.RuleActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_ruleAction)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 355
+            self.match(ANTLRv4Parser.AT)
+            self.state = 356
+            self.identifier()
+            self.state = 357
+            self.actionBlock()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleModifiersContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ruleModifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.RuleModifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.RuleModifierContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleModifiers
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleModifiers" ):
+                listener.enterRuleModifiers(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleModifiers" ):
+                listener.exitRuleModifiers(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleModifiers" ):
+                return visitor.visitRuleModifiers(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleModifiers(self):
+
+        localctx = ANTLRv4Parser.RuleModifiersContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_ruleModifiers)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 360 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 359
+                self.ruleModifier()
+                self.state = 362 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.FRAGMENT) | (1 << ANTLRv4Parser.PROTECTED) | (1 << ANTLRv4Parser.PUBLIC) | (1 << ANTLRv4Parser.PRIVATE))) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleModifierContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def PUBLIC(self):
+            return self.getToken(ANTLRv4Parser.PUBLIC, 0)
+
+        def PRIVATE(self):
+            return self.getToken(ANTLRv4Parser.PRIVATE, 0)
+
+        def PROTECTED(self):
+            return self.getToken(ANTLRv4Parser.PROTECTED, 0)
+
+        def FRAGMENT(self):
+            return self.getToken(ANTLRv4Parser.FRAGMENT, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleModifier
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleModifier" ):
+                listener.enterRuleModifier(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleModifier" ):
+                listener.exitRuleModifier(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleModifier" ):
+                return visitor.visitRuleModifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleModifier(self):
+
+        localctx = ANTLRv4Parser.RuleModifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_ruleModifier)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 364
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.FRAGMENT) | (1 << ANTLRv4Parser.PROTECTED) | (1 << ANTLRv4Parser.PUBLIC) | (1 << ANTLRv4Parser.PRIVATE))) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleBlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ruleAltList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RuleAltListContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleBlock
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleBlock" ):
+                listener.enterRuleBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleBlock" ):
+                listener.exitRuleBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleBlock" ):
+                return visitor.visitRuleBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleBlock(self):
+
+        localctx = ANTLRv4Parser.RuleBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_ruleBlock)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 366
+            self.ruleAltList()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RuleAltListContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def labeledAlt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.LabeledAltContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.LabeledAltContext,i)
+
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.OR)
+            else:
+                return self.getToken(ANTLRv4Parser.OR, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleAltList
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleAltList" ):
+                listener.enterRuleAltList(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleAltList" ):
+                listener.exitRuleAltList(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleAltList" ):
+                return visitor.visitRuleAltList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleAltList(self):
+
+        localctx = ANTLRv4Parser.RuleAltListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_ruleAltList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 368
+            self.labeledAlt()
+            self.state = 373
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.OR:
+                self.state = 369
+                self.match(ANTLRv4Parser.OR)
+                self.state = 370
+                self.labeledAlt()
+                self.state = 375
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LabeledAltContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def alternative(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.AlternativeContext,0)
+
+
+        def POUND(self):
+            return self.getToken(ANTLRv4Parser.POUND, 0)
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_labeledAlt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLabeledAlt" ):
+                listener.enterLabeledAlt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLabeledAlt" ):
+                listener.exitLabeledAlt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLabeledAlt" ):
+                return visitor.visitLabeledAlt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def labeledAlt(self):
+
+        localctx = ANTLRv4Parser.LabeledAltContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_labeledAlt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 376
+            self.alternative()
+            self.state = 379
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.POUND:
+                self.state = 377
+                self.match(ANTLRv4Parser.POUND)
+                self.state = 378
+                self.identifier()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerRuleSpecContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TOKEN_REF(self):
+            return self.getToken(ANTLRv4Parser.TOKEN_REF, 0)
+
+        def COLON(self):
+            return self.getToken(ANTLRv4Parser.COLON, 0)
+
+        def lexerRuleBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerRuleBlockContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(ANTLRv4Parser.SEMI, 0)
+
+        def DOC_COMMENT(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.DOC_COMMENT)
+            else:
+                return self.getToken(ANTLRv4Parser.DOC_COMMENT, i)
+
+        def FRAGMENT(self):
+            return self.getToken(ANTLRv4Parser.FRAGMENT, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerRuleSpec
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerRuleSpec" ):
+                listener.enterLexerRuleSpec(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerRuleSpec" ):
+                listener.exitLexerRuleSpec(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerRuleSpec" ):
+                return visitor.visitLexerRuleSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerRuleSpec(self):
+
+        localctx = ANTLRv4Parser.LexerRuleSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_lexerRuleSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 384
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.DOC_COMMENT:
+                self.state = 381
+                self.match(ANTLRv4Parser.DOC_COMMENT)
+                self.state = 386
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 388
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.FRAGMENT:
+                self.state = 387
+                self.match(ANTLRv4Parser.FRAGMENT)
+
+
+            self.state = 390
+            self.match(ANTLRv4Parser.TOKEN_REF)
+            self.state = 391
+            self.match(ANTLRv4Parser.COLON)
+            self.state = 392
+            self.lexerRuleBlock()
+            self.state = 393
+            self.match(ANTLRv4Parser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerRuleBlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lexerAltList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerAltListContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerRuleBlock
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerRuleBlock" ):
+                listener.enterLexerRuleBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerRuleBlock" ):
+                listener.exitLexerRuleBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerRuleBlock" ):
+                return visitor.visitLexerRuleBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerRuleBlock(self):
+
+        localctx = ANTLRv4Parser.LexerRuleBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_lexerRuleBlock)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 395
+            self.lexerAltList()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerAltListContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lexerAlt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.LexerAltContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.LexerAltContext,i)
+
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.OR)
+            else:
+                return self.getToken(ANTLRv4Parser.OR, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerAltList
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerAltList" ):
+                listener.enterLexerAltList(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerAltList" ):
+                listener.exitLexerAltList(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerAltList" ):
+                return visitor.visitLexerAltList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerAltList(self):
+
+        localctx = ANTLRv4Parser.LexerAltListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_lexerAltList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 397
+            self.lexerAlt()
+            self.state = 402
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.OR:
+                self.state = 398
+                self.match(ANTLRv4Parser.OR)
+                self.state = 399
+                self.lexerAlt()
+                self.state = 404
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerAltContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lexerElements(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerElementsContext,0)
+
+
+        def lexerCommands(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerCommandsContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerAlt
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerAlt" ):
+                listener.enterLexerAlt(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerAlt" ):
+                listener.exitLexerAlt(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerAlt" ):
+                return visitor.visitLexerAlt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerAlt(self):
+
+        localctx = ANTLRv4Parser.LexerAltContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_lexerAlt)
+        self._la = 0 # Token type
+        try:
+            self.state = 410
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF, ANTLRv4Parser.LEXER_CHAR_SET, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.BEGIN_ACTION, ANTLRv4Parser.LPAREN, ANTLRv4Parser.DOT, ANTLRv4Parser.NOT]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 405
+                self.lexerElements()
+                self.state = 407
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.RARROW:
+                    self.state = 406
+                    self.lexerCommands()
+
+
+                pass
+            elif token in [ANTLRv4Parser.SEMI, ANTLRv4Parser.RPAREN, ANTLRv4Parser.OR]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerElementsContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lexerElement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.LexerElementContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.LexerElementContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerElements
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerElements" ):
+                listener.enterLexerElements(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerElements" ):
+                listener.exitLexerElements(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerElements" ):
+                return visitor.visitLexerElements(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerElements(self):
+
+        localctx = ANTLRv4Parser.LexerElementsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_lexerElements)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 413 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 412
+                self.lexerElement()
+                self.state = 415 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.TOKEN_REF) | (1 << ANTLRv4Parser.RULE_REF) | (1 << ANTLRv4Parser.LEXER_CHAR_SET) | (1 << ANTLRv4Parser.STRING_LITERAL) | (1 << ANTLRv4Parser.BEGIN_ACTION) | (1 << ANTLRv4Parser.LPAREN) | (1 << ANTLRv4Parser.DOT) | (1 << ANTLRv4Parser.NOT))) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerElementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def labeledLexerElement(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LabeledLexerElementContext,0)
+
+
+        def ebnfSuffix(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.EbnfSuffixContext,0)
+
+
+        def lexerAtom(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerAtomContext,0)
+
+
+        def lexerBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerBlockContext,0)
+
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def QUESTION(self):
+            return self.getToken(ANTLRv4Parser.QUESTION, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerElement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerElement" ):
+                listener.enterLexerElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerElement" ):
+                listener.exitLexerElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerElement" ):
+                return visitor.visitLexerElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerElement(self):
+
+        localctx = ANTLRv4Parser.LexerElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_lexerElement)
+        self._la = 0 # Token type
+        try:
+            self.state = 433
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,45,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 417
+                self.labeledLexerElement()
+                self.state = 419
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.QUESTION) | (1 << ANTLRv4Parser.STAR) | (1 << ANTLRv4Parser.PLUS))) != 0):
+                    self.state = 418
+                    self.ebnfSuffix()
+
+
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 421
+                self.lexerAtom()
+                self.state = 423
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.QUESTION) | (1 << ANTLRv4Parser.STAR) | (1 << ANTLRv4Parser.PLUS))) != 0):
+                    self.state = 422
+                    self.ebnfSuffix()
+
+
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 425
+                self.lexerBlock()
+                self.state = 427
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.QUESTION) | (1 << ANTLRv4Parser.STAR) | (1 << ANTLRv4Parser.PLUS))) != 0):
+                    self.state = 426
+                    self.ebnfSuffix()
+
+
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 429
+                self.actionBlock()
+                self.state = 431
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.QUESTION:
+                    self.state = 430
+                    self.match(ANTLRv4Parser.QUESTION)
+
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LabeledLexerElementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.ASSIGN, 0)
+
+        def PLUS_ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.PLUS_ASSIGN, 0)
+
+        def lexerAtom(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerAtomContext,0)
+
+
+        def lexerBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerBlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_labeledLexerElement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLabeledLexerElement" ):
+                listener.enterLabeledLexerElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLabeledLexerElement" ):
+                listener.exitLabeledLexerElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLabeledLexerElement" ):
+                return visitor.visitLabeledLexerElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def labeledLexerElement(self):
+
+        localctx = ANTLRv4Parser.LabeledLexerElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_labeledLexerElement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 435
+            self.identifier()
+            self.state = 436
+            _la = self._input.LA(1)
+            if not(_la==ANTLRv4Parser.ASSIGN or _la==ANTLRv4Parser.PLUS_ASSIGN):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 439
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.LEXER_CHAR_SET, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.DOT, ANTLRv4Parser.NOT]:
+                self.state = 437
+                self.lexerAtom()
+                pass
+            elif token in [ANTLRv4Parser.LPAREN]:
+                self.state = 438
+                self.lexerBlock()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerBlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(ANTLRv4Parser.LPAREN, 0)
+
+        def lexerAltList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerAltListContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(ANTLRv4Parser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerBlock
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerBlock" ):
+                listener.enterLexerBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerBlock" ):
+                listener.exitLexerBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerBlock" ):
+                return visitor.visitLexerBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerBlock(self):
+
+        localctx = ANTLRv4Parser.LexerBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_lexerBlock)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 441
+            self.match(ANTLRv4Parser.LPAREN)
+            self.state = 442
+            self.lexerAltList()
+            self.state = 443
+            self.match(ANTLRv4Parser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerCommandsContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RARROW(self):
+            return self.getToken(ANTLRv4Parser.RARROW, 0)
+
+        def lexerCommand(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.LexerCommandContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.LexerCommandContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.COMMA)
+            else:
+                return self.getToken(ANTLRv4Parser.COMMA, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerCommands
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerCommands" ):
+                listener.enterLexerCommands(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerCommands" ):
+                listener.exitLexerCommands(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerCommands" ):
+                return visitor.visitLexerCommands(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerCommands(self):
+
+        localctx = ANTLRv4Parser.LexerCommandsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_lexerCommands)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 445
+            self.match(ANTLRv4Parser.RARROW)
+            self.state = 446
+            self.lexerCommand()
+            self.state = 451
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.COMMA:
+                self.state = 447
+                self.match(ANTLRv4Parser.COMMA)
+                self.state = 448
+                self.lexerCommand()
+                self.state = 453
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerCommandContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lexerCommandName(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerCommandNameContext,0)
+
+
+        def LPAREN(self):
+            return self.getToken(ANTLRv4Parser.LPAREN, 0)
+
+        def lexerCommandExpr(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LexerCommandExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(ANTLRv4Parser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerCommand
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerCommand" ):
+                listener.enterLexerCommand(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerCommand" ):
+                listener.exitLexerCommand(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerCommand" ):
+                return visitor.visitLexerCommand(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerCommand(self):
+
+        localctx = ANTLRv4Parser.LexerCommandContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_lexerCommand)
+        try:
+            self.state = 460
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,48,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 454
+                self.lexerCommandName()
+                self.state = 455
+                self.match(ANTLRv4Parser.LPAREN)
+                self.state = 456
+                self.lexerCommandExpr()
+                self.state = 457
+                self.match(ANTLRv4Parser.RPAREN)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 459
+                self.lexerCommandName()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerCommandNameContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def MODE(self):
+            return self.getToken(ANTLRv4Parser.MODE, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerCommandName
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerCommandName" ):
+                listener.enterLexerCommandName(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerCommandName" ):
+                listener.exitLexerCommandName(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerCommandName" ):
+                return visitor.visitLexerCommandName(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerCommandName(self):
+
+        localctx = ANTLRv4Parser.LexerCommandNameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_lexerCommandName)
+        try:
+            self.state = 464
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 462
+                self.identifier()
+                pass
+            elif token in [ANTLRv4Parser.MODE]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 463
+                self.match(ANTLRv4Parser.MODE)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerCommandExprContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def INT(self):
+            return self.getToken(ANTLRv4Parser.INT, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerCommandExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerCommandExpr" ):
+                listener.enterLexerCommandExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerCommandExpr" ):
+                listener.exitLexerCommandExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerCommandExpr" ):
+                return visitor.visitLexerCommandExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerCommandExpr(self):
+
+        localctx = ANTLRv4Parser.LexerCommandExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_lexerCommandExpr)
+        try:
+            self.state = 468
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 466
+                self.identifier()
+                pass
+            elif token in [ANTLRv4Parser.INT]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 467
+                self.match(ANTLRv4Parser.INT)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class AltListContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def alternative(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.AlternativeContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.AlternativeContext,i)
+
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.OR)
+            else:
+                return self.getToken(ANTLRv4Parser.OR, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_altList
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAltList" ):
+                listener.enterAltList(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAltList" ):
+                listener.exitAltList(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAltList" ):
+                return visitor.visitAltList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def altList(self):
+
+        localctx = ANTLRv4Parser.AltListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_altList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 470
+            self.alternative()
+            self.state = 475
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.OR:
+                self.state = 471
+                self.match(ANTLRv4Parser.OR)
+                self.state = 472
+                self.alternative()
+                self.state = 477
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class AlternativeContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def element(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.ElementContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.ElementContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_alternative
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAlternative" ):
+                listener.enterAlternative(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAlternative" ):
+                listener.exitAlternative(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAlternative" ):
+                return visitor.visitAlternative(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def alternative(self):
+
+        localctx = ANTLRv4Parser.AlternativeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_alternative)
+        self._la = 0 # Token type
+        try:
+            self.state = 487
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.BEGIN_ACTION, ANTLRv4Parser.LPAREN, ANTLRv4Parser.LT, ANTLRv4Parser.DOT, ANTLRv4Parser.NOT]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 479
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 478
+                    self.elementOptions()
+
+
+                self.state = 482 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 481
+                    self.element()
+                    self.state = 484 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.TOKEN_REF) | (1 << ANTLRv4Parser.RULE_REF) | (1 << ANTLRv4Parser.STRING_LITERAL) | (1 << ANTLRv4Parser.BEGIN_ACTION) | (1 << ANTLRv4Parser.LPAREN) | (1 << ANTLRv4Parser.DOT) | (1 << ANTLRv4Parser.NOT))) != 0)):
+                        break
+
+                pass
+            elif token in [ANTLRv4Parser.SEMI, ANTLRv4Parser.RPAREN, ANTLRv4Parser.OR, ANTLRv4Parser.POUND]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ElementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def labeledElement(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.LabeledElementContext,0)
+
+
+        def ebnfSuffix(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.EbnfSuffixContext,0)
+
+
+        def atom(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.AtomContext,0)
+
+
+        def ebnf(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.EbnfContext,0)
+
+
+        def actionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ActionBlockContext,0)
+
+
+        def QUESTION(self):
+            return self.getToken(ANTLRv4Parser.QUESTION, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_element
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterElement" ):
+                listener.enterElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitElement" ):
+                listener.exitElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElement" ):
+                return visitor.visitElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def element(self):
+
+        localctx = ANTLRv4Parser.ElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_element)
+        self._la = 0 # Token type
+        try:
+            self.state = 504
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,58,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 489
+                self.labeledElement()
+                self.state = 492
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [ANTLRv4Parser.QUESTION, ANTLRv4Parser.STAR, ANTLRv4Parser.PLUS]:
+                    self.state = 490
+                    self.ebnfSuffix()
+                    pass
+                elif token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.BEGIN_ACTION, ANTLRv4Parser.SEMI, ANTLRv4Parser.LPAREN, ANTLRv4Parser.RPAREN, ANTLRv4Parser.OR, ANTLRv4Parser.DOT, ANTLRv4Parser.POUND, ANTLRv4Parser.NOT]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 494
+                self.atom()
+                self.state = 497
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [ANTLRv4Parser.QUESTION, ANTLRv4Parser.STAR, ANTLRv4Parser.PLUS]:
+                    self.state = 495
+                    self.ebnfSuffix()
+                    pass
+                elif token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.BEGIN_ACTION, ANTLRv4Parser.SEMI, ANTLRv4Parser.LPAREN, ANTLRv4Parser.RPAREN, ANTLRv4Parser.OR, ANTLRv4Parser.DOT, ANTLRv4Parser.POUND, ANTLRv4Parser.NOT]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 499
+                self.ebnf()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 500
+                self.actionBlock()
+                self.state = 502
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.QUESTION:
+                    self.state = 501
+                    self.match(ANTLRv4Parser.QUESTION)
+
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LabeledElementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.ASSIGN, 0)
+
+        def PLUS_ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.PLUS_ASSIGN, 0)
+
+        def atom(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.AtomContext,0)
+
+
+        def block(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.BlockContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_labeledElement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLabeledElement" ):
+                listener.enterLabeledElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLabeledElement" ):
+                listener.exitLabeledElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLabeledElement" ):
+                return visitor.visitLabeledElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def labeledElement(self):
+
+        localctx = ANTLRv4Parser.LabeledElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_labeledElement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 506
+            self.identifier()
+            self.state = 507
+            _la = self._input.LA(1)
+            if not(_la==ANTLRv4Parser.ASSIGN or _la==ANTLRv4Parser.PLUS_ASSIGN):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 510
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF, ANTLRv4Parser.STRING_LITERAL, ANTLRv4Parser.DOT, ANTLRv4Parser.NOT]:
+                self.state = 508
+                self.atom()
+                pass
+            elif token in [ANTLRv4Parser.LPAREN]:
+                self.state = 509
+                self.block()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class EbnfContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def block(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.BlockContext,0)
+
+
+        def blockSuffix(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.BlockSuffixContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ebnf
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterEbnf" ):
+                listener.enterEbnf(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitEbnf" ):
+                listener.exitEbnf(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEbnf" ):
+                return visitor.visitEbnf(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ebnf(self):
+
+        localctx = ANTLRv4Parser.EbnfContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_ebnf)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 512
+            self.block()
+            self.state = 514
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.QUESTION) | (1 << ANTLRv4Parser.STAR) | (1 << ANTLRv4Parser.PLUS))) != 0):
+                self.state = 513
+                self.blockSuffix()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class BlockSuffixContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ebnfSuffix(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.EbnfSuffixContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_blockSuffix
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBlockSuffix" ):
+                listener.enterBlockSuffix(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBlockSuffix" ):
+                listener.exitBlockSuffix(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockSuffix" ):
+                return visitor.visitBlockSuffix(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockSuffix(self):
+
+        localctx = ANTLRv4Parser.BlockSuffixContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_blockSuffix)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 516
+            self.ebnfSuffix()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class EbnfSuffixContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def QUESTION(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.QUESTION)
+            else:
+                return self.getToken(ANTLRv4Parser.QUESTION, i)
+
+        def STAR(self):
+            return self.getToken(ANTLRv4Parser.STAR, 0)
+
+        def PLUS(self):
+            return self.getToken(ANTLRv4Parser.PLUS, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ebnfSuffix
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterEbnfSuffix" ):
+                listener.enterEbnfSuffix(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitEbnfSuffix" ):
+                listener.exitEbnfSuffix(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEbnfSuffix" ):
+                return visitor.visitEbnfSuffix(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ebnfSuffix(self):
+
+        localctx = ANTLRv4Parser.EbnfSuffixContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 100, self.RULE_ebnfSuffix)
+        self._la = 0 # Token type
+        try:
+            self.state = 530
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.QUESTION]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 518
+                self.match(ANTLRv4Parser.QUESTION)
+                self.state = 520
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.QUESTION:
+                    self.state = 519
+                    self.match(ANTLRv4Parser.QUESTION)
+
+
+                pass
+            elif token in [ANTLRv4Parser.STAR]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 522
+                self.match(ANTLRv4Parser.STAR)
+                self.state = 524
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.QUESTION:
+                    self.state = 523
+                    self.match(ANTLRv4Parser.QUESTION)
+
+
+                pass
+            elif token in [ANTLRv4Parser.PLUS]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 526
+                self.match(ANTLRv4Parser.PLUS)
+                self.state = 528
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.QUESTION:
+                    self.state = 527
+                    self.match(ANTLRv4Parser.QUESTION)
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class LexerAtomContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def characterRange(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.CharacterRangeContext,0)
+
+
+        def terminal(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.TerminalContext,0)
+
+
+        def notSet(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.NotSetContext,0)
+
+
+        def LEXER_CHAR_SET(self):
+            return self.getToken(ANTLRv4Parser.LEXER_CHAR_SET, 0)
+
+        def DOT(self):
+            return self.getToken(ANTLRv4Parser.DOT, 0)
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_lexerAtom
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLexerAtom" ):
+                listener.enterLexerAtom(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLexerAtom" ):
+                listener.exitLexerAtom(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLexerAtom" ):
+                return visitor.visitLexerAtom(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lexerAtom(self):
+
+        localctx = ANTLRv4Parser.LexerAtomContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 102, self.RULE_lexerAtom)
+        self._la = 0 # Token type
+        try:
+            self.state = 540
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,66,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 532
+                self.characterRange()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 533
+                self.terminal()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 534
+                self.notSet()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 535
+                self.match(ANTLRv4Parser.LEXER_CHAR_SET)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 536
+                self.match(ANTLRv4Parser.DOT)
+                self.state = 538
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 537
+                    self.elementOptions()
+
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class AtomContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def terminal(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.TerminalContext,0)
+
+
+        def ruleref(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.RulerefContext,0)
+
+
+        def notSet(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.NotSetContext,0)
+
+
+        def DOT(self):
+            return self.getToken(ANTLRv4Parser.DOT, 0)
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_atom
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAtom" ):
+                listener.enterAtom(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAtom" ):
+                listener.exitAtom(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtom" ):
+                return visitor.visitAtom(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def atom(self):
+
+        localctx = ANTLRv4Parser.AtomContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 104, self.RULE_atom)
+        self._la = 0 # Token type
+        try:
+            self.state = 549
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.STRING_LITERAL]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 542
+                self.terminal()
+                pass
+            elif token in [ANTLRv4Parser.RULE_REF]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 543
+                self.ruleref()
+                pass
+            elif token in [ANTLRv4Parser.NOT]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 544
+                self.notSet()
+                pass
+            elif token in [ANTLRv4Parser.DOT]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 545
+                self.match(ANTLRv4Parser.DOT)
+                self.state = 547
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 546
+                    self.elementOptions()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class NotSetContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NOT(self):
+            return self.getToken(ANTLRv4Parser.NOT, 0)
+
+        def setElement(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.SetElementContext,0)
+
+
+        def blockSet(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.BlockSetContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_notSet
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterNotSet" ):
+                listener.enterNotSet(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitNotSet" ):
+                listener.exitNotSet(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNotSet" ):
+                return visitor.visitNotSet(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def notSet(self):
+
+        localctx = ANTLRv4Parser.NotSetContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 106, self.RULE_notSet)
+        try:
+            self.state = 555
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,69,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 551
+                self.match(ANTLRv4Parser.NOT)
+                self.state = 552
+                self.setElement()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 553
+                self.match(ANTLRv4Parser.NOT)
+                self.state = 554
+                self.blockSet()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class BlockSetContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(ANTLRv4Parser.LPAREN, 0)
+
+        def setElement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.SetElementContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.SetElementContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(ANTLRv4Parser.RPAREN, 0)
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.OR)
+            else:
+                return self.getToken(ANTLRv4Parser.OR, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_blockSet
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBlockSet" ):
+                listener.enterBlockSet(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBlockSet" ):
+                listener.exitBlockSet(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockSet" ):
+                return visitor.visitBlockSet(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockSet(self):
+
+        localctx = ANTLRv4Parser.BlockSetContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 108, self.RULE_blockSet)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 557
+            self.match(ANTLRv4Parser.LPAREN)
+            self.state = 558
+            self.setElement()
+            self.state = 563
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.OR:
+                self.state = 559
+                self.match(ANTLRv4Parser.OR)
+                self.state = 560
+                self.setElement()
+                self.state = 565
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 566
+            self.match(ANTLRv4Parser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class SetElementContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TOKEN_REF(self):
+            return self.getToken(ANTLRv4Parser.TOKEN_REF, 0)
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def STRING_LITERAL(self):
+            return self.getToken(ANTLRv4Parser.STRING_LITERAL, 0)
+
+        def characterRange(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.CharacterRangeContext,0)
+
+
+        def LEXER_CHAR_SET(self):
+            return self.getToken(ANTLRv4Parser.LEXER_CHAR_SET, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_setElement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSetElement" ):
+                listener.enterSetElement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSetElement" ):
+                listener.exitSetElement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSetElement" ):
+                return visitor.visitSetElement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def setElement(self):
+
+        localctx = ANTLRv4Parser.SetElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 110, self.RULE_setElement)
+        self._la = 0 # Token type
+        try:
+            self.state = 578
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,73,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 568
+                self.match(ANTLRv4Parser.TOKEN_REF)
+                self.state = 570
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 569
+                    self.elementOptions()
+
+
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 572
+                self.match(ANTLRv4Parser.STRING_LITERAL)
+                self.state = 574
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 573
+                    self.elementOptions()
+
+
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 576
+                self.characterRange()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 577
+                self.match(ANTLRv4Parser.LEXER_CHAR_SET)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class BlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(ANTLRv4Parser.LPAREN, 0)
+
+        def altList(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.AltListContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(ANTLRv4Parser.RPAREN, 0)
+
+        def COLON(self):
+            return self.getToken(ANTLRv4Parser.COLON, 0)
+
+        def optionsSpec(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.OptionsSpecContext,0)
+
+
+        def ruleAction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.RuleActionContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.RuleActionContext,i)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_block
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBlock" ):
+                listener.enterBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBlock" ):
+                listener.exitBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = ANTLRv4Parser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 112, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 580
+            self.match(ANTLRv4Parser.LPAREN)
+            self.state = 591
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << ANTLRv4Parser.OPTIONS) | (1 << ANTLRv4Parser.COLON) | (1 << ANTLRv4Parser.AT))) != 0):
+                self.state = 582
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.OPTIONS:
+                    self.state = 581
+                    self.optionsSpec()
+
+
+                self.state = 587
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==ANTLRv4Parser.AT:
+                    self.state = 584
+                    self.ruleAction()
+                    self.state = 589
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 590
+                self.match(ANTLRv4Parser.COLON)
+
+
+            self.state = 593
+            self.altList()
+            self.state = 594
+            self.match(ANTLRv4Parser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class RulerefContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RULE_REF(self):
+            return self.getToken(ANTLRv4Parser.RULE_REF, 0)
+
+        def argActionBlock(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ArgActionBlockContext,0)
+
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_ruleref
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRuleref" ):
+                listener.enterRuleref(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRuleref" ):
+                listener.exitRuleref(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRuleref" ):
+                return visitor.visitRuleref(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ruleref(self):
+
+        localctx = ANTLRv4Parser.RulerefContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 114, self.RULE_ruleref)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 596
+            self.match(ANTLRv4Parser.RULE_REF)
+            self.state = 598
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.BEGIN_ARGUMENT:
+                self.state = 597
+                self.argActionBlock()
+
+
+            self.state = 601
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==ANTLRv4Parser.LT:
+                self.state = 600
+                self.elementOptions()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class CharacterRangeContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRING_LITERAL(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.STRING_LITERAL)
+            else:
+                return self.getToken(ANTLRv4Parser.STRING_LITERAL, i)
+
+        def RANGE(self):
+            return self.getToken(ANTLRv4Parser.RANGE, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_characterRange
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCharacterRange" ):
+                listener.enterCharacterRange(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCharacterRange" ):
+                listener.exitCharacterRange(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCharacterRange" ):
+                return visitor.visitCharacterRange(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def characterRange(self):
+
+        localctx = ANTLRv4Parser.CharacterRangeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 116, self.RULE_characterRange)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 603
+            self.match(ANTLRv4Parser.STRING_LITERAL)
+            self.state = 604
+            self.match(ANTLRv4Parser.RANGE)
+            self.state = 605
+            self.match(ANTLRv4Parser.STRING_LITERAL)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class TerminalContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TOKEN_REF(self):
+            return self.getToken(ANTLRv4Parser.TOKEN_REF, 0)
+
+        def elementOptions(self):
+            return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionsContext,0)
+
+
+        def STRING_LITERAL(self):
+            return self.getToken(ANTLRv4Parser.STRING_LITERAL, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_terminal
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTerminal" ):
+                listener.enterTerminal(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTerminal" ):
+                listener.exitTerminal(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTerminal" ):
+                return visitor.visitTerminal(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def terminal(self):
+
+        localctx = ANTLRv4Parser.TerminalContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 118, self.RULE_terminal)
+        self._la = 0 # Token type
+        try:
+            self.state = 615
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [ANTLRv4Parser.TOKEN_REF]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 607
+                self.match(ANTLRv4Parser.TOKEN_REF)
+                self.state = 609
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 608
+                    self.elementOptions()
+
+
+                pass
+            elif token in [ANTLRv4Parser.STRING_LITERAL]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 611
+                self.match(ANTLRv4Parser.STRING_LITERAL)
+                self.state = 613
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==ANTLRv4Parser.LT:
+                    self.state = 612
+                    self.elementOptions()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ElementOptionsContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LT(self):
+            return self.getToken(ANTLRv4Parser.LT, 0)
+
+        def elementOption(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.ElementOptionContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.ElementOptionContext,i)
+
+
+        def GT(self):
+            return self.getToken(ANTLRv4Parser.GT, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ANTLRv4Parser.COMMA)
+            else:
+                return self.getToken(ANTLRv4Parser.COMMA, i)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_elementOptions
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterElementOptions" ):
+                listener.enterElementOptions(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitElementOptions" ):
+                listener.exitElementOptions(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElementOptions" ):
+                return visitor.visitElementOptions(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elementOptions(self):
+
+        localctx = ANTLRv4Parser.ElementOptionsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 120, self.RULE_elementOptions)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 617
+            self.match(ANTLRv4Parser.LT)
+            self.state = 618
+            self.elementOption()
+            self.state = 623
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==ANTLRv4Parser.COMMA:
+                self.state = 619
+                self.match(ANTLRv4Parser.COMMA)
+                self.state = 620
+                self.elementOption()
+                self.state = 625
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 626
+            self.match(ANTLRv4Parser.GT)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class ElementOptionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def identifier(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ANTLRv4Parser.IdentifierContext)
+            else:
+                return self.getTypedRuleContext(ANTLRv4Parser.IdentifierContext,i)
+
+
+        def ASSIGN(self):
+            return self.getToken(ANTLRv4Parser.ASSIGN, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(ANTLRv4Parser.STRING_LITERAL, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_elementOption
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterElementOption" ):
+                listener.enterElementOption(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitElementOption" ):
+                listener.exitElementOption(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElementOption" ):
+                return visitor.visitElementOption(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elementOption(self):
+
+        localctx = ANTLRv4Parser.ElementOptionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 122, self.RULE_elementOption)
+        try:
+            self.state = 635
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,84,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 628
+                self.identifier()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 629
+                self.identifier()
+                self.state = 630
+                self.match(ANTLRv4Parser.ASSIGN)
+                self.state = 633
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [ANTLRv4Parser.TOKEN_REF, ANTLRv4Parser.RULE_REF]:
+                    self.state = 631
+                    self.identifier()
+                    pass
+                elif token in [ANTLRv4Parser.STRING_LITERAL]:
+                    self.state = 632
+                    self.match(ANTLRv4Parser.STRING_LITERAL)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class IdentifierContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RULE_REF(self):
+            return self.getToken(ANTLRv4Parser.RULE_REF, 0)
+
+        def TOKEN_REF(self):
+            return self.getToken(ANTLRv4Parser.TOKEN_REF, 0)
+
+        def getRuleIndex(self):
+            return ANTLRv4Parser.RULE_identifier
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdentifier" ):
+                listener.enterIdentifier(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdentifier" ):
+                listener.exitIdentifier(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifier" ):
+                return visitor.visitIdentifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identifier(self):
+
+        localctx = ANTLRv4Parser.IdentifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 124, self.RULE_identifier)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 637
+            _la = self._input.LA(1)
+            if not(_la==ANTLRv4Parser.TOKEN_REF or _la==ANTLRv4Parser.RULE_REF):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
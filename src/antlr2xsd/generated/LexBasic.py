@@ -0,0 +1,185 @@
+# Generated from LexBasic.g4 by ANTLR 4.7.1
+from antlr4 import *
+from io import StringIO
+from typing.io import TextIO
+import sys
+
+
+def serializedATN():
+    with StringIO() as buf:
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2\2")
+        buf.write("\u0138\b\1\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7")
+        buf.write("\t\7\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r")
+        buf.write("\4\16\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23")
+        buf.write("\t\23\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30")
+        buf.write("\4\31\t\31\4\32\t\32\4\33\t\33\4\34\t\34\4\35\t\35\4\36")
+        buf.write("\t\36\4\37\t\37\4 \t \4!\t!\4\"\t\"\4#\t#\4$\t$\4%\t%")
+        buf.write("\4&\t&\4\'\t\'\4(\t(\4)\t)\4*\t*\4+\t+\4,\t,\4-\t-\4.")
+        buf.write("\t.\4/\t/\4\60\t\60\4\61\t\61\4\62\t\62\4\63\t\63\4\64")
+        buf.write("\t\64\3\2\3\2\5\2l\n\2\3\3\3\3\3\4\3\4\3\5\3\5\3\5\3\5")
+        buf.write("\7\5v\n\5\f\5\16\5y\13\5\3\5\3\5\3\5\5\5~\n\5\3\6\3\6")
+        buf.write("\3\6\3\6\3\6\7\6\u0085\n\6\f\6\16\6\u0088\13\6\3\6\3\6")
+        buf.write("\3\6\5\6\u008d\n\6\3\7\3\7\3\7\3\7\7\7\u0093\n\7\f\7\16")
+        buf.write("\7\u0096\13\7\3\b\3\b\3\b\3\b\3\b\5\b\u009d\n\b\3\t\3")
+        buf.write("\t\3\t\3\n\3\n\3\n\3\n\3\n\5\n\u00a7\n\n\5\n\u00a9\n\n")
+        buf.write("\5\n\u00ab\n\n\5\n\u00ad\n\n\3\13\3\13\3\13\7\13\u00b2")
+        buf.write("\n\13\f\13\16\13\u00b5\13\13\5\13\u00b7\n\13\3\f\3\f\3")
+        buf.write("\r\3\r\3\16\3\16\3\16\3\16\3\16\3\16\3\16\3\16\3\16\5")
+        buf.write("\16\u00c6\n\16\3\17\3\17\3\17\5\17\u00cb\n\17\3\17\3\17")
+        buf.write("\3\20\3\20\3\20\7\20\u00d2\n\20\f\20\16\20\u00d5\13\20")
+        buf.write("\3\20\3\20\3\21\3\21\3\21\7\21\u00dc\n\21\f\21\16\21\u00df")
+        buf.write("\13\21\3\21\3\21\3\22\3\22\3\22\7\22\u00e6\n\22\f\22\16")
+        buf.write("\22\u00e9\13\22\3\23\3\23\3\23\3\23\5\23\u00ef\n\23\3")
+        buf.write("\24\3\24\3\25\3\25\3\26\3\26\3\27\3\27\3\27\3\27\3\30")
+        buf.write("\3\30\3\31\3\31\3\32\3\32\3\32\3\33\3\33\3\34\3\34\3\35")
+        buf.write("\3\35\3\36\3\36\3\37\3\37\3 \3 \3!\3!\3\"\3\"\3#\3#\3")
+        buf.write("#\3$\3$\3%\3%\3&\3&\3\'\3\'\3(\3(\3)\3)\3*\3*\3*\3+\3")
+        buf.write("+\3,\3,\3-\3-\3.\3.\3/\3/\3\60\3\60\3\61\3\61\3\61\3\62")
+        buf.write("\3\62\3\63\3\63\3\64\3\64\4w\u0086\2\65\3\2\5\2\7\2\t")
+        buf.write("\2\13\2\r\2\17\2\21\2\23\2\25\2\27\2\31\2\33\2\35\2\37")
+        buf.write("\2!\2#\2%\2\'\2)\2+\2-\2/\2\61\2\63\2\65\2\67\29\2;\2")
+        buf.write("=\2?\2A\2C\2E\2G\2I\2K\2M\2O\2Q\2S\2U\2W\2Y\2[\2]\2_\2")
+        buf.write("a\2c\2e\2g\2\3\2\16\4\2\13\13\"\"\4\2\f\f\16\17\4\2\f")
+        buf.write("\f\17\17\n\2$$))^^ddhhppttvv\3\2\63;\5\2\62;CHch\3\2\62")
+        buf.write(";\6\2\f\f\17\17))^^\6\2\f\f\17\17$$^^\5\2\u00b9\u00b9")
+        buf.write("\u0302\u0371\u2041\u2042\17\2C\\c|\u00c2\u00d8\u00da\u00f8")
+        buf.write("\u00fa\u0301\u0372\u037f\u0381\u2001\u200e\u200f\u2072")
+        buf.write("\u2191\u2c02\u2ff1\u3003\ud801\uf902\ufdd1\ufdf2\uffff")
+        buf.write("\16\2C\\\u00c2\u00d8\u00da\u00f8\u00fa\u0301\u0372\u037f")
+        buf.write("\u0381\u2001\u200e\u200f\u2072\u2191\u2c02\u2ff1\u3003")
+        buf.write("\ud801\uf902\ufdd1\ufdf2\uffff\2\u011e\3k\3\2\2\2\5m\3")
+        buf.write("\2\2\2\7o\3\2\2\2\tq\3\2\2\2\13\177\3\2\2\2\r\u008e\3")
+        buf.write("\2\2\2\17\u0097\3\2\2\2\21\u009e\3\2\2\2\23\u00a1\3\2")
+        buf.write("\2\2\25\u00b6\3\2\2\2\27\u00b8\3\2\2\2\31\u00ba\3\2\2")
+        buf.write("\2\33\u00c5\3\2\2\2\35\u00c7\3\2\2\2\37\u00ce\3\2\2\2")
+        buf.write("!\u00d8\3\2\2\2#\u00e2\3\2\2\2%\u00ee\3\2\2\2\'\u00f0")
+        buf.write("\3\2\2\2)\u00f2\3\2\2\2+\u00f4\3\2\2\2-\u00f6\3\2\2\2")
+        buf.write("/\u00fa\3\2\2\2\61\u00fc\3\2\2\2\63\u00fe\3\2\2\2\65\u0101")
+        buf.write("\3\2\2\2\67\u0103\3\2\2\29\u0105\3\2\2\2;\u0107\3\2\2")
+        buf.write("\2=\u0109\3\2\2\2?\u010b\3\2\2\2A\u010d\3\2\2\2C\u010f")
+        buf.write("\3\2\2\2E\u0111\3\2\2\2G\u0114\3\2\2\2I\u0116\3\2\2\2")
+        buf.write("K\u0118\3\2\2\2M\u011a\3\2\2\2O\u011c\3\2\2\2Q\u011e\3")
+        buf.write("\2\2\2S\u0120\3\2\2\2U\u0123\3\2\2\2W\u0125\3\2\2\2Y\u0127")
+        buf.write("\3\2\2\2[\u0129\3\2\2\2]\u012b\3\2\2\2_\u012d\3\2\2\2")
+        buf.write("a\u012f\3\2\2\2c\u0132\3\2\2\2e\u0134\3\2\2\2g\u0136\3")
+        buf.write("\2\2\2il\5\5\3\2jl\5\7\4\2ki\3\2\2\2kj\3\2\2\2l\4\3\2")
+        buf.write("\2\2mn\t\2\2\2n\6\3\2\2\2op\t\3\2\2p\b\3\2\2\2qr\7\61")
+        buf.write("\2\2rs\7,\2\2sw\3\2\2\2tv\13\2\2\2ut\3\2\2\2vy\3\2\2\2")
+        buf.write("wx\3\2\2\2wu\3\2\2\2x}\3\2\2\2yw\3\2\2\2z{\7,\2\2{~\7")
+        buf.write("\61\2\2|~\7\2\2\3}z\3\2\2\2}|\3\2\2\2~\n\3\2\2\2\177\u0080")
+        buf.write("\7\61\2\2\u0080\u0081\7,\2\2\u0081\u0082\7,\2\2\u0082")
+        buf.write("\u0086\3\2\2\2\u0083\u0085\13\2\2\2\u0084\u0083\3\2\2")
+        buf.write("\2\u0085\u0088\3\2\2\2\u0086\u0087\3\2\2\2\u0086\u0084")
+        buf.write("\3\2\2\2\u0087\u008c\3\2\2\2\u0088\u0086\3\2\2\2\u0089")
+        buf.write("\u008a\7,\2\2\u008a\u008d\7\61\2\2\u008b\u008d\7\2\2\3")
+        buf.write("\u008c\u0089\3\2\2\2\u008c\u008b\3\2\2\2\u008d\f\3\2\2")
+        buf.write("\2\u008e\u008f\7\61\2\2\u008f\u0090\7\61\2\2\u0090\u0094")
+        buf.write("\3\2\2\2\u0091\u0093\n\4\2\2\u0092\u0091\3\2\2\2\u0093")
+        buf.write("\u0096\3\2\2\2\u0094\u0092\3\2\2\2\u0094\u0095\3\2\2\2")
+        buf.write("\u0095\16\3\2\2\2\u0096\u0094\3\2\2\2\u0097\u009c\5/\30")
+        buf.write("\2\u0098\u009d\t\5\2\2\u0099\u009d\5\23\n\2\u009a\u009d")
+        buf.write("\13\2\2\2\u009b\u009d\7\2\2\3\u009c\u0098\3\2\2\2\u009c")
+        buf.write("\u0099\3\2\2\2\u009c\u009a\3\2\2\2\u009c\u009b\3\2\2\2")
+        buf.write("\u009d\20\3\2\2\2\u009e\u009f\5/\30\2\u009f\u00a0\13\2")
+        buf.write("\2\2\u00a0\22\3\2\2\2\u00a1\u00ac\7w\2\2\u00a2\u00aa\5")
+        buf.write("\27\f\2\u00a3\u00a8\5\27\f\2\u00a4\u00a6\5\27\f\2\u00a5")
+        buf.write("\u00a7\5\27\f\2\u00a6\u00a5\3\2\2\2\u00a6\u00a7\3\2\2")
+        buf.write("\2\u00a7\u00a9\3\2\2\2\u00a8\u00a4\3\2\2\2\u00a8\u00a9")
+        buf.write("\3\2\2\2\u00a9\u00ab\3\2\2\2\u00aa\u00a3\3\2\2\2\u00aa")
+        buf.write("\u00ab\3\2\2\2\u00ab\u00ad\3\2\2\2\u00ac\u00a2\3\2\2\2")
+        buf.write("\u00ac\u00ad\3\2\2\2\u00ad\24\3\2\2\2\u00ae\u00b7\7\62")
+        buf.write("\2\2\u00af\u00b3\t\6\2\2\u00b0\u00b2\5\31\r\2\u00b1\u00b0")
+        buf.write("\3\2\2\2\u00b2\u00b5\3\2\2\2\u00b3\u00b1\3\2\2\2\u00b3")
+        buf.write("\u00b4\3\2\2\2\u00b4\u00b7\3\2\2\2\u00b5\u00b3\3\2\2\2")
+        buf.write("\u00b6\u00ae\3\2\2\2\u00b6\u00af\3\2\2\2\u00b7\26\3\2")
+        buf.write("\2\2\u00b8\u00b9\t\7\2\2\u00b9\30\3\2\2\2\u00ba\u00bb")
+        buf.write("\t\b\2\2\u00bb\32\3\2\2\2\u00bc\u00bd\7v\2\2\u00bd\u00be")
+        buf.write("\7t\2\2\u00be\u00bf\7w\2\2\u00bf\u00c6\7g\2\2\u00c0\u00c1")
+        buf.write("\7h\2\2\u00c1\u00c2\7c\2\2\u00c2\u00c3\7n\2\2\u00c3\u00c4")
+        buf.write("\7u\2\2\u00c4\u00c6\7g\2\2\u00c5\u00bc\3\2\2\2\u00c5\u00c0")
+        buf.write("\3\2\2\2\u00c6\34\3\2\2\2\u00c7\u00ca\5\65\33\2\u00c8")
+        buf.write("\u00cb\5\17\b\2\u00c9\u00cb\n\t\2\2\u00ca\u00c8\3\2\2")
+        buf.write("\2\u00ca\u00c9\3\2\2\2\u00cb\u00cc\3\2\2\2\u00cc\u00cd")
+        buf.write("\5\65\33\2\u00cd\36\3\2\2\2\u00ce\u00d3\5\65\33\2\u00cf")
+        buf.write("\u00d2\5\17\b\2\u00d0\u00d2\n\t\2\2\u00d1\u00cf\3\2\2")
+        buf.write("\2\u00d1\u00d0\3\2\2\2\u00d2\u00d5\3\2\2\2\u00d3\u00d1")
+        buf.write("\3\2\2\2\u00d3\u00d4\3\2\2\2\u00d4\u00d6\3\2\2\2\u00d5")
+        buf.write("\u00d3\3\2\2\2\u00d6\u00d7\5\65\33\2\u00d7 \3\2\2\2\u00d8")
+        buf.write("\u00dd\5\67\34\2\u00d9\u00dc\5\17\b\2\u00da\u00dc\n\n")
+        buf.write("\2\2\u00db\u00d9\3\2\2\2\u00db\u00da\3\2\2\2\u00dc\u00df")
+        buf.write("\3\2\2\2\u00dd\u00db\3\2\2\2\u00dd\u00de\3\2\2\2\u00de")
+        buf.write("\u00e0\3\2\2\2\u00df\u00dd\3\2\2\2\u00e0\u00e1\5\67\34")
+        buf.write("\2\u00e1\"\3\2\2\2\u00e2\u00e7\5\65\33\2\u00e3\u00e6\5")
+        buf.write("\17\b\2\u00e4\u00e6\n\t\2\2\u00e5\u00e3\3\2\2\2\u00e5")
+        buf.write("\u00e4\3\2\2\2\u00e6\u00e9\3\2\2\2\u00e7\u00e5\3\2\2\2")
+        buf.write("\u00e7\u00e8\3\2\2\2\u00e8$\3\2\2\2\u00e9\u00e7\3\2\2")
+        buf.write("\2\u00ea\u00ef\5\'\24\2\u00eb\u00ef\4\62;\2\u00ec\u00ef")
+        buf.write("\5U+\2\u00ed\u00ef\t\13\2\2\u00ee\u00ea\3\2\2\2\u00ee")
+        buf.write("\u00eb\3\2\2\2\u00ee\u00ec\3\2\2\2\u00ee\u00ed\3\2\2\2")
+        buf.write("\u00ef&\3\2\2\2\u00f0\u00f1\t\f\2\2\u00f1(\3\2\2\2\u00f2")
+        buf.write("\u00f3\t\r\2\2\u00f3*\3\2\2\2\u00f4\u00f5\t\r\2\2\u00f5")
+        buf.write(",\3\2\2\2\u00f6\u00f7\7k\2\2\u00f7\u00f8\7p\2\2\u00f8")
+        buf.write("\u00f9\7v\2\2\u00f9.\3\2\2\2\u00fa\u00fb\7^\2\2\u00fb")
+        buf.write("\60\3\2\2\2\u00fc\u00fd\7<\2\2\u00fd\62\3\2\2\2\u00fe")
+        buf.write("\u00ff\7<\2\2\u00ff\u0100\7<\2\2\u0100\64\3\2\2\2\u0101")
+        buf.write("\u0102\7)\2\2\u0102\66\3\2\2\2\u0103\u0104\7$\2\2\u0104")
+        buf.write("8\3\2\2\2\u0105\u0106\7*\2\2\u0106:\3\2\2\2\u0107\u0108")
+        buf.write("\7+\2\2\u0108<\3\2\2\2\u0109\u010a\7}\2\2\u010a>\3\2\2")
+        buf.write("\2\u010b\u010c\7\177\2\2\u010c@\3\2\2\2\u010d\u010e\7")
+        buf.write("]\2\2\u010eB\3\2\2\2\u010f\u0110\7_\2\2\u0110D\3\2\2\2")
+        buf.write("\u0111\u0112\7/\2\2\u0112\u0113\7@\2\2\u0113F\3\2\2\2")
+        buf.write("\u0114\u0115\7>\2\2\u0115H\3\2\2\2\u0116\u0117\7@\2\2")
+        buf.write("\u0117J\3\2\2\2\u0118\u0119\7?\2\2\u0119L\3\2\2\2\u011a")
+        buf.write("\u011b\7A\2\2\u011bN\3\2\2\2\u011c\u011d\7,\2\2\u011d")
+        buf.write("P\3\2\2\2\u011e\u011f\7-\2\2\u011fR\3\2\2\2\u0120\u0121")
+        buf.write("\7-\2\2\u0121\u0122\7?\2\2\u0122T\3\2\2\2\u0123\u0124")
+        buf.write("\7a\2\2\u0124V\3\2\2\2\u0125\u0126\7~\2\2\u0126X\3\2\2")
+        buf.write("\2\u0127\u0128\7&\2\2\u0128Z\3\2\2\2\u0129\u012a\7.\2")
+        buf.write("\2\u012a\\\3\2\2\2\u012b\u012c\7=\2\2\u012c^\3\2\2\2\u012d")
+        buf.write("\u012e\7\60\2\2\u012e`\3\2\2\2\u012f\u0130\7\60\2\2\u0130")
+        buf.write("\u0131\7\60\2\2\u0131b\3\2\2\2\u0132\u0133\7B\2\2\u0133")
+        buf.write("d\3\2\2\2\u0134\u0135\7%\2\2\u0135f\3\2\2\2\u0136\u0137")
+        buf.write("\7\u0080\2\2\u0137h\3\2\2\2\31\2kw}\u0086\u008c\u0094")
+        buf.write("\u009c\u00a6\u00a8\u00aa\u00ac\u00b3\u00b6\u00c5\u00ca")
+        buf.write("\u00d1\u00d3\u00db\u00dd\u00e5\u00e7\u00ee\2")
+        return buf.getvalue()
+
+
+class LexBasic(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+ ]
+
+    symbolicNames = [ "<INVALID>",
+ ]
+
+    ruleNames = [ "Ws", "Hws", "Vws", "BlockComment", "DocComment", "LineComment", 
+                  "EscSeq", "EscAny", "UnicodeEsc", "DecimalNumeral", "HexDigit", 
+                  "DecDigit", "BoolLiteral", "CharLiteral", "SQuoteLiteral", 
+                  "DQuoteLiteral", "USQuoteLiteral", "NameChar", "NameStartChar", 
+                  "NameUpperStartChar", "NameLowerStartChar", "Int", "Esc", 
+                  "Colon", "DColon", "SQuote", "DQuote", "LParen", "RParen", 
+                  "LBrace", "RBrace", "LBrack", "RBrack", "RArrow", "Lt", 
+                  "Gt", "Equal", "Question", "Star", "Plus", "PlusAssign", 
+                  "Underscore", "Pipe", "Dollar", "Comma", "Semi", "Dot", 
+                  "Range", "At", "Pound", "Tilde" ]
+
+    grammarFileName = "LexBasic.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.7.1")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
@@ -0,0 +1,187 @@
+"""
+Rule dependency graph of a grammar.
+
+A RuleGraph indexes the parser rules of a grammar by name with the rules
+they reference, the rules referencing them, their labeled alternatives and
+their terminals. Pass one as the graph argument of g4_parser.parse to fill
+it while converting, it is stored in the grammar cache with the types.
+"""
+import json
+
+XS = "http://www.w3.org/2001/XMLSchema"
+
+ELEMENT = '{{{:s}}}element'.format(XS)
+
+
+class RuleGraph:
+    """
+    Parser rules, in grammar order, and their references
+
+    Terminals are the token names and literals of 3 or more characters,
+    the ones that become elements of the schema.
+    """
+
+    def __init__(self, rules=None):
+        # name -> {'refs': [...], 'labels': [...], 'terminals': [...]}
+        self.rules = {} if rules is None else rules  # type: dict
+        self._referrers = None
+        self._sccs = None
+        self._recursive = None
+
+    def add_rule(self, types):
+        """
+        Add a parser rule from its complexTypes, the type of the rule
+        followed by those of its labeled alternatives
+        """
+        labels = [ctype.get('name') for ctype in types[1:]]
+        refs = {}
+        terminals = {}
+        for ctype in types:
+            for elem in ctype.iter(ELEMENT):
+                name = elem.get('type')
+                if name == 'xs:string':
+                    terminals[elem.get('name')] = None
+                elif name not in labels:
+                    refs[name] = None
+        self.rules[types[0].get('name')] = {
+            'refs': list(refs), 'labels': labels, 'terminals': list(terminals)}
+        self._referrers = None
+        self._sccs = None
+        self._recursive = None
+
+    def update(self, rules):
+        """
+        Add the rules of another graph, or of its to_dict
+        """
+        self.rules.update(rules.rules if isinstance(rules, RuleGraph) else rules)
+        self._referrers = None
+        self._sccs = None
+        self._recursive = None
+
+    def __contains__(self, rule):
+        return rule in self.rules
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def references(self, rule) -> list:
+        """
+        Rules referenced by rule, including rules the grammar does not
+        define, e.g. imported ones
+        """
+        return self.rules[rule]['refs']
+
+    def referenced_by(self, rule) -> list:
+        """
+        Rules referencing rule, in grammar order
+        """
+        if self._referrers is None:
+            referrers = {name: [] for name in self.rules}
+            for name, node in self.rules.items():
+                for ref in node['refs']:
+                    referrers.setdefault(ref, []).append(name)
+            self._referrers = referrers
+        return self._referrers.get(rule, [])
+
+    def labels(self, rule) -> list:
+        return self.rules[rule]['labels']
+
+    def terminals(self, rule) -> list:
+        return self.rules[rule]['terminals']
+
+    def sccs(self) -> list:
+        """
+        Strongly connected components of the defined rules, found with
+        Tarjan's algorithm, in reverse topological order: a component only
+        references itself and components before it
+        """
+        if self._sccs is not None:
+            return self._sccs
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        sccs = []
+        for start in self.rules:
+            if start not in index:
+                self._strong_connect(start, index, low, stack, on_stack, sccs)
+        self._sccs = sccs
+        return sccs
+
+    def _strong_connect(self, start, index, low, stack, on_stack, sccs):
+        """
+        Tarjan's depth first search from start, appends the components it
+        completes to sccs
+        """
+        # iterative, grammars can have chains of thousands of rules
+        index[start] = low[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(self.rules[start]['refs']))]
+        while work:
+            rule, refs = work[-1]
+            for ref in refs:
+                if ref not in self.rules:
+                    continue
+                if ref not in index:
+                    index[ref] = low[ref] = len(index)
+                    stack.append(ref)
+                    on_stack.add(ref)
+                    work.append((ref, iter(self.rules[ref]['refs'])))
+                    break
+                if ref in on_stack:
+                    low[rule] = min(low[rule], index[ref])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[rule])
+                if low[rule] == index[rule]:
+                    sccs.append(pop_component(stack, on_stack, rule))
+
+    def recursive_groups(self) -> list:
+        """
+        Groups of mutually recursive rules, and directly recursive rules on
+        their own
+        """
+        return [
+            scc for scc in self.sccs()
+            if len(scc) > 1 or scc[0] in self.rules[scc[0]]['refs']]
+
+    def is_recursive(self, rule) -> bool:
+        if self._recursive is None:
+            self._recursive = {name for scc in self.recursive_groups() for name in scc}
+        return rule in self._recursive
+
+    def to_dict(self) -> dict:
+        return self.rules
+
+    @classmethod
+    def from_dict(cls, rules):
+        return cls(rules)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+def pop_component(stack, on_stack, root) -> list:
+    """
+    Pop the strongly connected component with root off the Tarjan stack,
+    in the order its rules were visited
+    """
+    scc = []
+    while True:
+        name = stack.pop()
+        on_stack.discard(name)
+        scc.append(name)
+        if name == root:
+            return scc[::-1]
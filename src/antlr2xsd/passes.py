@@ -0,0 +1,378 @@
+"""
+Optimization passes over a converted xsd schema.
+
+Passes rewrite the schema returned by g4_parser in place. The Converter
+runs them after the conversion, or after a cache hit, if they are enabled
+in listener_opts:
+
+    normalize  flatten sequences in sequences and choices in choices,
+             remove empty sequences and groups of a single particle
+    prune    drop the complexTypes that are unreachable from the global
+             elements, e.g. from root_type
+    dedupe   keep one of each set of structurally identical complexTypes
+             and point the references to the others at it
+    groups   move runs of particles that repeat in the sequences of the
+             schema to shared xs:group definitions, runs need at least
+             listener_opts['group_min_length'] particles, 3 by default
+"""
+import logging
+from collections import deque
+
+from lxml import etree
+
+from .stats import add
+
+#: listener_opts keys of the passes, in the order they run
+PASSES = ('normalize', 'prune', 'dedupe', 'groups')
+
+XS = "http://www.w3.org/2001/XMLSchema"
+
+COMPLEX_TYPE = '{{{:s}}}complexType'.format(XS)
+ELEMENT = '{{{:s}}}element'.format(XS)
+GROUP = '{{{:s}}}group'.format(XS)
+SEQUENCE = '{{{:s}}}sequence'.format(XS)
+CHOICE = '{{{:s}}}choice'.format(XS)
+NSMAP = {'xs': XS}
+
+logger = logging.getLogger(__name__)
+
+
+def enabled(listener_opts) -> bool:
+    return any(listener_opts.get(name) for name in PASSES)
+
+
+def run(xsd, listener_opts, stats=None):
+    """
+    Run the passes enabled in listener_opts on xsd
+
+    With stats, normalize adds the number of removed nodes to
+    'normalized'. prune adds the number of removed types to 'pruned' and
+    their names to the 'pruned_types' list. dedupe adds the number of
+    types it looked at to 'dedupe_types' and of removed duplicates to
+    'deduped', 'dedupe_ratio' is their ratio. groups adds the number of
+    groups to 'groups' and of references to them to 'group_refs'.
+    """
+    if listener_opts.get('normalize'):
+        removed = normalize(xsd)
+        logger.info('normalization removed %d nodes', removed)
+        if stats is not None:
+            add(stats, 'normalized', removed)
+    if listener_opts.get('prune'):
+        pruned = prune(xsd)
+        logger.info('pruned unreachable types: %s', ' '.join(pruned))
+        if stats is not None:
+            add(stats, 'pruned', len(pruned))
+            stats.setdefault('pruned_types', []).extend(pruned)
+    if listener_opts.get('dedupe'):
+        n_types = sum(1 for _ in xsd.iterchildren(COMPLEX_TYPE))
+        aliases = dedupe(xsd)
+        logger.info('deduplicated %d of %d types', len(aliases), n_types)
+        if stats is not None:
+            add(stats, 'dedupe_types', n_types)
+            add(stats, 'deduped', len(aliases))
+            stats['dedupe_ratio'] = stats['deduped'] / max(stats['dedupe_types'], 1)
+    if listener_opts.get('groups'):
+        groups = extract_groups(xsd, listener_opts.get('group_min_length', 3))
+        logger.info('extracted %d groups', len(groups))
+        if stats is not None:
+            add(stats, 'groups', len(groups))
+            add(stats, 'group_refs', sum(groups.values()))
+
+
+def type_refs(ctype):
+    """
+    Names of the types referenced by the elements of a complexType
+    """
+    for elem in ctype.iter(ELEMENT):
+        name = elem.get('type')
+        if name is not None and not name.startswith('xs:'):
+            yield name
+
+
+def splice(child):
+    """
+    Replace child with its children
+    """
+    for grandchild in reversed(list(child)):
+        child.addnext(grandchild)
+    child.getparent().remove(child)
+
+
+def normalize(xsd) -> int:
+    """
+    Simplify the content models of the complexTypes and groups without
+    changing the documents they accept, returns the number of removed
+    nodes
+
+    A sequence in a sequence and a choice in a choice are replaced by
+    their particles, a sequence or choice of a single particle by the
+    particle and an empty sequence in a sequence, or as the content of a
+    complexType, is removed. A content model of a single sequence or
+    choice is replaced by it. Sequences and choices with minOccurs or
+    maxOccurs are left alone.
+    """
+    removed = 0
+    for container in xsd.iterchildren(COMPLEX_TYPE, GROUP):
+        # children before parents, so nested groups are simplified first
+        for node in reversed(list(container.iter(SEQUENCE, CHOICE))):
+            i = 0
+            while i < len(node):
+                child = node[i]
+                if child.tag in (SEQUENCE, CHOICE) and not has_occurs(child):
+                    if len(child) == 0 and child.tag == SEQUENCE and node.tag == SEQUENCE:
+                        node.remove(child)
+                        removed += 1
+                        continue
+                    if len(child) == 1 or (len(child) > 1 and child.tag == node.tag):
+                        # the particles moved up are checked in turn
+                        splice(child)
+                        removed += 1
+                        continue
+                i += 1
+        model = container[0] if len(container) else None
+        while (model is not None and model.tag in (SEQUENCE, CHOICE) and len(model) == 1
+               and not has_occurs(model) and model[0].tag in (SEQUENCE, CHOICE)):
+            splice(model)
+            removed += 1
+            model = container[0]
+        if container.tag == COMPLEX_TYPE and model is not None and model.tag == SEQUENCE \
+                and len(model) == 0 and not has_occurs(model):
+            container.remove(model)
+            removed += 1
+    return removed
+
+
+def has_occurs(elem) -> bool:
+    return elem.get('minOccurs') is not None or elem.get('maxOccurs') is not None
+
+
+def prune(xsd) -> list:
+    """
+    Remove the complexTypes that no global element references directly or
+    indirectly, returns the names of the removed types in schema order
+    """
+    types = {}
+    for ctype in xsd.iterchildren(COMPLEX_TYPE):
+        types.setdefault(ctype.get('name'), []).append(ctype)
+    reachable = set()
+    todo = deque(
+        elem.get('type') for elem in xsd.iterchildren(ELEMENT)
+        if elem.get('type') in types)
+    reachable.update(todo)
+    while todo:
+        for ctype in types[todo.popleft()]:
+            for name in type_refs(ctype):
+                if name not in reachable and name in types:
+                    reachable.add(name)
+                    todo.append(name)
+    pruned = []
+    for ctype in list(xsd.iterchildren(COMPLEX_TYPE)):
+        if ctype.get('name') not in reachable:
+            pruned.append(ctype.get('name'))
+            xsd.remove(ctype)
+    return pruned
+
+
+def shape(elem, types, refs) -> tuple:
+    """
+    Hashable canonical form of an xsd element with the references to the
+    complexTypes in types left out, appends those to refs in document
+    order
+    """
+    attrib = dict(elem.attrib)
+    if attrib.get('type') in types:
+        refs.append(attrib.pop('type'))
+    return (
+        elem.tag, tuple(sorted(attrib.items())),
+        tuple(shape(child, types, refs) for child in elem))
+
+
+def dedupe(xsd) -> dict:
+    """
+    Merge structurally identical complexTypes, whose content is the same
+    apart from their name, into the first of them
+
+    Types are identical if they have the same shape, their content with
+    the type references left out, and the types they reference in the
+    same places are identical, see partition_types. Returns the names of
+    the removed types mapped to the names of the types that replace them.
+    """
+    ctypes = {}
+    for ctype in xsd.iterchildren(COMPLEX_TYPE):
+        ctypes.setdefault(ctype.get('name'), ctype)
+    first = {}
+    aliases = {}
+    for name, block in partition_types(ctypes).items():
+        kept = first.setdefault(block, name)
+        if kept != name:
+            aliases[name] = kept
+    if not aliases:
+        return aliases
+    for ctype in list(xsd.iterchildren(COMPLEX_TYPE)):
+        if ctype.get('name') in aliases:
+            xsd.remove(ctype)
+    for elem in xsd.iter(ELEMENT):
+        name = elem.get('type')
+        if name in aliases:
+            elem.set('type', aliases[name])
+    return aliases
+
+
+def partition_types(ctypes) -> dict:
+    """
+    Number the complexTypes, a dict of names to types, so that identical
+    types get the same number, returns the names mapped to the numbers
+
+    Partition refinement: the types start out grouped by shape and the
+    groups are split by the groups of the types they reference until no
+    group splits, so recursive types are found identical too.
+    """
+    refs = {name: [] for name in ctypes}
+    shapes = {}
+    block = {}
+    for name, ctype in ctypes.items():
+        key = tuple(shape(child, ctypes, refs[name]) for child in ctype)
+        block[name] = shapes.setdefault(key, len(shapes))
+    n_blocks = len(shapes)
+    while True:
+        signatures = {}
+        refined = {}
+        for name in ctypes:
+            key = (block[name], tuple(block[ref] for ref in refs[name]))
+            refined[name] = signatures.setdefault(key, len(signatures))
+        block = refined
+        # blocks only split, so the partition is stable once none did
+        if len(signatures) == n_blocks:
+            return block
+        n_blocks = len(signatures)
+
+
+def group_savings(length, count) -> int:
+    """
+    Nodes saved by replacing count runs of length particles with
+    references to a group, whose definition adds a group and a sequence
+    """
+    return count * length - count - length - 2
+
+
+def extract_groups(xsd, min_length=3, max_length=32) -> dict:
+    """
+    Replace runs of min_length to max_length particles that occur more
+    than once in the sequences of the complexTypes with references to
+    new xs:group definitions
+
+    Runs are chosen greedily by the number of nodes they save. Runs do
+    not overlap and a run is not chosen if a chosen run lies inside it,
+    or if it lies inside one. Returns the names of the groups mapped to
+    the number of references to them.
+    """
+    seqs, items = number_particles(xsd)
+    runs = repeated_runs(items, min_length, max_length)
+    replacements = choose_runs(runs, seqs, items)
+    return rewrite_groups(xsd, replacements, seqs)
+
+
+def number_particles(xsd):
+    """
+    Sequences of the complexTypes and, for each, the numbers of its
+    particles, structurally identical particles get the same number
+    """
+    # numbered bottom up, each node is visited once
+    ids = {}
+    node_ids = {}
+    seqs = []
+    for ctype in xsd.iterchildren(COMPLEX_TYPE):
+        nodes = list(ctype.iter())
+        seqs.extend(node for node in nodes if node.tag == SEQUENCE)
+        for node in reversed(nodes):
+            key = (node.tag, tuple(sorted(node.items())), tuple(node_ids[c] for c in node))
+            node_ids[node] = ids.setdefault(key, len(ids))
+    return seqs, [[node_ids[p] for p in seq] for seq in seqs]
+
+
+def repeated_runs(items, min_length, max_length) -> dict:
+    """
+    Runs of particle numbers that occur more than once, mapped to their
+    (sequence, start) occurrences
+    """
+    runs = {}
+    level = {}
+    for s, row in enumerate(items):
+        for i in range(len(row) - min_length + 1):
+            level.setdefault(tuple(row[i:i + min_length]), []).append((s, i))
+    length = min_length
+    # only runs that repeat are extended by a particle, longer runs of
+    # them cannot repeat either
+    while level and length <= max_length:
+        level = {run: occurrences for run, occurrences in level.items() if len(occurrences) > 1}
+        runs.update(level)
+        longer = {}
+        for run, occurrences in level.items():
+            for s, i in occurrences:
+                if i + length < len(items[s]):
+                    longer.setdefault(run + (items[s][i + length],), []).append((s, i))
+        level = longer
+        length += 1
+    return runs
+
+
+def choose_runs(runs, seqs, items) -> list:
+    """
+    Pick the runs to replace greedily by savings, returns (name, length,
+    [(sequence, start), ...]) for each group
+    """
+    index = {seq: i for i, seq in enumerate(seqs)}
+    candidates = sorted(
+        ((run, occurrences) for run, occurrences in runs.items()
+         if group_savings(len(run), len(occurrences)) > 0),
+        key=lambda c: (-group_savings(len(c[0]), len(c[1])), -len(c[0]), c[1][0]))
+    consumed = [bytearray(len(row)) for row in items]
+    # sequences with a particle in a chosen run, no run may contain them
+    touched = bytearray(len(seqs))
+    replacements = []
+    for run, occurrences in candidates:
+        length = len(run)
+        chosen = []
+        end = {}
+        for s, i in occurrences:
+            if i < end.get(s, 0) or any(consumed[s][i:i + length]):
+                continue
+            inner = [index[d] for p in seqs[s][i:i + length] for d in p.iter(SEQUENCE)]
+            if any(touched[d] for d in inner):
+                continue
+            chosen.append((s, i, inner))
+            end[s] = i + length
+        if group_savings(length, len(chosen)) <= 0:
+            continue
+        for s, i, inner in chosen:
+            consumed[s][i:i + length] = b'\x01' * length
+            touched[s] = 1
+            for d in inner:
+                consumed[d][:] = b'\x01' * len(consumed[d])
+                touched[d] = 1
+        name = 'group{:d}'.format(len(replacements) + 1)
+        replacements.append((name, length, [(s, i) for s, i, _ in chosen]))
+    return replacements
+
+
+def rewrite_groups(xsd, replacements, seqs) -> dict:
+    """
+    Move the first occurrence of each chosen run into a new xs:group,
+    remove the others and reference the group in their place
+    """
+    # the positions refer to the sequences before any rewrite
+    particles = [list(seq) for seq in seqs]
+    groups = {}
+    for name, length, chosen in replacements:
+        group = etree.SubElement(xsd, GROUP, name=name, nsmap=NSMAP)
+        body = etree.SubElement(group, SEQUENCE, nsmap=NSMAP)
+        for n, (s, i) in enumerate(chosen):
+            run = particles[s][i:i + length]
+            run[0].addprevious(etree.Element(GROUP, ref=name, nsmap=NSMAP))
+            for p in run:
+                if n == 0:
+                    body.append(p)
+                else:
+                    seqs[s].remove(p)
+        groups[name] = len(chosen)
+    return groups
@@ -0,0 +1,76 @@
+"""
+Profiles conversions with cProfile and a stack sampler.
+
+The cProfile statistics are saved for pstats, e.g. python -m pstats or
+snakeviz. cProfile only knows callers and callees, so the call stacks of the
+calling thread are also sampled and saved in the collapsed format of
+flamegraph.pl, speedscope and inferno, one "frame;frame;frame count" line
+per distinct stack.
+"""
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+
+
+def frame_name(code) -> str:
+    return '{:s}:{:d}:{:s}'.format(
+        os.path.basename(code.co_filename), code.co_firstlineno, code.co_name)
+
+
+class StackSampler(threading.Thread):
+    """
+    Thread that samples the call stack of thread_id every interval seconds
+    until stopped
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        super().__init__(name='antlr2xsd-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write('{:s} {:d}\n'.format(stack, count))
+
+
+class Profiler:
+    """
+    Context manager profiling the calling thread, save writes
+    prefix.pstats and prefix.folded
+    """
+
+    def __init__(self, interval=0.001):
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), interval)
+
+    def __enter__(self):
+        self.sampler.start()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.disable()
+        self.sampler.stop()
+
+    def save(self, prefix):
+        self.profile.dump_stats(prefix + '.pstats')
+        self.sampler.save(prefix + '.folded')
@@ -0,0 +1,104 @@
+"""
+Stage timings and counters of a conversion.
+
+Pass a Stats, or any dict, as the stats argument of g4_parser.parse,
+write or serialize to collect them. Nothing is measured without one.
+
+    lex_time, parse_time, walk_time, serialize_time   seconds, accumulated
+    rules, tokens, tree_nodes                           input size
+    complexType, element, choice                        emitted xsd nodes
+    peak_memory                                         bytes, see below
+    prediction_mode, ll_fallbacks                       see g4_parser.parse
+    normalized, pruned, pruned_types                    see passes.run
+    dedupe_types, deduped, dedupe_ratio                 see passes.run
+    groups, group_refs                                  see passes.run
+
+peak_memory is the tracemalloc peak if tracemalloc is running, start it
+before the conversion to measure that conversion alone. Otherwise it is
+the maximum resident set size of the whole process, so for conversions
+sharing a process, as in batch.convert_all, it includes every earlier one.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from antlr4 import ParserRuleContext
+
+#: xsd nodes counted in the emitted schema
+COUNTED_TAGS = ('complexType', 'element', 'choice')
+
+
+class Stats(dict):
+    """
+    Dict of stage timings and counters that can be exported as JSON
+    """
+
+    def to_json(self) -> str:
+        return json.dumps(self, indent=2, sort_keys=True)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+            f.write('\n')
+
+
+def add(stats, key, value):
+    stats[key] = stats.get(key, 0) + value
+
+
+@contextmanager
+def timer(stats, stage):
+    """
+    Add the wall time of the block to stats[stage + '_time']
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(stats, stage + '_time', time.perf_counter() - start)
+
+
+def count_nodes(tree) -> int:
+    """
+    Number of nodes, rules and tokens, in a parse tree
+    """
+    n = 0
+    todo = [tree]
+    while todo:
+        node = todo.pop()
+        n += 1
+        if isinstance(node, ParserRuleContext) and node.children:
+            todo.extend(node.children)
+    return n
+
+
+def count_schema(stats, elems):
+    """
+    Count the complexType, element and choice nodes in the xsd elements
+    """
+    for elem in elems:
+        for node in elem.iter():
+            tag = node.tag.split('}')[1]
+            if tag in COUNTED_TAGS:
+                add(stats, tag, 1)
+
+
+def record_memory(stats):
+    """
+    Record the peak memory so far, traced if tracemalloc is running and
+    the maximum resident set size of the process, over its lifetime and
+    all threads, otherwise
+    """
+    if tracemalloc.is_tracing():
+        peak = tracemalloc.get_traced_memory()[1]
+    else:
+        try:
+            import resource
+        except ImportError:  # windows
+            return
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak *= 1024  # kilobytes
+    stats['peak_memory'] = max(stats.get('peak_memory', 0), peak)
@@ -0,0 +1,199 @@
+"""
+Compact character and token streams for the ANTLRv4 lexer and parser.
+
+antlr4.InputStream keeps a list of code point ints, 8 bytes per character
+next to the text, and CommonTokenStream keeps a CommonToken object, about
+200 bytes, per token.
+
+CodePointStream keeps the code points in a bytes buffer, 1 byte per
+character for latin-1 text and 4 bytes otherwise. ArrayTokenStream stores
+the fields of its tokens in arrays, 24 bytes per token, and creates a
+SlimToken when a token is asked for.
+"""
+import sys
+from array import array
+
+from antlr4.CommonTokenFactory import TokenFactory
+from antlr4.CommonTokenStream import CommonTokenStream
+from antlr4.InputStream import InputStream
+from antlr4.Token import CommonToken, Token
+
+# utf-32 in the byte order of the host, so the buffer casts to code points
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+class CodePointStream(InputStream):
+    """
+    InputStream with its code points in a bytes buffer
+
+    If buffer, the utf-8 encoding of data, is given and data is ascii,
+    buffer is used as is.
+    """
+
+    def __init__(self, data, buffer=None):
+        # the utf-8 encoding of ascii text are its code points
+        self.buffer = buffer if buffer is not None and len(buffer) == len(data) else None
+        super().__init__(data)
+
+    def _loadString(self):
+        self._index = 0
+        if self.buffer is not None:
+            self.data = self.buffer
+            self._size = len(self.data)
+            return
+        try:
+            self.data = self.strdata.encode('latin-1')
+        except UnicodeEncodeError:
+            self.data = memoryview(self.strdata.encode(_UTF32)).cast('I')
+        self._size = len(self.data)
+
+
+class SlimToken(Token):
+    """
+    CommonToken with its fields in slots, Token.__init__ is not called so
+    no instance dict is created
+    """
+
+    __slots__ = (
+        'source', 'type', 'channel', 'start', 'stop', 'tokenIndex', 'line',
+        'column', '_text')
+
+    def __init__(self, source, type, channel, start, stop, line, column, text=None):
+        self.source = source
+        self.type = type
+        self.channel = channel
+        self.start = start
+        self.stop = stop
+        self.tokenIndex = -1
+        self.line = line
+        self.column = column
+        self._text = text
+
+    def clone(self):
+        t = SlimToken(
+            self.source, self.type, self.channel, self.start, self.stop,
+            self.line, self.column, self._text)
+        t.tokenIndex = self.tokenIndex
+        return t
+
+    text = CommonToken.text
+    __str__ = CommonToken.__str__
+
+
+class SlimTokenFactory(TokenFactory):
+    """
+    Token factory of SlimToken, set it as the _factory of a lexer
+    """
+
+    DEFAULT = None
+
+    def create(self, source, type, text, channel, start, stop, line, column):
+        return SlimToken(source, type, channel, start, stop, line, column, text)
+
+    def createThin(self, type, text):
+        return SlimToken(
+            CommonToken.EMPTY_SOURCE, type, Token.DEFAULT_CHANNEL, -1, -1, 0, -1, text)
+
+
+SlimTokenFactory.DEFAULT = SlimTokenFactory()
+
+
+class TokenArray:
+    """
+    List-like store of the tokens of one lexer, a field per array
+
+    Indexing creates a SlimToken, the most recently created ones are reused
+    so that a rule context and the terminal of the same token share it.
+    """
+
+    recent_size = 64
+
+    def __init__(self):
+        self.type = array('i')
+        self.channel = array('i')
+        self.start = array('i')
+        self.stop = array('i')
+        self.line = array('i')
+        self.column = array('i')
+        self.texts = {}  # explicitly set token text by index, rare
+        self.source = CommonToken.EMPTY_SOURCE
+        self.recent = {}
+
+    def __len__(self):
+        return len(self.type)
+
+    def append(self, token):
+        if token._text is not None:
+            self.texts[len(self.type)] = token._text
+        self.source = token.source
+        self.type.append(token.type)
+        self.channel.append(token.channel)
+        self.start.append(token.start)
+        self.stop.append(token.stop)
+        self.line.append(token.line)
+        self.column.append(token.column)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self.type)
+        token = self.recent.get(i)
+        if token is not None:
+            return token
+        token = SlimToken(
+            self.source, self.type[i], self.channel[i], self.start[i], self.stop[i],
+            self.line[i], self.column[i], self.texts.get(i))
+        token.tokenIndex = i
+        if len(self.recent) >= self.recent_size:
+            del self.recent[next(iter(self.recent))]
+        self.recent[i] = token
+        return token
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self.type)))
+
+
+class ArrayTokenStream(CommonTokenStream):
+    """
+    CommonTokenStream storing its tokens in a TokenArray, lookahead and
+    channel filtering read the arrays without creating tokens
+    """
+
+    def __init__(self, lexer, channel=Token.DEFAULT_CHANNEL):
+        super().__init__(lexer, channel)
+        self.tokens = TokenArray()
+
+    def setTokenSource(self, tokenSource):
+        super().setTokenSource(tokenSource)
+        self.tokens = TokenArray()
+
+    def LA(self, k):
+        if k <= 0:
+            return self.LT(k).type
+        self.lazyInit()
+        i = self.index
+        n = 1
+        while n < k:
+            if self.sync(i + 1):
+                i = self.nextTokenOnChannel(i + 1, self.channel)
+            n += 1
+        return self.tokens.type[i]
+
+    def nextTokenOnChannel(self, i, channel):
+        self.sync(i)
+        tokens = self.tokens
+        if i >= len(tokens):
+            return -1
+        while tokens.channel[i] != channel:
+            if tokens.type[i] == Token.EOF:
+                return -1
+            i += 1
+            self.sync(i)
+        return i
+
+    def previousTokenOnChannel(self, i, channel):
+        channels = self.tokens.channel
+        while i >= 0 and channels[i] != channel:
+            i -= 1
+        return i
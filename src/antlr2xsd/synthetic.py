@@ -0,0 +1,92 @@
+"""
+Seeded generator of synthetic g4 grammars for benchmarks and scaling tests.
+
+usage: python -m antlr2xsd.synthetic N_RULES [--seed N] [--alternatives N]
+           [--labeled-ratio X] [--depth N] [--ebnf-density X] [-o G4]
+"""
+import argparse
+import random
+import sys
+
+EBNF_SUFFIXES = ['?', '*', '+']
+
+
+def generate(n_rules, alternatives=3, labeled_ratio=0.3, depth=2,
+             ebnf_density=0.3, seed=0, name=None) -> str:
+    """
+    Return the source of a valid combined grammar with n_rules parser rules
+
+    Each rule has 1 to alternatives alternatives, all of them labeled for
+    a labeled_ratio fraction of the rules, as ANTLR requires labels on
+    all alternatives or none. Blocks of alternatives nest up to depth
+    levels and an ebnf_density fraction of the elements gets a ?, * or +
+    suffix. Rules only reference rules after them, so the grammar has no
+    left recursion, and r0 is the start rule.
+    """
+    rnd = random.Random(seed)
+    name = name or 'Synthetic{:d}'.format(n_rules)
+
+    def element(i, level, suffixes):
+        r = rnd.random()
+        if level < depth and r < 0.15:
+            text = '( {:s} )'.format(' | '.join(
+                alternative(i, level + 1)
+                for _ in range(rnd.randint(2, max(2, alternatives)))))
+        elif r < 0.55 and i + 1 < n_rules:
+            text = 'r{:d}'.format(rnd.randint(i + 1, min(i + 8, n_rules - 1)))
+        elif r < 0.8:
+            text = "'kw{:d}'".format(rnd.randrange(n_rules))
+        else:
+            text = 'ID'
+        if rnd.random() < ebnf_density:
+            text += rnd.choice(suffixes)
+        return text
+
+    def alternative(i, level):
+        # the first element is never optional so no alternative, block or
+        # rule matches the empty string, ANTLR rejects closures of those
+        return ' '.join(
+            element(i, level, EBNF_SUFFIXES if j else ['+'])
+            for j in range(rnd.randint(1, 4)))
+
+    lines = ['grammar {:s};'.format(name), '']
+    for i in range(n_rules):
+        alts = [alternative(i, 0) for _ in range(rnd.randint(1, alternatives))]
+        if rnd.random() < labeled_ratio:
+            alts = [
+                '{:s} # r{:d}_alt{:d}'.format(alt, i, j) for j, alt in enumerate(alts)]
+        lines.append('r{:d} :\n    {:s}\n    ;'.format(i, '\n    | '.join(alts)))
+    lines += [
+        '',
+        # no [...] char sets, the ANTLRv4 lexer is generated without the
+        # LexerAdaptor that tells them apart from arguments
+        "ID : ('a'..'z' | '_')+ ;",
+        "WS : (' ' | '\\t' | '\\r' | '\\n')+ -> skip ;",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m antlr2xsd.synthetic', description=__doc__.split('\n')[1])
+    parser.add_argument('n_rules', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--alternatives', type=int, default=3)
+    parser.add_argument('--labeled-ratio', type=float, default=0.3)
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--ebnf-density', type=float, default=0.3)
+    parser.add_argument('-o', '--output', help='g4 file, standard output by default')
+    args = parser.parse_args(argv)
+    src = generate(
+        args.n_rules, args.alternatives, args.labeled_ratio, args.depth,
+        args.ebnf_density, args.seed)
+    if args.output is None:
+        sys.stdout.write(src)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(src)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
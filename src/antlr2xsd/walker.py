@@ -0,0 +1,103 @@
+"""
+Iterative parse tree walker that only visits the rules a listener handles.
+"""
+from antlr4 import ParserRuleContext
+from antlr4.atn.Transition import RuleTransition
+
+
+def rule_refs(atn) -> list:
+    """
+    For each rule index, the set of rule indices it invokes directly
+    """
+    refs = [set() for _ in atn.ruleToStartState]
+    for state in atn.states:
+        if state is None:
+            continue
+        for t in state.transitions:
+            if isinstance(t, RuleTransition):
+                refs[state.ruleIndex].add(t.ruleIndex)
+    return refs
+
+
+def reachable(refs) -> list:
+    """
+    For each rule index, the set of rule indices reachable from it,
+    including itself
+    """
+    result = []
+    for start in range(len(refs)):
+        seen = {start}
+        todo = [start]
+        while todo:
+            for i in refs[todo.pop()]:
+                if i not in seen:
+                    seen.add(i)
+                    todo.append(i)
+        result.append(seen)
+    return result
+
+
+class Walker:
+    """
+    Walks a parse tree with an explicit stack, so deep trees do not hit
+    the recursion limit.
+
+    The enter/exit handlers of the listener are looked up once per context
+    class. Subtrees that cannot contain a rule with a handler are skipped,
+    and the enterEveryRule/exitEveryRule hooks are not called. If an enter
+    handler returns True, the subtree of that context is skipped as well,
+    including its exit handler.
+    """
+
+    _tables = {}
+
+    def __init__(self, parser_cls, listener_cls, base_cls):
+        key = (parser_cls, listener_cls, base_cls)
+        if key not in self._tables:
+            self._tables[key] = self._build(parser_cls, listener_cls, base_cls)
+        # copied so instances can override handlers
+        self.handlers = dict(self._tables[key])
+
+    @staticmethod
+    def _build(parser_cls, listener_cls, base_cls) -> dict:
+        ctx_classes = [
+            cls for cls in vars(parser_cls).values()
+            if isinstance(cls, type) and issubclass(cls, ParserRuleContext)]
+
+        def handler(prefix, cls):
+            name = prefix + cls.__name__[:-len('Context')]
+            func = getattr(listener_cls, name, None)
+            if func is None or func is getattr(base_cls, name, None):
+                return None
+            return func
+
+        handled = set()
+        for cls in ctx_classes:
+            if handler('enter', cls) or handler('exit', cls):
+                handled.add(cls.getRuleIndex(None))
+
+        reach = reachable(rule_refs(parser_cls.atn))
+        return {
+            cls: (handler('enter', cls), handler('exit', cls))
+            for cls in ctx_classes
+            if reach[cls.getRuleIndex(None)] & handled}
+
+    def walk(self, listener, tree):
+        handlers = self.handlers
+        if type(tree) not in handlers:
+            return
+        stack = [(tree, None)]
+        while stack:
+            ctx, exit_rule = stack.pop()
+            if exit_rule is not None:
+                exit_rule(listener, ctx)
+                continue
+            enter_rule, exit_rule = handlers[type(ctx)]
+            if enter_rule is not None and enter_rule(listener, ctx):
+                continue
+            if exit_rule is not None:
+                stack.append((ctx, exit_rule))
+            if ctx.children:
+                stack.extend(
+                    (child, None) for child in reversed(ctx.children)
+                    if type(child) in handlers)
@@ -1,15 +1,32 @@
 import os
 import sys
 from lxml import etree
+import concurrent.futures
+import contextlib
+import io
 import json
+import math
+import socket
+import tempfile
+import threading
+import time
+import tracemalloc
 import unittest
+import unittest.mock
 
 import antlr2xsd
+import antlr2xsd.batch
 
 sys.path.append(os.path.pardir)
 
 TEST_DIR = os.path.dirname(os.path.realpath(__file__))
 
+MODELICA_OPTS = {
+    'root_name': 'modelica',
+    'root_type': 'stored_definition',
+    'tns': 'http://www.pymoca.com/Pymoca',
+}
+
 
 class TestXsd(unittest.TestCase):
 
@@ -26,3 +43,674 @@ class TestXsd(unittest.TestCase):
         xsd_str = etree.tostring(xsd, pretty_print=True).decode('utf-8')
         with open(os.path.join(TEST_DIR, 'output', 'Pymoca.xsd'), 'w') as f:
             f.write(xsd_str)
+
+    def test_cache(self):
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        listener_opts = MODELICA_OPTS
+        other_opts = dict(MODELICA_OPTS, tns='http://www.pymoca.com/Other')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # populate the cache with other options, then hit it
+            antlr2xsd.g4_parser.parse(g4_path, other_opts, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            cached = antlr2xsd.g4_parser.parse(g4_path, listener_opts, cache_dir=cache_dir)
+        xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        self.assertEqual(etree.tostring(cached), etree.tostring(xsd))
+
+    def test_incremental(self):
+        listener_opts = MODELICA_OPTS
+        with open(os.path.join(TEST_DIR, 'g4', 'Modelica.g4'), 'r') as f:
+            src = f.read()
+        state = antlr2xsd.g4_parser.IncrementalState()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Modelica.g4')
+            with open(g4_path, 'w') as f:
+                f.write(src)
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts, incremental=state)
+            n_rules = state.emitted
+            with open(g4_path, 'w') as f:
+                f.write(src.replace(
+                    'FINAL? class_definition', 'FINAL? ENCAPSULATED? class_definition', 1))
+            state.emitted = 0
+            xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts, incremental=state)
+            self.assertEqual(state.emitted, 1)
+            self.assertEqual(state.reused, n_rules - 1)
+            expected = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+            self.assertEqual(etree.tostring(xsd), etree.tostring(expected))
+
+            # the state survives a round trip through a file
+            state_path = os.path.join(tmp_dir, 'state.json')
+            state.save(state_path)
+            loaded = antlr2xsd.g4_parser.IncrementalState.load(state_path)
+            self.assertEqual(loaded.rest, state.rest)
+            self.assertEqual(
+                {key: [etree.tostring(ctype) for ctype in types]
+                 for key, types in loaded.rules.items()},
+                {key: [etree.tostring(ctype) for ctype in types]
+                 for key, types in state.rules.items()})
+            xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts, incremental=loaded)
+            self.assertEqual((loaded.emitted, loaded.reused), (0, n_rules))
+            self.assertEqual(etree.tostring(xsd), etree.tostring(expected))
+
+            # a change outside the parser rules converts everything again
+            with open(g4_path, 'w') as f:
+                f.write(src.replace('grammar Modelica;', 'grammar Modelica;\nimport Other;', 1))
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts, incremental=loaded)
+            self.assertEqual(loaded.emitted, n_rules)
+
+    def test_inputs(self):
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        expected = etree.tostring(antlr2xsd.g4_parser.parse(g4_path, listener_opts))
+        with open(g4_path, 'rb') as f:
+            data = f.read()
+        self.assertEqual(etree.tostring(
+            antlr2xsd.g4_parser.parse_file(g4_path, listener_opts, mmap=True)), expected)
+        self.assertEqual(etree.tostring(
+            antlr2xsd.g4_parser.parse_bytes(data, listener_opts)), expected)
+        self.assertEqual(etree.tostring(
+            antlr2xsd.g4_parser.parse_string(data.decode('utf-8'), listener_opts)), expected)
+
+        # non-ascii input does not use the buffer as code points
+        text = data.decode('utf-8') + "\nMICRO : '\u00b5' ;\n"
+        expected = etree.tostring(antlr2xsd.g4_parser.parse_string(text, listener_opts))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Micro.g4')
+            with open(g4_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            xsd = antlr2xsd.g4_parser.parse_file(g4_path, listener_opts, mmap=True)
+        self.assertEqual(etree.tostring(xsd), expected)
+
+    def test_converter(self):
+        listener_opts = {
+            'root_name': 'root',
+            'root_type': 'r0',
+            'tns': 'http://www.example.com/Synthetic',
+        }
+        converter = antlr2xsd.g4_parser.Converter(listener_opts)
+        for seed in range(3):
+            text = antlr2xsd.synthetic.generate(20, seed=seed)
+            expected = etree.tostring(antlr2xsd.g4_parser.parse_string(text, listener_opts))
+            self.assertEqual(etree.tostring(converter.parse_string(text)), expected)
+        # the last grammar is not kept alive by the session
+        self.assertIsNone(converter.parser._input)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            converter = antlr2xsd.g4_parser.Converter(listener_opts, cache_dir=tmp_dir)
+            stats = antlr2xsd.stats.Stats()
+            converter.parse_string(text)
+            self.assertEqual(etree.tostring(converter.parse_string(text, stats=stats)), expected)
+            self.assertEqual(stats['cache_hits'], 1)
+
+    def test_normalize(self):
+        grammar = '\n'.join([
+            'grammar Normalize;',
+            "a : ( bbb ( ccc | ( ddd | eee ) ) ) 'xxx' ;",
+            "g : ( ( hhh ) ) ;",
+            ''])
+        listener_opts = {'tns': 'urn:normalize', 'root_name': 'root', 'root_type': 'a'}
+        expected = antlr2xsd.g4_parser.parse_string(grammar, listener_opts)
+        listener_opts['normalize'] = True
+        stats = antlr2xsd.stats.Stats()
+        xsd = antlr2xsd.g4_parser.parse_string(grammar, listener_opts, stats=stats)
+        self.assertEqual(
+            [child.get('name') for child in xsd[1][0]], ['bbb', 'ccc', 'ddd', 'eee', 'xxx'])
+        self.assertEqual([child.get('name') for child in xsd[2][0]], ['hhh'])
+        self.assertEqual(stats['normalized'], len(list(expected.iter())) - len(list(xsd.iter())))
+
+        # nodes removed on Modelica, the schema stays valid
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        n_nodes = len(list(antlr2xsd.g4_parser.parse(g4_path, MODELICA_OPTS).iter()))
+        stats = antlr2xsd.stats.Stats()
+        xsd = antlr2xsd.g4_parser.parse(g4_path, dict(MODELICA_OPTS, normalize=True), stats=stats)
+        self.assertGreater(stats['normalized'], 0)
+        self.assertEqual(len(list(xsd.iter())), n_nodes - stats['normalized'])
+        etree.XMLSchema(etree.fromstring(antlr2xsd.g4_parser.serialize(xsd)))
+
+    def test_prune(self):
+        grammar = '\n'.join([
+            'grammar Prune;',
+            "a : b 'aaa' # a1 | c # a2 ;",
+            "b : 'bbb' ;",
+            "c : 'ccc' ;",
+            "d : a e ;",
+            "e : 'eee' ;",
+            ''])
+        listener_opts = {'tns': 'urn:prune', 'root_name': 'root', 'root_type': 'a', 'prune': True}
+        stats = antlr2xsd.stats.Stats()
+        xsd = antlr2xsd.g4_parser.parse_string(grammar, listener_opts, stats=stats)
+        self.assertEqual(
+            [ctype.get('name') for ctype in xsd[1:]], ['a', 'a1', 'a2', 'b', 'c'])
+        self.assertEqual(stats['pruned'], 2)
+        self.assertEqual(stats['pruned_types'], ['d', 'e'])
+
+        # the cache holds all types, pruning happens on every hit
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            antlr2xsd.g4_parser.parse_string(grammar, listener_opts, cache_dir=tmp_dir)
+            listener_opts['root_type'] = 'd'
+            xsd = antlr2xsd.g4_parser.parse_string(grammar, listener_opts, cache_dir=tmp_dir)
+        self.assertEqual(len(xsd), 1 + 7)
+
+    def test_dedupe(self):
+        grammar = '\n'.join([
+            'grammar Dedupe;',
+            "s : a b leaf2 ;",
+            "a : 'xxx' leaf ;",
+            "b : 'xxx' leaf ;",
+            "leaf : 'zzz' ;",
+            "leaf2 : 'zzz' ;",
+            ''])
+        listener_opts = {
+            'tns': 'urn:dedupe', 'root_name': 'root', 'root_type': 's', 'dedupe': True}
+        stats = antlr2xsd.stats.Stats()
+        xsd = antlr2xsd.g4_parser.parse_string(grammar, listener_opts, stats=stats)
+        self.assertEqual([ctype.get('name') for ctype in xsd[1:]], ['s', 'a', 'leaf'])
+        self.assertEqual(
+            [(elem.get('name'), elem.get('type')) for elem in xsd[1].iter('{*}element')],
+            [('a', 'a'), ('b', 'a'), ('leaf2', 'leaf')])
+        self.assertEqual(stats['deduped'], 2)
+        self.assertEqual(stats['dedupe_ratio'], 2 / 5)
+
+        # recursive types merge too, the emitter names elements after their
+        # type so this takes a schema where element names and types differ
+        xsd = etree.fromstring('''
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:complexType name="a"><xs:choice>
+                <xs:element name="next" type="b"/>
+                <xs:element name="yyy" type="xs:string"/>
+              </xs:choice></xs:complexType>
+              <xs:complexType name="b"><xs:sequence>
+                <xs:element name="xxx" type="xs:string"/>
+                <xs:element name="next" type="a"/>
+              </xs:sequence></xs:complexType>
+              <xs:complexType name="c"><xs:choice>
+                <xs:element name="next" type="d"/>
+                <xs:element name="yyy" type="xs:string"/>
+              </xs:choice></xs:complexType>
+              <xs:complexType name="d"><xs:sequence>
+                <xs:element name="xxx" type="xs:string"/>
+                <xs:element name="next" type="c"/>
+              </xs:sequence></xs:complexType>
+              <xs:complexType name="e"><xs:sequence>
+                <xs:element name="xxx" type="xs:string"/>
+                <xs:element name="next" type="e"/>
+              </xs:sequence></xs:complexType>
+            </xs:schema>''')
+        self.assertEqual(antlr2xsd.passes.dedupe(xsd), {'c': 'a', 'd': 'b'})
+        self.assertEqual(
+            [elem.get('type') for elem in xsd.iter('{*}element')],
+            ['b', 'xs:string', 'xs:string', 'a', 'xs:string', 'e'])
+
+        # still a valid schema
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        listener_opts = dict(MODELICA_OPTS, dedupe=True)
+        xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        etree.XMLSchema(etree.fromstring(antlr2xsd.g4_parser.serialize(xsd)))
+
+    def test_groups(self):
+        grammar = '\n'.join([
+            'grammar Groups;',
+            "a : 'xxx' b c 'yyy' ;",
+            "b : 'xxx' b c 'zzz' ;",
+            "c : 'xxx' b c ;",
+            ''])
+        listener_opts = {
+            'tns': 'urn:groups', 'root_name': 'root', 'root_type': 'a', 'groups': True}
+        stats = antlr2xsd.stats.Stats()
+        xsd = antlr2xsd.g4_parser.parse_string(grammar, listener_opts, stats=stats)
+        self.assertEqual((stats['groups'], stats['group_refs']), (1, 3))
+        group = xsd[-1]
+        self.assertEqual(group.tag, '{http://www.w3.org/2001/XMLSchema}group')
+        self.assertEqual(
+            [elem.get('name') for elem in group.iter('{*}element')], ['xxx', 'b', 'c'])
+        self.assertEqual(
+            [[child.get('ref') or child.get('name') for child in ctype[0]] for ctype in xsd[1:4]],
+            [['group1', 'yyy'], ['group1', 'zzz'], ['group1']])
+        etree.XMLSchema(etree.fromstring(antlr2xsd.g4_parser.serialize(xsd)))
+
+        listener_opts['group_min_length'] = 4
+        stats = antlr2xsd.stats.Stats()
+        antlr2xsd.g4_parser.parse_string(grammar, listener_opts, stats=stats)
+        self.assertEqual(stats['groups'], 0)
+
+    def test_graph(self):
+        grammar = '\n'.join([
+            'grammar Graph;',
+            "s : a b ;",
+            "a : 'aaa' b # a1 | c # a2 ;",
+            "b : c 'bbb' ;",
+            "c : 'ccc' a | IDENT ;",
+            "d : d 'ddd' | 'eee' ;",
+            "IDENT : ('a'..'z')+ ;",
+            ''])
+        listener_opts = {'tns': 'urn:graph', 'root_name': 'root', 'root_type': 's'}
+        graph = antlr2xsd.graph.RuleGraph()
+        antlr2xsd.g4_parser.parse_string(grammar, listener_opts, graph=graph)
+        self.assertEqual(list(graph), ['s', 'a', 'b', 'c', 'd'])
+        self.assertEqual(graph.references('a'), ['b', 'c'])
+        self.assertEqual(graph.referenced_by('a'), ['s', 'c'])
+        self.assertEqual(graph.labels('a'), ['a1', 'a2'])
+        self.assertEqual(graph.terminals('c'), ['ccc', 'IDENT'])
+        self.assertEqual(graph.recursive_groups(), [['a', 'b', 'c'], ['d']])
+        self.assertFalse(graph.is_recursive('s'))
+        self.assertTrue(graph.is_recursive('d'))
+
+        treeless = antlr2xsd.graph.RuleGraph()
+        antlr2xsd.g4_parser.parse_string(grammar, listener_opts, tree=False, graph=treeless)
+        self.assertEqual(treeless.to_dict(), graph.to_dict())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            antlr2xsd.g4_parser.parse_string(grammar, listener_opts, cache_dir=tmp_dir)
+            cached = antlr2xsd.graph.RuleGraph()
+            antlr2xsd.g4_parser.parse_string(
+                grammar, listener_opts, cache_dir=tmp_dir, graph=cached)
+        self.assertEqual(cached.to_dict(), graph.to_dict())
+
+    def test_batch(self):
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        missing_path = os.path.join(TEST_DIR, 'g4', 'Missing.g4')
+        results = antlr2xsd.batch.convert_all(
+            [(g4_path, listener_opts), (missing_path, listener_opts)], max_workers=2)
+        self.assertEqual([r.g4_path for r in results], [g4_path, missing_path])
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[0].xsd, antlr2xsd.g4_parser.serialize(
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts)))
+        self.assertIsNone(results[1].xsd)
+        self.assertIn('FileNotFoundError', results[1].error)
+
+    def test_cli(self):
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Hello.g4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = os.path.join(tmp_dir, 'xsd')
+            prefix = os.path.join(tmp_dir, 'profile')
+            stats_path = os.path.join(tmp_dir, 'stats.json')
+            argv = [
+                '--tns', 'urn:hello', '--root-name', 'hello', '--root-type', 'r',
+                '--output-dir', output_dir, g4_path]
+            self.assertEqual(antlr2xsd.cli.main(
+                argv + ['--stats', stats_path, '--profile', prefix]), 0)
+            xsd_path = os.path.join(output_dir, 'Hello.xsd')
+            with open(xsd_path, 'rb') as f:
+                self.assertEqual(f.read(), antlr2xsd.g4_parser.serialize(antlr2xsd.g4_parser.parse(
+                    g4_path, {'tns': 'urn:hello', 'root_name': 'hello', 'root_type': 'r'})))
+            with open(stats_path, 'r') as f:
+                self.assertEqual(json.load(f)[g4_path]['rules'], 2)
+            self.assertTrue(os.path.exists(prefix + '.pstats'))
+            self.assertTrue(os.path.exists(prefix + '.folded'))
+
+            # an unchanged schema is not written again
+            os.utime(xsd_path, (0, 0))
+            self.assertEqual(antlr2xsd.cli.main(argv), 0)
+            self.assertEqual(os.stat(xsd_path).st_mtime, 0)
+
+            # usage error, not a traceback from the process pool
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+                antlr2xsd.cli.main(argv + ['--jobs', '-1'])
+            self.assertEqual(cm.exception.code, 2)
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        jobs = [{
+            'root_name': 'modelica',
+            'root_type': 'stored_definition',
+            'tns': 'http://www.pymoca.com/Pymoca{:d}'.format(i),
+        } for i in range(8)]
+
+        def convert(listener_opts):
+            return antlr2xsd.g4_parser.serialize(
+                antlr2xsd.g4_parser.parse(g4_path, listener_opts))
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(convert, jobs))
+        self.assertEqual(results, [convert(listener_opts) for listener_opts in jobs])
+
+    def test_aio(self):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        import antlr2xsd.aio
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        expected = antlr2xsd.g4_parser.serialize(
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts))
+
+        async def run(converter):
+            with open(g4_path, 'rb') as f:
+                data = f.read()
+            requests = [
+                asyncio.ensure_future(converter.convert_bytes(data, listener_opts))
+                for _ in range(3)]
+            await asyncio.sleep(0)
+            # identical requests share one conversion
+            self.assertEqual(len(converter.inflight), 1)
+            results = await asyncio.gather(*requests)
+            self.assertEqual(converter.inflight, {})
+            results.append(await converter.convert_file(g4_path, listener_opts))
+            with self.assertRaises(asyncio.TimeoutError):
+                await converter.convert_bytes(data + b'\n', listener_opts, timeout=1e-6)
+            return results
+
+        with ThreadPoolExecutor(2) as pool:
+            results = asyncio.run(run(antlr2xsd.aio.AsyncConverter(pool)))
+        self.assertEqual(results, [expected] * 4)
+
+    def test_write(self):
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        out = io.BytesIO()
+        antlr2xsd.g4_parser.write(g4_path, listener_opts, out)
+        xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        self.assertEqual(out.getvalue(), antlr2xsd.g4_parser.serialize(xsd))
+
+        # the passes convert first, the output is the same
+        listener_opts = dict(MODELICA_OPTS, normalize=True, groups=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            xsd_path = os.path.join(tmp_dir, 'Modelica.xsd')
+            antlr2xsd.g4_parser.write(g4_path, listener_opts, xsd_path)
+            with open(xsd_path, 'rb') as f:
+                self.assertEqual(f.read(), antlr2xsd.g4_parser.serialize(
+                    antlr2xsd.g4_parser.parse(g4_path, listener_opts)))
+
+    def test_prediction_mode(self):
+        listener_opts = MODELICA_OPTS
+        stats = {}
+        antlr2xsd.g4_parser.parse(
+            os.path.join(TEST_DIR, 'g4', 'Modelica.g4'), listener_opts, stats=stats)
+        self.assertEqual(stats['prediction_mode'], 'SLL')
+        self.assertEqual(stats['ll_fallbacks'], 0)
+
+        # syntax errors make SLL bail out, LL then reports and recovers
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Bad.g4')
+            with open(g4_path, 'w') as f:
+                f.write('grammar Bad;\nx : (;\n')
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts, stats=stats)
+        self.assertEqual(stats['prediction_mode'], 'LL')
+        self.assertEqual(stats['ll_fallbacks'], 1)
+
+    def test_stats(self):
+        import antlr2xsd.stats
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        stats = antlr2xsd.stats.Stats()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts, stats=stats)
+            antlr2xsd.g4_parser.serialize(xsd, stats=stats)
+        self.assertEqual(out.getvalue(), '')
+        for stage in ['lex', 'parse', 'walk', 'serialize']:
+            self.assertGreater(stats[stage + '_time'], 0)
+        self.assertGreater(stats['tree_nodes'], stats['tokens'])
+        self.assertGreater(stats['peak_memory'], 0)
+        self.assertEqual(
+            stats['complexType'], len(xsd.findall('{*}complexType')))
+        self.assertEqual(
+            stats['element'], len(list(xsd.iter('{*}element'))))
+        self.assertEqual(
+            stats['choice'], len(list(xsd.iter('{*}choice'))))
+        self.assertEqual(json.loads(stats.to_json()), stats)
+
+    def test_treeless(self):
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        stats = {}
+        xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts, tree=False, stats=stats)
+        expected = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        self.assertEqual(etree.tostring(xsd), etree.tostring(expected))
+        self.assertEqual(stats['rules'], 76)
+
+        # rules walked before SLL bails out are not walked again by LL
+        with open(g4_path, 'r') as f:
+            src = f.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Bad.g4')
+            with open(g4_path, 'w') as f:
+                f.write(src.replace('class_type:', 'class_type: ( ;', 1))
+            stats = {}
+            xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts, tree=False, stats=stats)
+            expected = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        self.assertEqual(stats['prediction_mode'], 'LL')
+        self.assertEqual(etree.tostring(xsd), etree.tostring(expected))
+
+    def test_streams(self):
+        import antlr4
+        import antlr2xsd.streams
+        from antlr2xsd.generated.ANTLRv4Lexer import ANTLRv4Lexer
+        with open(os.path.join(TEST_DIR, 'g4', 'Modelica.g4'), 'r') as f:
+            src = f.read()
+        for text in [src, src + "\nUNICODE : '\u00b5\u2202\U0001d49c' ;\n"]:
+            expected = antlr4.CommonTokenStream(ANTLRv4Lexer(antlr4.InputStream(text)))
+            expected.fill()
+            lexer = ANTLRv4Lexer(antlr2xsd.streams.CodePointStream(text))
+            lexer._factory = antlr2xsd.streams.SlimTokenFactory.DEFAULT
+            stream = antlr2xsd.streams.ArrayTokenStream(lexer)
+            stream.fill()
+            self.assertEqual(
+                [str(token) for token in stream.tokens],
+                [str(token) for token in expected.tokens])
+            self.assertIs(stream.tokens[-1], stream.tokens[len(stream.tokens) - 1])
+            self.assertEqual(
+                list(antlr2xsd.streams.CodePointStream(text).data), [ord(c) for c in text])
+
+    @unittest.skipUnless(sys.version_info >= (3, 11), 'parser recursion uses the C stack')
+    def test_deep_grammar(self):
+        listener_opts = {
+            'root_name': 'deep',
+            'root_type': 'r',
+            'tns': 'http://www.pymoca.com/Deep',
+        }
+        depth = 1000
+        limit = sys.getrecursionlimit()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Deep.g4')
+            with open(g4_path, 'w') as f:
+                f.write('grammar Deep;\nr : {:s}{:s};\n'.format('( a ' * depth, ')' * depth))
+            xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        self.assertEqual(len(xsd[1][0]), depth)
+        # the limit is only raised while parsing
+        self.assertEqual(sys.getrecursionlimit(), limit)
+
+    def test_deep_grammar_threads(self):
+        # concurrent parses share the process wide recursion limit
+        listener_opts = {
+            'root_name': 'deep',
+            'root_type': 'r',
+            'tns': 'http://www.pymoca.com/Deep',
+        }
+        depth = 1000
+        grammar = 'grammar Deep;\nr : {:s}{:s};\n'.format('( a ' * depth, ')' * depth)
+        limit = sys.getrecursionlimit()
+
+        def convert(_):
+            return len(antlr2xsd.g4_parser.parse_string(grammar, listener_opts)[1][0])
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            self.assertEqual(list(executor.map(convert, range(16))), [depth] * 16)
+        self.assertEqual(sys.getrecursionlimit(), limit)
+
+    def test_dfa_snapshot(self):
+        import antlr2xsd.dfa
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        xsd = antlr2xsd.g4_parser.parse(g4_path, listener_opts)
+        snapshot = antlr2xsd.dfa.dumps()
+
+        def n_states():
+            return sum(
+                len(dfa.states) for cls, _ in antlr2xsd.dfa.RECOGNIZERS
+                for dfa in cls.decisionsToDFA)
+
+        antlr2xsd.dfa.clear()
+        self.assertEqual(n_states(), 0)
+        self.assertTrue(antlr2xsd.dfa.loads(snapshot))
+        self.assertGreater(n_states(), 0)
+        self.assertEqual(
+            etree.tostring(antlr2xsd.g4_parser.parse(g4_path, listener_opts)),
+            etree.tostring(xsd))
+        # the preloaded DFA had everything the grammar needs
+        self.assertEqual(antlr2xsd.dfa.dumps(), snapshot)
+
+        # snapshots of another antlr4 runtime are rejected
+        with unittest.mock.patch('antlr2xsd.cache._runtime_version', return_value='0.0'):
+            other = antlr2xsd.dfa.dumps()
+        self.assertFalse(antlr2xsd.dfa.loads(other))
+
+        # corrupt and truncated snapshots are rejected too
+        self.assertFalse(antlr2xsd.dfa.loads(b'garbage'))
+        self.assertFalse(antlr2xsd.dfa.loads(snapshot[:len(snapshot) // 2]))
+        self.assertEqual(antlr2xsd.dfa.dumps(), snapshot)
+
+    def test_daemon(self):
+        import antlr2xsd.daemon
+        listener_opts = MODELICA_OPTS
+        g4_path = os.path.join(TEST_DIR, 'g4', 'Modelica.g4')
+        expected = antlr2xsd.g4_parser.serialize(
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, 'antlr2xsd.sock')
+            # no daemon, converts in process
+            self.assertEqual(antlr2xsd.daemon.convert(
+                listener_opts, g4_path, socket_path=socket_path), expected)
+
+            with antlr2xsd.daemon.Server(socket_path) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    self.assertTrue(antlr2xsd.daemon.is_running(socket_path))
+                    client = antlr2xsd.daemon.Client(socket_path)
+                    self.assertEqual(client.convert(listener_opts, g4_path), expected)
+                    # served from the memory cache
+                    self.assertEqual(client.convert(listener_opts, g4_path), expected)
+                    with self.assertRaises(RuntimeError):
+                        client.convert(listener_opts, os.path.join(tmp_dir, 'Missing.g4'))
+                    with open(g4_path, 'r') as f:
+                        grammar = f.read()
+                    self.assertEqual(client.convert(listener_opts, grammar=grammar), expected)
+
+                    # a client that never sends its request is dropped
+                    with unittest.mock.patch.object(antlr2xsd.daemon._Handler, 'timeout', 0.2):
+                        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+                            idle.connect(socket_path)
+                            client = antlr2xsd.daemon.Client(socket_path, timeout=10)
+                            self.assertEqual(client.convert(listener_opts, g4_path), expected)
+                finally:
+                    server.shutdown()
+                    thread.join()
+            self.assertFalse(os.path.exists(socket_path))
+            self.assertFalse(antlr2xsd.daemon.is_running(socket_path))
+
+            # the default socket is not in the world writable temp dir
+            env = {'ANTLR2XSD_SOCKET': '', 'XDG_RUNTIME_DIR': tmp_dir}
+            with unittest.mock.patch.dict(os.environ, env):
+                self.assertEqual(
+                    antlr2xsd.daemon.default_socket_path(),
+                    os.path.join(tmp_dir, 'antlr2xsd.sock'))
+                del os.environ['XDG_RUNTIME_DIR']
+                with unittest.mock.patch('tempfile.tempdir', tmp_dir):
+                    socket_path = antlr2xsd.daemon.default_socket_path(create=True)
+                    socket_dir = os.path.dirname(socket_path)
+                    self.assertEqual(os.stat(socket_dir).st_mode & 0o777, 0o700)
+                    os.chmod(socket_dir, 0o777)
+                    with self.assertRaises(PermissionError):
+                        antlr2xsd.daemon.default_socket_path()
+
+    def test_synthetic(self):
+        import antlr2xsd.stats
+        import antlr2xsd.synthetic
+        listener_opts = {
+            'root_name': 'synthetic',
+            'root_type': 'r0',
+            'tns': 'http://www.pymoca.com/Synthetic',
+        }
+        src = antlr2xsd.synthetic.generate(200, labeled_ratio=0.5, depth=3, seed=1)
+        self.assertEqual(src, antlr2xsd.synthetic.generate(
+            200, labeled_ratio=0.5, depth=3, seed=1))
+        self.assertNotEqual(src, antlr2xsd.synthetic.generate(
+            200, labeled_ratio=0.5, depth=3, seed=2))
+        stats = antlr2xsd.stats.Stats()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            g4_path = os.path.join(tmp_dir, 'Synthetic200.g4')
+            with open(g4_path, 'w') as f:
+                f.write(src)
+            antlr2xsd.g4_parser.parse(g4_path, listener_opts, stats=stats)
+        # parses without syntax errors, one type per rule and labeled alternative
+        self.assertEqual(stats['prediction_mode'], 'SLL')
+        self.assertEqual(stats['rules'], 200)
+        self.assertEqual(stats['complexType'], 200 + src.count(' # r'))
+
+
+def loglog_slope(sizes, values) -> float:
+    """
+    Least squares slope of log(values) over log(sizes), 1 for linear growth
+    """
+    xs = [math.log(x) for x in sizes]
+    ys = [math.log(y) for y in values]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum(
+        (x - x_mean)**2 for x in xs)
+
+
+@unittest.skipUnless(
+    os.environ.get('ANTLR2XSD_SCALING'), 'set ANTLR2XSD_SCALING=1 to run the scaling tests')
+class TestScaling(unittest.TestCase):
+    """
+    Convert synthetic grammars of geometrically growing size and fail if
+    time or memory grows faster than near linear
+    """
+
+    sizes = [250, 500, 1000, 2000, 4000]
+    tolerance = 0.2
+
+    listener_opts = {
+        'root_name': 'synthetic',
+        'root_type': 'r0',
+        'tns': 'http://www.pymoca.com/Synthetic',
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        import antlr2xsd.synthetic
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.g4_paths = []
+        for n_rules in cls.sizes:
+            g4_path = os.path.join(cls.tmp_dir.name, 'Synthetic{:d}.g4'.format(n_rules))
+            with open(g4_path, 'w') as f:
+                f.write(antlr2xsd.synthetic.generate(n_rules))
+            cls.g4_paths.append(g4_path)
+        # learn the prediction DFA, so it does not count for the small sizes
+        for g4_path in cls.g4_paths:
+            antlr2xsd.g4_parser.parse(g4_path, cls.listener_opts)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def assertNearLinear(self, values, what):
+        slope = loglog_slope(self.sizes, values)
+        self.assertLess(
+            slope, 1 + self.tolerance,
+            '{:s} grows as n^{:.2f}: {!r}'.format(what, slope, values))
+
+    def test_time(self):
+        times = []
+        for g4_path in self.g4_paths:
+            runs = []
+            for _ in range(2):
+                start = time.perf_counter()
+                antlr2xsd.g4_parser.serialize(
+                    antlr2xsd.g4_parser.parse(g4_path, self.listener_opts))
+                runs.append(time.perf_counter() - start)
+            times.append(min(runs))
+        self.assertNearLinear(times, 'time')
+
+    def test_memory(self):
+        peaks = []
+        for g4_path in self.g4_paths:
+            tracemalloc.start()
+            try:
+                antlr2xsd.g4_parser.serialize(
+                    antlr2xsd.g4_parser.parse(g4_path, self.listener_opts))
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        self.assertNearLinear(peaks, 'peak memory')